@@ -22,7 +22,17 @@ def main():
     load_dotenv()
     init_db()
 
-    cfg_path, skip_train = get_cli_args()
+    (
+        cfg_path,
+        skip_train,
+        workers,
+        save_downloads,
+        git_repo,
+        batch,
+        pack_apis,
+        ast_cache,
+        incremental,
+    ) = get_cli_args()
     cfg_dict = CoreEngine.utils.read_jsonfile_into_dict(cfg_path)
 
     cfg_obj = CoreEngine.repo_extractor.conf.Cfg(
@@ -41,18 +51,37 @@ def main():
     sub_labels = CoreEngine.utils.read_jsonfile_into_dict(
         cfg_obj.get_cfg_val("api_subdomain_label_listing")
     )
-    ai = CoreEngine.AICachedClassifier(api_labels, sub_labels, db)
+    ai = CoreEngine.AICachedClassifier(
+        api_labels, sub_labels, db, api_pack_size=pack_apis
+    )
+
+    # one analyzer for all PRs, so files seen in a PR are re-parsed incrementally later
+    analyzer = CoreEngine.incremental.IncrementalAnalyzer() if incremental else None
 
     print("Classifying APIs in files")
     for pr in prs:
         print(f"\tClassifying files from PR {pr} for predictions training ")
 
-        # Here is where ASTs and classification are done;
-        # all the "heavy lifting" of the core engine
-        CoreEngine.process_files(ai, db, pr, repo)
+        # Here is where ASTs are done; all the "heavy lifting" of the core engine.
+        # Classification is done once for all PRs below.
+        CoreEngine.process_files(
+            ai,
+            db,
+            pr,
+            repo,
+            workers=workers,
+            save_downloads=save_downloads,
+            git_repo=git_repo,
+            ast_cache=ast_cache,
+            incremental=analyzer,
+            classify=False,
+        )
 
         # CoreEngine.process_files(ai, db)  <-- Run this to process PRs from any repo!
 
+    # classify every new class and function found, once.
+    CoreEngine.classify_pending(ai, db, batch=batch)
+
     db.save()
 
     if skip_train:
@@ -347,13 +376,19 @@ def init_db():
     #      database_init.setup_caches()
 
 
-def get_cli_args() -> tuple[str, bool]:
+def get_cli_args() -> tuple[str, bool, int, bool, str | None, bool, int, str | None]:
     """
     Get initializing arguments from CLI.
 
     Returns:
         str: path to file with arguments to program
         bool: skip training flag
+        int: number of processes parsing files
+        bool: write downloaded files to disk flag
+        str | None: local clone to read files from, instead of GitHub
+        bool: classify through the OpenAI Batch API flag
+        int: class names per AI request
+        str | None: directory to keep parsed ASTs in
     """
     # establish positional argument capability
     arg_parser = argparse.ArgumentParser(
@@ -370,10 +405,61 @@ def get_cli_args() -> tuple[str, bool]:
         action="store_true",
         help="Skip training of model",
     )
+    arg_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes parsing files",
+    )
+    arg_parser.add_argument(
+        "--save-downloads",
+        action="store_true",
+        help="Write downloaded files to output/downloaded_files (for debugging)",
+    )
+    arg_parser.add_argument(
+        "--git-repo",
+        default=None,
+        help="Read files from this local clone or mirror instead of downloading them",
+    )
+    arg_parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Classify APIs through the OpenAI Batch API (cheaper, can take hours)",
+    )
+    arg_parser.add_argument(
+        "--pack-apis",
+        type=int,
+        default=1,
+        help="Class names classified per AI request (the label list is sent once for all)",
+    )
+    arg_parser.add_argument(
+        "--ast-cache",
+        default=None,
+        help="Keep parsed ASTs in this directory. Files already in it are not downloaded again",
+    )
+    arg_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Re-parse new versions of files from the previous version seen (needs --workers 1)",
+    )
 
     args = arg_parser.parse_args()
 
-    return args.extractor_cfg_file, args.s
+    if args.incremental and args.workers > 1:
+        arg_parser.error("--incremental can't be used with --workers > 1")
+
+    return (
+        args.extractor_cfg_file,
+        args.s,
+        args.workers,
+        args.save_downloads,
+        args.git_repo,
+        args.batch,
+        args.pack_apis,
+        args.ast_cache,
+        args.incremental,
+    )
 
 
 def get_all_data(db: CoreEngine.DatabaseManager) -> pd.DataFrame:
@@ -18,7 +18,7 @@ from .external import External_Model_Interface
 from .issue_class import Issue
 from . import repo_extractor
 from .repo_extractor import utils
-from .processing import process_files
+from .processing import process_files, classify_pending
 from .classifier import git_helper_get_open_issues
 from .classifier import git_helper_get_issues
 from .repo_extractor import conf
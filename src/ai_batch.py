@@ -0,0 +1,214 @@
+"""
+ai_batch.py
+
+Classifies every pending class and function through the OpenAI Batch API.
+
+Nothing in the training run is latency sensitive, and batches cost half as
+much as regular requests. BatchClassifier writes the prompts of
+AIClassifier.api_prompt() / function_prompt() to JSONL files, submits them,
+polls until they are done, and stores the results in bulk (api_cache,
+function_cache and, on save, the ai_result_backup.db mirror).
+
+Submitted batches are recorded in the ai_batches table before waiting on
+them, so a run that dies mid-batch collects them on the next start instead of
+paying for them twice. Anything a batch failed to classify is still pending
+afterwards and is sent again by the next run.
+"""
+
+import datetime
+import json
+import os
+import time
+
+from .ai_taxonomy import AICachedClassifier
+from .database_manager import DatabaseManager
+
+# Batch API limits: requests per batch, and size of the input file.
+MAX_REQUESTS = 50000
+MAX_BYTES = 190 * 1024 * 1024
+
+# The batch is done, with or without results
+FINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+class BatchClassifier:
+    """Bulk classification through the OpenAI Batch API."""
+
+    def __init__(
+        self,
+        ai: AICachedClassifier,
+        db: DatabaseManager,
+        folder: str = "./output/batches",
+        poll_seconds: float = 60.0,
+    ):
+        """Set up batch classification.
+
+        Args:
+            ai (AICachedClassifier): AI Classifier Engine. Its prompts, model and client are used.
+            db (DatabaseManager): Database Engine
+            folder (str, optional): where to write the batch input files. Defaults to "./output/batches".
+            poll_seconds (float, optional): time between status checks. Defaults to 60.0.
+        """
+        self.ai = ai
+        self.db = db
+        self.client = ai.client
+        self.model = ai.scheduler.model
+        self.folder = folder
+        self.poll_seconds = poll_seconds
+
+    def run(self):
+        """Classify all pending classes, then all pending functions (they need the class domains)."""
+        self.__collect("API")
+        classes, _ = self.db.get_unclassified_apis()
+        self.__submit("API", [(api,) for api in classes])
+        self.__collect("API")
+
+        self.__collect("FUNC")
+        _, functions = self.db.get_unclassified_apis()
+        self.__submit(
+            "FUNC",
+            [
+                (class_name, function_name)
+                for class_name, function_name in functions
+                # the class may have failed in its batch. It is retried next run.
+                if self.db.cache_classify_API(class_name) is not None
+            ],
+        )
+        self.__collect("FUNC")
+
+    def __prompt(self, kind: str, item: tuple) -> str | None:
+        if kind == "API":
+            return self.ai.api_prompt(item[0])
+        class_name, function_name = item
+        prompt, _ = self.ai.function_prompt(
+            class_name, function_name, self.db.cache_classify_API(class_name)
+        )
+        return prompt
+
+    def __submit(self, kind: str, items: list[tuple]):
+        """Write the prompts of items to JSONL files and submit one batch per file."""
+        if not items:
+            return
+        os.makedirs(self.folder, exist_ok=True)
+
+        no_prompt = []
+        files = []
+        lines = []
+        size = 0
+        for item in items:
+            prompt = self.__prompt(kind, item)
+            if prompt is None:
+                no_prompt.append(item)
+                continue
+            line = (
+                json.dumps(
+                    {
+                        # classname, or classname::function like classify_class_and_function()
+                        "custom_id": "::".join(item),
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {
+                            "model": self.model,
+                            "messages": [{"role": "user", "content": prompt}],
+                        },
+                    }
+                )
+                + "\n"
+            )
+            if lines and (len(lines) == MAX_REQUESTS or size + len(line) > MAX_BYTES):
+                files.append(lines)
+                lines = []
+                size = 0
+            lines.append(line)
+            size += len(line)
+        if lines:
+            files.append(lines)
+
+        if no_prompt:
+            # the domain has no sub-domains, same answer classify_function() gives
+            self.ai.classify_functions(
+                [
+                    (class_name, function_name, self.db.cache_classify_API(class_name))
+                    for class_name, function_name in no_prompt
+                ]
+            )
+            self.db.save()
+
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        for num, lines in enumerate(files):
+            input_file = os.path.join(
+                self.folder, f"{kind.lower()}-{stamp}-{num}.jsonl"
+            )
+            with open(input_file, "w", encoding="utf-8") as file:
+                file.writelines(lines)
+            with open(input_file, "rb") as file:
+                uploaded = self.client.files.create(file=file, purpose="batch")
+            batch = self.client.batches.create(
+                input_file_id=uploaded.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            self.db.store_batch(batch.id, kind, input_file)
+            print(f"\tSubmitted batch {batch.id}: {len(lines)} {kind} prompts")
+
+    def __collect(self, kind: str):
+        """Wait for the open batches of a kind and store their results."""
+        for batch_id in self.db.get_open_batches(kind):
+            batch = self.client.batches.retrieve(batch_id)
+            while batch.status not in FINAL_STATUSES:
+                time.sleep(self.poll_seconds)
+                batch = self.client.batches.retrieve(batch_id)
+
+            stored = 0
+            # expired and cancelled batches still have the results that were done
+            if batch.output_file_id is not None:
+                output = self.client.files.content(batch.output_file_id).text
+                stored = self.__store(kind, output)
+            print(f"\tBatch {batch_id} {batch.status}: {stored} {kind} classified")
+
+            self.db.finish_batch(batch_id, batch.status)
+            self.db.save()
+
+    def __store(self, kind: str, output: str) -> int:
+        """Store the results of a batch output file. Returns the number of new classifications."""
+        rows = []
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            response = result.get("response")
+            if result.get("error") is not None or response is None:
+                continue
+            if response["status_code"] != 200:
+                continue
+            content = response["body"]["choices"][0]["message"]["content"]
+            item = result["custom_id"]
+
+            # logged like classify_API() / classify_function()
+            if kind == "API":
+                prompt = self.ai.api_prompt(item)
+                classification = self.ai.api_result(
+                    item, content, self.ai.tokenizer.encode(prompt)
+                )
+                rows.append((item, classification[0], *classification[3:]))
+            else:
+                class_name, function_name = item.split("::", 1)
+                api_domain = self.db.cache_classify_API(class_name)
+                prompt, sub_domain_selection = self.ai.function_prompt(
+                    class_name, function_name, api_domain
+                )
+                classification = self.ai.function_result(
+                    class_name,
+                    function_name,
+                    api_domain,
+                    content,
+                    self.ai.tokenizer.encode(prompt),
+                    sub_domain_selection,
+                )
+                rows.append(
+                    (class_name, function_name, classification[0], *classification[3:])
+                )
+
+        if kind == "API":
+            return self.db.store_class_classifications(rows)
+        return self.db.store_function_classifications(rows)
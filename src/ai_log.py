@@ -0,0 +1,191 @@
+"""
+ai_log.py
+
+Log of AI calls (output/ai_log.csv) written by a background thread.
+
+Classifications put whole records on a queue and go on; one writer thread per
+log file keeps the file open, writes each record as one CSV row (or JSON line
+for a .jsonl file) and flushes when the queue is empty, so
+`tail -f output/ai_log.csv` still shows calls as they finish. Records from
+threads or asyncio callbacks never interleave. The file is rotated by size
+(ai_log.csv.1, ai_log.csv.2, ...).
+
+A record that can't be written (disk full, no permission...) is reported on
+stderr and dropped. The writer reopens the file for the next one.
+"""
+
+import atexit
+import csv
+import json
+import os
+import queue
+import sys
+import threading
+
+# queued to stop the writer thread
+STOP = object()
+
+
+class AILogWriter:
+    """Queue and background writer of one log file."""
+
+    def __init__(self, path: str, max_bytes: int = 10 * 1024 * 1024, backups: int = 5):
+        """Set up log. The file and thread are opened on the first record.
+
+        Args:
+            path (str): log file. Records are JSON lines if it ends with .jsonl, CSV rows otherwise.
+            max_bytes (int, optional): size at which the file is rotated. Defaults to 10 MB.
+            backups (int, optional): rotated files kept. Defaults to 5.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.jsonl = path.endswith(".jsonl")
+
+        self.queue = queue.SimpleQueue()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def write(self, *fields):
+        """Queue one record. Does not wait for the file.
+
+        Args:
+            *fields: values of the record, in column order
+        """
+        if self.thread is None:
+            with self.lock:
+                if self.thread is None:
+                    self.thread = threading.Thread(
+                        target=self.__run, name="ai-log", daemon=True
+                    )
+                    self.thread.start()
+                    atexit.register(self.close)
+        self.queue.put(fields)
+
+    def close(self):
+        """Write the queued records and stop the writer thread."""
+        with self.lock:
+            thread = self.thread
+            self.thread = None
+        if thread is not None:
+            self.queue.put(STOP)
+            thread.join()
+
+    def __open(self):
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        return open(self.path, "a", newline="", encoding="utf-8")
+
+    def __rotate(self, file):
+        file.close()
+        for num in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{num}"):
+                os.replace(f"{self.path}.{num}", f"{self.path}.{num + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        return self.__open()
+
+    def __run(self):
+        file = None
+        writer = None
+        size = 0
+        unflushed = 0  # records in the file buffer
+        failing = False  # an error was reported, and nothing flushed since
+        dropped = 0  # records lost since then
+        stop = False
+        while not stop:
+            record = self.queue.get()
+            # write everything queued, then flush once
+            while True:
+                if record is STOP:
+                    stop = True
+                    break
+                try:
+                    if file is None:
+                        file = self.__open()
+                        writer = csv.writer(file, lineterminator="\n")
+                        size = file.tell()
+                    if self.jsonl:
+                        size += file.write(json.dumps(record, default=str) + "\n")
+                    else:
+                        size += writer.writerow(record)
+                    record = None
+                    unflushed += 1
+                    if self.max_bytes and size >= self.max_bytes:
+                        rotated, file = file, None
+                        file = self.__rotate(rotated)
+                        writer = csv.writer(file, lineterminator="\n")
+                        size = 0
+                        unflushed = 0
+                except Exception as e:
+                    # keep going, the next record may work (space freed, file back...)
+                    if not failing:
+                        print(f"AI log {self.path}: {e!r}", file=sys.stderr)
+                        failing = True
+                    if record is not None:
+                        dropped += 1  # not written
+                    if not self.__close(file):
+                        dropped += unflushed
+                    file = None
+                    unflushed = 0
+                try:
+                    record = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if file is None:
+                continue
+            try:
+                file.flush()
+            except Exception as e:
+                if not failing:
+                    print(f"AI log {self.path}: {e!r}", file=sys.stderr)
+                    failing = True
+                dropped += unflushed
+                self.__close(file)
+                file = None
+            else:
+                if failing:
+                    print(
+                        f"AI log {self.path}: writing again, {dropped} records lost",
+                        file=sys.stderr,
+                    )
+                    failing = False
+                    dropped = 0
+            unflushed = 0
+        self.__close(file)
+
+    def __close(self, file) -> bool:
+        """Close a file, if any. False if it could not write what it had buffered."""
+        if file is None:
+            return True
+        try:
+            file.close()
+        except Exception:
+            return False
+        return True
+
+
+# path -> AILogWriter. Classifiers logging to the same file share its writer.
+__writers = {}
+__writers_lock = threading.Lock()
+
+
+def get_log_writer(path: str) -> AILogWriter:
+    """Writer of a log file, shared by everything logging to it.
+
+    Args:
+        path (str): log file
+
+    Returns:
+        AILogWriter: writer
+    """
+    key = os.path.abspath(path)
+    with __writers_lock:
+        writer = __writers.get(key)
+        if writer is None:
+            writer = AILogWriter(path)
+            __writers[key] = writer
+        return writer
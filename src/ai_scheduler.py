@@ -0,0 +1,254 @@
+"""
+ai_scheduler.py
+
+Sends many chat completion requests at once without going over the OpenAI
+rate limits.
+
+RequestScheduler runs the requests on an AsyncOpenAI client. Two token
+buckets keep it under the requests-per-minute and tokens-per-minute limits
+(prompt tokens are counted with tiktoken), a semaphore bounds how many
+requests are open at the same time, and failed requests are retried with
+jittered exponential backoff. Responses come back in the order of the prompts,
+whatever order they finish in.
+
+The client honors OPENAI_BASE_URL (or base_url), so the scheduler can be
+pointed at a local stub server.
+"""
+
+import asyncio
+import datetime
+import os
+import random
+import time
+from typing import Callable, Optional
+
+import openai
+from openai import AsyncOpenAI
+
+# Errors worth trying again. Anything else (bad request, auth...) fails right away.
+RETRY_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,  # includes APITimeoutError
+    openai.InternalServerError,
+)
+
+
+class TokenBucket:
+    """Token bucket that refills continuously up to a per-minute capacity."""
+
+    def __init__(self, per_minute: int, clock: Callable[[], float] = time.monotonic):
+        """Start with a full bucket.
+
+        Args:
+            per_minute (int): capacity, and how much is refilled in a minute
+            clock (Callable[[], float], optional): time source in seconds. Defaults to time.monotonic.
+        """
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.clock = clock
+        self.tokens = float(per_minute)
+        self.updated = clock()
+        self.lock = None
+
+    def __refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def take(self, amount: int):
+        """Wait until the bucket has `amount` and take it. Callers are served first come, first served.
+
+        More than the capacity can be taken from a full bucket, it then goes negative.
+
+        Args:
+            amount (int): tokens to take
+        """
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        async with self.lock:
+            self.__refill()
+            needed = min(amount, self.capacity)
+            if self.tokens < needed:
+                await asyncio.sleep((needed - self.tokens) / self.rate)
+                self.__refill()
+            self.tokens -= amount
+
+    def adjust(self, amount: int):
+        """Give back (positive) or take (negative) tokens once the real cost is known.
+
+        Args:
+            amount (int): tokens
+        """
+        self.__refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class RequestScheduler:
+    """Runs chat completions concurrently, within rate limits, in order."""
+
+    def __init__(
+        self,
+        tokenizer,
+        model: str = "gpt-4o-mini",
+        requests_per_minute: int = 500,
+        tokens_per_minute: int = 200000,
+        max_concurrency: int = 16,
+        retries: int = 6,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        response_tokens: int = 64,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+    ):
+        """Set up scheduler. Limits default to the gpt-4o-mini tier 1 limits.
+
+        Args:
+            tokenizer (tiktoken.Encoding): counts prompt tokens
+            model (str, optional): chat model. Defaults to "gpt-4o-mini".
+            requests_per_minute (int, optional): request limit. Defaults to 500.
+            tokens_per_minute (int, optional): token limit, prompt and response. Defaults to 200000.
+            max_concurrency (int, optional): requests open at the same time. Defaults to 16.
+            retries (int, optional): retries of a failed request. Defaults to 6.
+            backoff (float, optional): base of the exponential backoff, in seconds. Defaults to 1.0.
+            max_backoff (float, optional): longest wait between retries. Defaults to 60.0.
+            response_tokens (int, optional): expected response length, reserved until the
+                real usage is known. Defaults to 64.
+            api_key (Optional[str], optional): Defaults to OPENAI_API_KEY.
+            base_url (Optional[str], optional): Defaults to OPENAI_BASE_URL or the OpenAI API.
+        """
+        self.tokenizer = tokenizer
+        self.model = model
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.response_tokens = response_tokens
+        self.api_key = api_key if api_key is not None else os.getenv("OPENAI_API_KEY")
+        self.base_url = base_url
+
+    def __delay(self, attempt: int, error: Exception) -> float:
+        # the server knows best when to come back
+        response = getattr(error, "response", None)
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            if retry_after is not None:
+                try:
+                    return min(float(retry_after), self.max_backoff)
+                except ValueError:
+                    pass
+        # "full jitter": spread the retries of requests that failed together
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+    async def __complete(
+        self,
+        client: AsyncOpenAI,
+        prompt: str,
+        prompt_tokens: int,
+        requests: TokenBucket,
+        tokens: TokenBucket,
+        open_requests: asyncio.Semaphore,
+    ) -> tuple[str, datetime.datetime]:
+        reserved = prompt_tokens + self.response_tokens
+        attempt = 0
+        started = None  # first attempt
+        while True:
+            await requests.take(1)
+            await tokens.take(reserved)
+            if started is None:
+                started = datetime.datetime.now()
+            try:
+                async with open_requests:
+                    completion = await client.chat.completions.create(
+                        model=self.model,
+                        messages=[{"role": "user", "content": prompt}],
+                    )
+            except RETRY_ERRORS as error:
+                if attempt >= self.retries:
+                    raise
+                await asyncio.sleep(self.__delay(attempt, error))
+                attempt += 1
+                continue
+
+            if completion.usage is not None:
+                tokens.adjust(reserved - completion.usage.total_tokens)
+            return completion.choices[0].message.content, started
+
+    async def run_async(
+        self,
+        prompts: list[str],
+        callback: Optional[Callable[[int, str, datetime.datetime], None]] = None,
+        prompt_tokens: Optional[list[int]] = None,
+    ) -> list[str]:
+        """Get the responses to many prompts.
+
+        Args:
+            prompts (list[str]): prompts
+            callback (Optional[Callable[[int, str, datetime.datetime], None]], optional): called
+                with the index of the prompt, the response and the time the request was first
+                sent, as each response comes in.
+            prompt_tokens (Optional[list[int]], optional): number of tokens of each prompt,
+                if already known.
+
+        Raises:
+            openai.OpenAIError: a request failed, after retries. The other requests are finished
+                (and given to callback) first.
+
+        Returns:
+            list[str]: responses, in the order of prompts
+        """
+        if prompt_tokens is None:
+            prompt_tokens = [len(self.tokenizer.encode(prompt)) for prompt in prompts]
+
+        requests = TokenBucket(self.requests_per_minute)
+        tokens = TokenBucket(self.tokens_per_minute)
+        open_requests = asyncio.Semaphore(self.max_concurrency)
+
+        async def request(num: int) -> str:
+            response, started = await self.__complete(
+                client,
+                prompts[num],
+                prompt_tokens[num],
+                requests,
+                tokens,
+                open_requests,
+            )
+            if callback is not None:
+                callback(num, response, started)
+            return response
+
+        # the scheduler does the retrying
+        async with AsyncOpenAI(
+            api_key=self.api_key, base_url=self.base_url, max_retries=0
+        ) as client:
+            responses = await asyncio.gather(
+                *(request(num) for num in range(len(prompts))),
+                return_exceptions=True,
+            )
+
+        for response in responses:
+            if isinstance(response, BaseException):
+                raise response
+        return responses
+
+    def run(
+        self,
+        prompts: list[str],
+        callback: Optional[Callable[[int, str, datetime.datetime], None]] = None,
+        prompt_tokens: Optional[list[int]] = None,
+    ) -> list[str]:
+        """Same as run_async(), from synchronous code.
+
+        Args:
+            prompts (list[str]): prompts
+            callback (Optional[Callable[[int, str, datetime.datetime], None]], optional): called
+                with the index of the prompt, the response and the time the request was first
+                sent, as each response comes in.
+            prompt_tokens (Optional[list[int]], optional): number of tokens of each prompt,
+                if already known.
+
+        Returns:
+            list[str]: responses, in the order of prompts
+        """
+        return asyncio.run(self.run_async(prompts, callback, prompt_tokens))
@@ -8,7 +8,9 @@
 # in this main file i included variable to show one text example if someone wanted to run the main
 
 
+from collections import Counter
 import datetime
+import importlib.metadata
 import json
 import lzma
 from openai import OpenAI
@@ -17,10 +19,14 @@ import os
 import random
 import tiktoken  # pip install tiktoken
 import lzma
+import numpy as np
 import pickle
-import spacy
+from typing import Callable, Optional
 
+from .ai_log import get_log_writer
+from .ai_scheduler import RequestScheduler
 from .database_manager import DatabaseManager
+from .label_index import LabelFixCache, LabelVectors
 
 # Do True to use fake domains (animals and animal-feed)
 # Do False to use actual AI
@@ -34,7 +40,135 @@ USE_DEBUG_VALUES = False
 # `tail -n 100 -f output/ai_log.csv`
 
 load_dotenv()
-nlp = spacy.load("en_core_web_md")
+
+# spaCy model of the label similarity fallback (clean_domains / clean_subdomains).
+# Only its word vectors are used, so none of the pipeline components are loaded.
+SPACY_MODEL = "en_core_web_md"
+SPACY_EXCLUDE = [
+    "tok2vec",
+    "tagger",
+    "parser",
+    "attribute_ruler",
+    "lemmatizer",
+    "ner",
+    "senter",
+]
+
+nlp = None  # loaded by load_nlp(), on the first fuzzy match
+
+
+def load_nlp():
+    """Load the spaCy model, the first time only. Importing this file does not load it.
+
+    Returns:
+        spacy.Language: tokenizer and word vectors of SPACY_MODEL
+    """
+    global nlp
+    if nlp is None:
+        import spacy
+
+        nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDE)
+    return nlp
+
+
+def __spacy_model_version() -> str:
+    """SPACY_MODEL and its installed version, read without loading the model"""
+    try:
+        return f"{SPACY_MODEL}-{importlib.metadata.version(SPACY_MODEL)}"
+    except importlib.metadata.PackageNotFoundError:
+        return SPACY_MODEL
+
+
+def __spacy_vectors(texts: list[str]) -> np.ndarray:
+    """Document vectors (mean of the word vectors), as used by Doc.similarity()"""
+    model = load_nlp()
+    return np.array([doc.vector for doc in model.pipe(texts)], dtype=np.float32)
+
+
+# label vectors are computed once, and kept with the other generated files.
+# Replace with set_similarity_backend().
+# Stored vectors (and fixed labels) of another model version are not reused.
+label_vectors = LabelVectors(
+    "./output/label_vectors.npz", __spacy_vectors, __spacy_model_version()
+)
+
+
+def set_similarity_backend(
+    vectorize: Callable[[list[str]], np.ndarray],
+    model: str,
+    path: str = "./output/label_vectors.npz",
+):
+    """Use other text vectors than spaCy's for clean_domains() and clean_subdomains().
+
+    Args:
+        vectorize (Callable[[list[str]], np.ndarray]): texts -> one vector per row
+        model (str): name of the vectors. Stored label vectors of other models are not reused.
+        path (str, optional): where to keep label vectors. Defaults to "./output/label_vectors.npz".
+    """
+    global label_vectors
+    label_vectors = LabelVectors(path, vectorize, model)
+
+
+# how clean_domains() / clean_subdomains() found each label. See label_match_rates().
+label_matches = Counter()
+
+# answers fixed before, with their label. Hits are not in label_matches, see label_fixes.stats().
+# Keyed by the label alone when a name tier found it, by "label: description" when spaCy did.
+label_fixes = LabelFixCache("./output/ai_result_backup.db")
+
+
+def label_match_rates() -> dict[str, float]:
+    """Share of the labels found by each matching tier, since the start.
+
+    Returns:
+        dict[str, float]: exact, normalized, close and semantic -> fraction of all matches
+    """
+    total = sum(label_matches.values())
+    return {
+        tier: (label_matches[tier] / total if total else 0.0)
+        for tier in ("exact", "normalized", "close", "semantic")
+    }
+
+
+def __fix_label(
+    label_input: str, compare: str, labels: dict[str, str], lowercase: bool
+) -> str | None:
+    """Find the label an answer meant. Cheapest tier first, spaCy vectors last.
+
+    Args:
+        label_input (str): label the AI gave back
+        compare (str): "label: description" text of the answer
+        labels (dict[str, str]): correct labels and their descriptions
+        lowercase (bool): compare lowercased texts for similarity
+
+    Returns:
+        str | None: label. None if nothing is similar.
+    """
+    index = label_vectors.index(labels, lowercase)
+
+    # The name tiers only look at the label, whatever the description. If they can't find it,
+    # they never will for that label: a "label: description" entry is from the semantic tier.
+    found = label_fixes.get(label_input, index.fingerprint, compare)
+    if found is not None:
+        return found
+
+    answer = label_input
+    found = index.find_key(label_input)
+    if found is not None:
+        label_matches["normalized"] += 1
+    else:
+        found = index.find_close(label_input)
+        if found is not None:
+            label_matches["close"] += 1
+        else:
+            # most similar "label: description", see label_index
+            label_matches["semantic"] += 1
+            answer = compare
+            found = index.best(label_vectors.query(compare))
+
+    if found is not None:
+        label_fixes.put(answer, index.fingerprint, found)
+    return found
 
 
 def clean_domains(
@@ -60,6 +194,7 @@ def clean_domains(
         domains_available = domain_labels
 
     if domain_input in domains_available:
+        label_matches["exact"] += 1
         return domain_input
 
     print(f"API hallucinated value! It gave back: {domain_input}: {description}")
@@ -68,18 +203,7 @@ def clean_domains(
         description = ""
 
     compare = f"{domain_input.lower()}: {description.lower()}"
-    doc1_input = nlp(compare)
-
-    max_similarity = 0.0
-    max_record = None
-
-    for domain_label, desc_label in domains_available.items():
-        cmp_str = f"{domain_label.lower()}: {desc_label.lower()}"
-        doc2 = nlp(cmp_str)
-        sm = doc1_input.similarity(doc2)
-        if sm > max_similarity:
-            max_similarity = sm
-            max_record = domain_label
+    max_record = __fix_label(domain_input, compare, domains_available, True)
 
     return max_record
 
@@ -102,6 +226,7 @@ def clean_subdomains(
     # force domain_input to pick the closest domain_label.
 
     if subdomain_input in subdomains:
+        label_matches["exact"] += 1
         return subdomain_input
 
     print(f"API hallucinated value! It gave back: {subdomain_input}: {description}")
@@ -110,18 +235,7 @@ def clean_subdomains(
         description = ""
 
     compare = f"{subdomain_input}: {description}"
-    doc1_input = nlp(compare)
-
-    max_similarity = 0.0
-    max_record = None
-
-    for domain_label, desc_label in subdomains.items():
-        cmp_str = f"{domain_label}: {desc_label}"
-        doc2 = nlp(cmp_str)
-        sm = doc1_input.similarity(doc2)
-        if sm > max_similarity:
-            max_similarity = sm
-            max_record = domain_label
+    max_record = __fix_label(subdomain_input, compare, subdomains, False)
 
     print(f"Fixed to: {max_record}")
 
@@ -129,12 +243,22 @@ def clean_subdomains(
 
 
 class AIClassifier:
-    def __init__(self, api_domain_label_listing: dict, subdomain_label_listing: dict):
+    def __init__(
+        self,
+        api_domain_label_listing: dict,
+        subdomain_label_listing: dict,
+        scheduler: Optional[RequestScheduler] = None,
+        api_pack_size: int = 1,
+    ):
         """Setup OpenAI API key. Import label listings. API Domains and subdomains.
 
         Args:
             api_domain_label_listing (dict): From labels.json
             subdomain_label_listing (dict): From Merged_API_Sub_Domains_Descriptions.json
+            scheduler (Optional[RequestScheduler], optional): runs the requests of classify_APIs()
+                and classify_functions(). Defaults to the gpt-4o-mini limits.
+            api_pack_size (int, optional): classnames asked per request by classify_APIs().
+                Defaults to 1.
         """
 
         # csv
@@ -145,7 +269,12 @@ class AIClassifier:
         self.api_label_listing = api_domain_label_listing
         self.subdomain_label_listing = subdomain_label_listing
         self.LOG_FILE = LOG_FILE
+        self.log = get_log_writer(LOG_FILE)  # one row per call, see ai_log
         self.tokenizer = tiktoken.get_encoding("cl100k_base")
+        if scheduler is None:
+            scheduler = RequestScheduler(self.tokenizer)
+        self.scheduler = scheduler
+        self.api_pack_size = api_pack_size
 
     def parse_domain_description(self, text: str):
         """Extracts the domain and description from an OpenAI Query Response
@@ -172,22 +301,15 @@ class AIClassifier:
         # If no delimiter effectively splits the text, return the entire text as domain
         return text.strip(), "No description found"
 
-    def classify_API(self, api: str):
-        """Classifies a classname "API" into a domain.
+    def api_prompt(self, api: str) -> str:
+        """Question asked to classify a classname "API" into a domain.
 
         Args:
             api (str): The classname "api"
 
         Returns:
-            str: domain
-            str: description
-            str: complete AI response
+            str: prompt
         """
-
-        # LOG
-        with open(self.LOG_FILE, "a") as file:
-            file.write(f"{datetime.datetime.now()},API,{api}")
-
         # Storing and approving past classfications in a database. THis would take manual work at first but maybe we can add a functon to the program design where#
         # the user validates the AIs reponse such as upvoting it
 
@@ -199,13 +321,147 @@ class AIClassifier:
         )  # You might still want to convert it to ensure it's readable
 
         # Directly include the full question in the OpenAI API call
-        question = (
+        return (
             f"Please analyze the provided descriptions and the details of the imported API, then determine the most fitting domain from a list of 31 labels. "
             f"Return like this domain - description, only the name of the selected domain and a brief description of this domain. "
             f"API details: {api}. Context: {text}. Do not include any additional information or reasoning in your response."
         )
 
+    def api_result(
+        self,
+        api: str,
+        response: str,
+        context_tokens: list[int],
+        context_count: Optional[int] = None,
+        started: Optional[datetime.datetime] = None,
+    ) -> tuple:
+        """Turn the response to api_prompt() into a classification, and log it.
+
+        Args:
+            api (str): The classname "api"
+            response (str): Response from OpenAI
+            context_tokens (list[int]): tokens of the prompt
+            context_count (Optional[int], optional): prompt tokens spent on this classname, when
+                the prompt was shared (see packed_api_prompt()). Defaults to all of them.
+            started (Optional[datetime.datetime], optional): time of the request. Defaults to now.
+
+        Returns:
+            tuple: same as classify_API()
+        """
+        if context_count is None:
+            context_count = len(context_tokens)
         response_tokens = []
+        if not (USE_DEBUG_VALUES):
+            response_tokens = self.tokenizer.encode(response)
+
+        domain, description = self.parse_domain_description(response)
+
+        # Clean domain text.
+        # domains are the top level key in the subdomain file
+        domain = clean_domains(domain, description, self.api_label_listing)
+
+        self.log.write(
+            started or datetime.datetime.now(),
+            "API",
+            api,
+            domain,
+            context_count,
+            len(response_tokens),
+        )
+
+        context_pkl = pickle.dumps(context_tokens)
+        response_pkl = pickle.dumps(response_tokens)
+
+        context_raw = lzma.compress(context_pkl)
+        response_raw = lzma.compress(response_pkl)
+
+        return (
+            domain,
+            description,
+            response,
+            context_count,
+            len(response_tokens),
+            context_raw,
+            response_raw,
+        )
+
+    def packed_api_prompt(self, apis: list[str]) -> str:
+        """Question asked to classify several classnames into domains at once.
+
+        The label context is sent once for all of them.
+
+        Args:
+            apis (list[str]): The classnames
+
+        Returns:
+            str: prompt
+        """
+        text = json.dumps(self.api_label_listing["Items"], indent=2)
+        api_list = "\n".join(apis)
+
+        return (
+            f"Please analyze the provided descriptions and the details of each of the imported APIs below, then determine the most fitting domain for each of them from a list of 31 labels. "
+            f'Return only a JSON object with one entry per API: the API name as the key and, as the value, an object with "domain", the name of the selected domain, and "description", a brief description of this domain. '
+            f"APIs (one per line):\n{api_list}\nContext: {text}. Do not include any additional information or reasoning in your response."
+        )
+
+    def parse_packed_response(self, text: str, apis: list[str]) -> list[str | None]:
+        """Split the response to packed_api_prompt() into one response per classname.
+
+        Args:
+            text (str): Response from OpenAI
+            apis (list[str]): classnames of the prompt, in order
+
+        Returns:
+            list[str | None]: "domain - description" for each classname, None when it is missing
+                or malformed.
+        """
+        text = text.strip()
+        if text.startswith("```"):
+            # ```json ... ```
+            text = text.split("\n", 1)[-1].rsplit("```", 1)[0]
+        try:
+            parsed = json.loads(text)
+        except json.JSONDecodeError:
+            return [None] * len(apis)
+
+        if isinstance(parsed, list) and len(parsed) == len(apis):
+            entries = parsed
+        elif isinstance(parsed, dict):
+            entries = [parsed.get(api) for api in apis]
+        else:
+            return [None] * len(apis)
+
+        out = []
+        for entry in entries:
+            if isinstance(entry, dict) and isinstance(entry.get("domain"), str):
+                description = entry.get("description")
+                if not isinstance(description, str) or not description.strip():
+                    description = "No description found"
+                # same shape as the answer to a single prompt, for parse_domain_description()
+                domain = " ".join(entry["domain"].split())
+                out.append(f"{domain} - {' '.join(description.split())}")
+            else:
+                out.append(None)
+        return out
+
+    def classify_API(self, api: str):
+        """Classifies a classname "API" into a domain.
+
+        Args:
+            api (str): The classname "api"
+
+        Returns:
+            str: domain
+            str: description
+            str: complete AI response
+        """
+
+        # LOG: one record with the result, see api_result() / function_result()
+        started = datetime.datetime.now()
+
+        question = self.api_prompt(api)
+
         context_tokens = []
         response = None
         if not (USE_DEBUG_VALUES):
@@ -221,7 +477,6 @@ class AIClassifier:
             response = completion.choices[
                 0
             ].message.content  # Assuming this is the correct path based on your API response structure
-            response_tokens = self.tokenizer.encode(response)
         else:
             # use this for random testing so it does not cost anything!
             response = random.choice(
@@ -230,14 +485,169 @@ class AIClassifier:
             # Use "real" dummy data... instead of animals, use the actual label names
             response = random.choice(list(self.subdomain_label_listing.keys()))
 
-        domain, description = self.parse_domain_description(response)
+        return self.api_result(api, response, context_tokens, started=started)
 
-        # Clean domain text.
-        # domains are the top level key in the subdomain file
-        domain = clean_domains(domain, description, self.api_label_listing)
+    def classify_APIs(
+        self,
+        apis: list[str],
+        callback: Optional[Callable[[int, tuple], None]] = None,
+        pack_size: Optional[int] = None,
+    ) -> list[tuple]:
+        """Classify many classnames at once. Requests run concurrently, see self.scheduler.
+
+        With a pack size over 1, each request asks for several classnames (packed_api_prompt()).
+        Classnames missing from a packed response are asked again one by one.
+
+        Args:
+            apis (list[str]): classnames
+            callback (Optional[Callable[[int, tuple], None]], optional): called with the index of
+                the classname and its classification as each one is done.
+            pack_size (Optional[int], optional): classnames per request. Defaults to self.api_pack_size.
 
-        with open(self.LOG_FILE, "a") as file:
-            file.write(f",{domain},{len(context_tokens)},{len(response_tokens)}\n")
+        Returns:
+            list[tuple]: classify_API() of each classname, in order
+        """
+        if pack_size is None:
+            pack_size = self.api_pack_size
+        pack_size = max(pack_size, 1)
+        results = [None] * len(apis)
+
+        if USE_DEBUG_VALUES:
+            for num, api in enumerate(apis):
+                results[num] = AIClassifier.classify_API(self, api)
+                if callback is not None:
+                    callback(num, results[num])
+            return results
+
+        # indexes of the classnames of each request
+        packs = [
+            list(range(start, min(start + pack_size, len(apis))))
+            for start in range(0, len(apis), pack_size)
+        ]
+        if pack_size > 1:
+            questions = [
+                self.packed_api_prompt([apis[num] for num in pack]) for pack in packs
+            ]
+        else:
+            questions = [self.api_prompt(api) for api in apis]
+        context_tokens = [self.tokenizer.encode(question) for question in questions]
+
+        def done(index: int, response: str, started: datetime.datetime):
+            pack = packs[index]
+            if pack_size > 1:
+                responses = self.parse_packed_response(
+                    response, [apis[num] for num in pack]
+                )
+            else:
+                responses = [response]
+            # the prompt is shared, so are its tokens
+            share = -(-len(context_tokens[index]) // len(pack))
+
+            for num, response in zip(pack, responses):
+                if response is None:
+                    continue
+                results[num] = self.api_result(
+                    apis[num], response, context_tokens[index], share, started
+                )
+                if callback is not None:
+                    callback(num, results[num])
+
+        self.scheduler.run(questions, done, [len(x) for x in context_tokens])
+
+        missing = [num for num, result in enumerate(results) if result is None]
+        if missing:
+            print(f"Packed response incomplete. Asking {len(missing)} APIs one by one.")
+
+            def retried(index: int, result: tuple):
+                results[missing[index]] = result
+                if callback is not None:
+                    callback(missing[index], result)
+
+            AIClassifier.classify_APIs(
+                self, [apis[num] for num in missing], retried, pack_size=1
+            )
+        return results
+
+    def function_prompt(
+        self, api_name: str, function_name: str, api_domain: str
+    ) -> tuple[str | None, dict[str, str]]:
+        """Question asked to classify a function into a subdomain.
+
+        Args:
+            api_name (str): API name / Class name
+            function_name (str): Function name
+            api_domain (str): Domain of the API
+
+        Returns:
+            str | None: prompt, None if the domain has no sub-domains
+            dict[str, str]: sub-domains to choose from, with their descriptions
+        """
+        if not (api_domain in self.subdomain_label_listing):
+            return None, {}
+
+        sub_domains_descriptions = []
+        sub_domain_selection = {}
+        for item in self.subdomain_label_listing[api_domain]:
+            for sub_domain, description in item.items():
+                # print(f"  - {sub_domain}: {description}")
+                sub_domains_descriptions.append(f"{sub_domain}: {description}")
+                sub_domain_selection[sub_domain] = description
+
+        # Join all sub-domain descriptions into a single string for the query
+        sub_domains_descriptions_str = "\n".join(sub_domains_descriptions)
+
+        prompt_text = (
+            f"Analyze the following information about the API function '{function_name}' which is part of the '{api_name}' in the '{api_domain}' domain. "
+            f"Choose the most relevant classification from these available sub-domain options: \n{sub_domains_descriptions_str}. \n\n"
+            f"Please provide only the name of the most appropriate subdomain and the description of it, without any additional details or explanation."
+        )
+        return prompt_text, sub_domain_selection
+
+    def function_result(
+        self,
+        api_name: str,
+        function_name: str,
+        api_domain: str,
+        response: str,
+        context_tokens: list[int],
+        sub_domain_selection: dict[str, str],
+        started: Optional[datetime.datetime] = None,
+    ) -> tuple:
+        """Turn the response to function_prompt() into a classification, and log it.
+
+        Args:
+            api_name (str): API name / Class name
+            function_name (str): Function name
+            api_domain (str): Domain of the API
+            response (str): Response from OpenAI
+            context_tokens (list[int]): tokens of the prompt
+            sub_domain_selection (dict[str, str]): sub-domains from function_prompt()
+            started (Optional[datetime.datetime], optional): time of the request. Defaults to now.
+
+        Returns:
+            tuple: same as classify_function()
+        """
+        response_tokens = []
+        if not (USE_DEBUG_VALUES):
+            response_tokens = self.tokenizer.encode(response)
+
+        ##print(response)
+
+        sub_domain, description = self.parse_domain_description(response)
+
+        # CLEAN...
+        sub_domain = clean_subdomains(sub_domain, description, sub_domain_selection)
+
+        self.log.write(
+            started or datetime.datetime.now(),
+            "FUNC",
+            api_name,
+            function_name,
+            api_domain,
+            sub_domain,
+            len(context_tokens),
+            len(response_tokens),
+        )
 
         context_pkl = pickle.dumps(context_tokens)
         response_pkl = pickle.dumps(response_tokens)
@@ -246,7 +656,7 @@ class AIClassifier:
         response_raw = lzma.compress(response_pkl)
 
         return (
-            domain,
+            sub_domain,
             description,
             response,
             len(context_tokens),
@@ -255,6 +665,24 @@ class AIClassifier:
             response_raw,
         )
 
+    def __no_subdomain(
+        self,
+        api_name: str,
+        function_name: str,
+        api_domain: str,
+        started: Optional[datetime.datetime] = None,
+    ) -> tuple:
+        out = f"No sub-domain for function '{function_name}'."
+        self.log.write(
+            started or datetime.datetime.now(),
+            "FUNC",
+            api_name,
+            function_name,
+            api_domain,
+            out,
+        )
+        return out, None, None, -1, -1, None, None
+
     def classify_function(self, api_name: str, function_name: str, api_domain: str):
         """Classify a function into a subdomain, given classname and class domain.
 
@@ -268,39 +696,19 @@ class AIClassifier:
             str: description
             str: response
         """
-        # LOG
-        with open(self.LOG_FILE, "a") as file:
-            file.write(
-                f"{datetime.datetime.now()},FUNC,{api_name},{function_name},{api_domain}"
-            )
+        # LOG: one record with the result, see api_result() / function_result()
+        started = datetime.datetime.now()
+        logged_domain = api_domain
 
         if api_domain in ["cat", "dog", "bird", "rabbit", "hen", "pig", "cow"]:
             api_domain = random.choice(list(self.subdomain_label_listing.keys()))
 
-        if not (api_domain in self.subdomain_label_listing):
-            out = f"No sub-domain for function '{function_name}'."
-            with open(self.LOG_FILE, "a") as file:
-                file.write(f",{out}\n")
-            return out, None, None, -1, -1, None, None
-
-        sub_domains_descriptions = []
-        sub_domain_selection = []
-        for item in self.subdomain_label_listing[api_domain]:
-            for sub_domain, description in item.items():
-                # print(f"  - {sub_domain}: {description}")
-                sub_domains_descriptions.append(f"{sub_domain}: {description}")
-                sub_domain_selection.append(sub_domain)
-
-        # Join all sub-domain descriptions into a single string for the query
-        sub_domains_descriptions_str = "\n".join(sub_domains_descriptions)
-
-        prompt_text = (
-            f"Analyze the following information about the API function '{function_name}' which is part of the '{api_name}' in the '{api_domain}' domain. "
-            f"Choose the most relevant classification from these available sub-domain options: \n{sub_domains_descriptions_str}. \n\n"
-            f"Please provide only the name of the most appropriate subdomain and the description of it, without any additional details or explanation."
+        prompt_text, sub_domain_selection = self.function_prompt(
+            api_name, function_name, api_domain
         )
+        if prompt_text is None:
+            return self.__no_subdomain(api_name, function_name, logged_domain, started)
 
-        response_tokens = []
         context_tokens = []
         if not (USE_DEBUG_VALUES):
             # Query the OpenAI API
@@ -313,42 +721,79 @@ class AIClassifier:
             response = completion.choices[
                 0
             ].message.content  # Assuming this is the correct path based on your API response structure
-            response_tokens = self.tokenizer.encode(response)
         else:
             # use this for random testing so it does not cost anything!
             response = random.choice(
                 ["grain", "rice", "seed", "carrots", "straw", "grass", "wheat"]
             )
             # Use "real" dummy data... instead of animal food, use the actual label names
-            response = random.choice(sub_domain_selection)
-
-        ##print(response)
+            response = random.choice(list(sub_domain_selection))
 
-        sub_domain, description = self.parse_domain_description(response)
-
-        # CLEAN...
-        sub_domain = clean_subdomains(
-            sub_domain, description, sub_domain_selection, sub_domains_descriptions
+        return self.function_result(
+            api_name,
+            function_name,
+            logged_domain,
+            response,
+            context_tokens,
+            sub_domain_selection,
+            started,
         )
 
-        with open(self.LOG_FILE, "a") as file:
-            file.write(f",{sub_domain},{len(context_tokens)},{len(response_tokens)}\n")
+    def classify_functions(
+        self,
+        functions: list[tuple[str, str, str]],
+        callback: Optional[Callable[[int, tuple], None]] = None,
+    ) -> list[tuple]:
+        """Classify many functions at once. Requests run concurrently, see self.scheduler.
 
-        context_pkl = pickle.dumps(context_tokens)
-        response_pkl = pickle.dumps(response_tokens)
+        Args:
+            functions (list[tuple[str, str, str]]): (api name, function name, api domain)
+            callback (Optional[Callable[[int, tuple], None]], optional): called with the index of
+                the function and its classification as each one is done.
 
-        context_raw = lzma.compress(context_pkl)
-        response_raw = lzma.compress(response_pkl)
+        Returns:
+            list[tuple]: classify_function() of each function, in order
+        """
+        results = [None] * len(functions)
+
+        if USE_DEBUG_VALUES:
+            for num, function in enumerate(functions):
+                results[num] = AIClassifier.classify_function(self, *function)
+                if callback is not None:
+                    callback(num, results[num])
+            return results
+
+        asked = []
+        questions = []
+        selections = []
+        for num, (api_name, function_name, api_domain) in enumerate(functions):
+            prompt_text, sub_domain_selection = self.function_prompt(
+                api_name, function_name, api_domain
+            )
+            if prompt_text is None:
+                results[num] = self.__no_subdomain(api_name, function_name, api_domain)
+                if callback is not None:
+                    callback(num, results[num])
+                continue
+            asked.append(num)
+            questions.append(prompt_text)
+            selections.append(sub_domain_selection)
+        context_tokens = [self.tokenizer.encode(question) for question in questions]
+
+        def done(index: int, response: str, started: datetime.datetime):
+            num = asked[index]
+            results[num] = self.function_result(
+                *functions[num],
+                response,
+                context_tokens[index],
+                selections[index],
+                started,
+            )
+            if callback is not None:
+                callback(num, results[num])
 
-        return (
-            sub_domain,
-            description,
-            response,
-            len(context_tokens),
-            len(response_tokens),
-            context_raw,
-            response_raw,
-        )
+        self.scheduler.run(questions, done, [len(x) for x in context_tokens])
+        return results
 
     def classify_class_and_function(self, fullname: str):
         """Classify class and function from the full name at once.
@@ -387,6 +832,8 @@ class AICachedClassifier(AIClassifier):
         api_domain_label_listing: dict,
         subdomain_label_listing: dict,
         db: DatabaseManager,
+        scheduler: Optional[RequestScheduler] = None,
+        api_pack_size: int = 1,
     ):
         """Set up AI Classifier with Cache Support
 
@@ -394,9 +841,13 @@ class AICachedClassifier(AIClassifier):
             api_domain_label_listing (dict): Dictionary Listing of all possible api (class) domains
             subdomain_label_listing (dict): Dictionary Listing of all possible subdomains
             db (DatabaseManager): Database Handler Object
+            scheduler (Optional[RequestScheduler], optional): see AIClassifier
+            api_pack_size (int, optional): classnames asked per request by classify_APIs(). Defaults to 1.
         """
         self.db = db
-        super().__init__(api_domain_label_listing, subdomain_label_listing)
+        super().__init__(
+            api_domain_label_listing, subdomain_label_listing, scheduler, api_pack_size
+        )
 
     def classify_API(self, api: str) -> str:
         """Classify api/classname into a domain as defined by the domain label listing
@@ -450,6 +901,90 @@ class AICachedClassifier(AIClassifier):
         else:
             return cache_result
 
+    def classify_APIs(
+        self, apis: list[str], callback: Optional[Callable[[int, str], None]] = None
+    ) -> list[str]:
+        """Classify many api/classnames. The ones not in the cache are classified concurrently.
+
+        Each new classification is stored as soon as it comes in.
+
+        Args:
+            apis (list[str]): API names
+            callback (Optional[Callable[[int, str], None]], optional): called with the index
+                and domain of each API the AI classified, after it is stored.
+
+        Returns:
+            list[str]: domain of each API, in order
+        """
+        domains = [self.db.cache_classify_API(api) for api in apis]
+        # index of each missing API, asked once
+        missing = {}
+        for num, domain in enumerate(domains):
+            if domain is None:
+                missing.setdefault(apis[num], []).append(num)
+        missing_apis = list(missing)
+
+        def store(index: int, result: tuple):
+            api = missing_apis[index]
+            domain, _a, _b, context_count, response_count, context, response = result
+            self.db.store_class_classification(
+                api, domain, context_count, response_count, context, response
+            )
+            for num in missing[api]:
+                domains[num] = domain
+                if callback is not None:
+                    callback(num, domain)
+
+        super().classify_APIs(missing_apis, store)
+        return domains
+
+    def classify_functions(
+        self,
+        functions: list[tuple[str, str, str]],
+        callback: Optional[Callable[[int, str], None]] = None,
+    ) -> list[str]:
+        """Classify many functions. The ones not in the cache are classified concurrently.
+
+        Each new classification is stored as soon as it comes in.
+
+        Args:
+            functions (list[tuple[str, str, str]]): (api name, function name, api domain)
+            callback (Optional[Callable[[int, str], None]], optional): called with the index
+                and subdomain of each function the AI classified, after it is stored.
+
+        Returns:
+            list[str]: subdomain of each function, in order
+        """
+        subdomains = [
+            self.db.cache_classify_function(api_name, function_name)
+            for api_name, function_name, _ in functions
+        ]
+        missing = {}
+        for num, subdomain in enumerate(subdomains):
+            if subdomain is None:
+                missing.setdefault(functions[num], []).append(num)
+        missing_functions = list(missing)
+
+        def store(index: int, result: tuple):
+            function = missing_functions[index]
+            subdomain, _a, _b, context_count, response_count, context, response = result
+            self.db.store_function_classification(
+                function[0],
+                function[1],
+                subdomain,
+                context_count,
+                response_count,
+                context,
+                response,
+            )
+            for num in missing[function]:
+                subdomains[num] = subdomain
+                if callback is not None:
+                    callback(num, subdomain)
+
+        super().classify_functions(missing_functions, store)
+        return subdomains
+
     def classify_class_and_function(self, fullname: str) -> tuple[str, str]:
         """Classify class and function from the full name at once.
 
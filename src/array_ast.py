@@ -0,0 +1,402 @@
+"""
+array_ast.py
+
+Compact, array backed AST.
+
+Every node of the tree is a row in a set of parallel NumPy arrays (kind,
+parent, first child, next sibling, byte range, points, flags), in pre-order.
+The arrays and the source they point into can be saved to a single .npz
+file and loaded back without re-parsing.
+
+ArrayAST.walk() returns a cursor with the same interface as the tree-sitter
+TreeCursor, so JavaASTVisitor runs on it directly. ArrayAST.to_dict() gives the
+same dictionary AST as generate_ast.tree_to_dict() for older consumers.
+"""
+
+import numpy as np
+
+from .generate_ast import LazyNode, parse_file, parse_source
+
+# bits of the "flags" array
+IS_NAMED = 1
+IS_EXTRA = 2
+HAS_ERROR = 4
+IS_ERROR = 8
+IS_MISSING = 16
+
+NO_NODE = -1
+
+INDEX_FIELDS = ("parent", "first_child", "next_sibling")
+POSITION_FIELDS = (
+    "start_byte",
+    "end_byte",
+    "start_row",
+    "start_column",
+    "end_row",
+    "end_column",
+)
+
+
+class ArrayAST:
+    """Columnar AST. Row i of each array describes node i (pre-order, root is 0)."""
+
+    def __init__(self, arrays: dict, source: bytes):
+        """Create from arrays. See from_tree() and load().
+
+        Args:
+            arrays (dict[str, np.ndarray]): node arrays and kind name tables
+            source (bytes): contents of the parsed file
+        """
+        self.kind_id = arrays["kind_id"]
+        self.grammar_id = arrays["grammar_id"]
+        self.parent = arrays["parent"]
+        self.first_child = arrays["first_child"]
+        self.next_sibling = arrays["next_sibling"]
+        self.start_byte = arrays["start_byte"]
+        self.end_byte = arrays["end_byte"]
+        self.start_row = arrays["start_row"]
+        self.start_column = arrays["start_column"]
+        self.end_row = arrays["end_row"]
+        self.end_column = arrays["end_column"]
+        self.flags = arrays["flags"]
+
+        # kind_id -> type, grammar_id -> grammar name
+        self.type_names = arrays["type_names"].tolist()
+        self.grammar_names = arrays["grammar_names"].tolist()
+
+        self.source = source
+        self.source_view = memoryview(source)
+
+    def __len__(self):
+        return len(self.kind_id)
+
+    @classmethod
+    def from_tree(cls, tree, source: bytes):
+        """Convert a tree-sitter tree into arrays.
+
+        Args:
+            tree (tree_sitter.Tree): parsed tree
+            source (bytes): source the tree was parsed from
+
+        Returns:
+            ArrayAST: columnar AST
+        """
+        kind_id = []
+        grammar_id = []
+        parent = []
+        first_child = []
+        next_sibling = []
+        positions = []
+        flags = []
+        type_names = {}
+        grammar_names = {}
+
+        cursor = tree.walk()
+        stack = []  # indices of the nodes above the cursor
+        previous = NO_NODE  # last child seen at the current level
+
+        while True:
+            node = cursor.node
+            index = len(kind_id)
+
+            kind_id.append(node.kind_id)
+            grammar_id.append(node.grammar_id)
+            type_names[node.kind_id] = node.type
+            grammar_names[node.grammar_id] = node.grammar_name
+            parent.append(stack[-1] if stack else NO_NODE)
+            first_child.append(NO_NODE)
+            next_sibling.append(NO_NODE)
+            positions.append(
+                (
+                    node.start_byte,
+                    node.end_byte,
+                    node.start_point[0],
+                    node.start_point[1],
+                    node.end_point[0],
+                    node.end_point[1],
+                )
+            )
+            flags.append(
+                (IS_NAMED if node.is_named else 0)
+                | (IS_EXTRA if node.is_extra else 0)
+                | (HAS_ERROR if node.has_error else 0)
+                | (IS_ERROR if node.is_error else 0)
+                | (IS_MISSING if node.is_missing else 0)
+            )
+
+            if previous != NO_NODE:
+                next_sibling[previous] = index
+            elif stack:
+                first_child[stack[-1]] = index
+
+            if cursor.goto_first_child():
+                stack.append(index)
+                previous = NO_NODE
+                continue
+
+            previous = index
+            while stack and not cursor.goto_next_sibling():
+                cursor.goto_parent()
+                previous = stack.pop()
+            if not stack:
+                break
+
+        positions = np.array(positions, dtype=np.int64).reshape(-1, 6)
+        arrays = {
+            "kind_id": np.array(kind_id, dtype=np.uint16),
+            "grammar_id": np.array(grammar_id, dtype=np.uint16),
+            "parent": np.array(parent, dtype=np.int32),
+            "first_child": np.array(first_child, dtype=np.int32),
+            "next_sibling": np.array(next_sibling, dtype=np.int32),
+            "flags": np.array(flags, dtype=np.uint8),
+            "type_names": _name_table(type_names),
+            "grammar_names": _name_table(grammar_names),
+        }
+        for num, field in enumerate(POSITION_FIELDS):
+            arrays[field] = positions[:, num].astype(np.uint32)
+
+        return cls(arrays, source)
+
+    @classmethod
+    def from_file(cls, filename: str):
+        """Parse a file into an ArrayAST
+
+        Args:
+            filename (str): path of the file
+
+        Returns:
+            ArrayAST: columnar AST
+        """
+        tree, source = parse_file(filename)
+        return cls.from_tree(tree, source)
+
+    @classmethod
+    def from_source(cls, source: bytes, file_end: str):
+        """Parse source code already in memory into an ArrayAST
+
+        Args:
+            source (bytes): contents of the file
+            file_end (str): file extension without the dot
+
+        Returns:
+            ArrayAST: columnar AST
+        """
+        return cls.from_tree(parse_source(source, file_end), source)
+
+    def save(self, filename: str):
+        """Save arrays and source to a compressed .npz file
+
+        Args:
+            filename (str): output path. Should end in .npz
+        """
+        arrays = {
+            "kind_id": self.kind_id,
+            "grammar_id": self.grammar_id,
+            "type_names": np.array(self.type_names),
+            "grammar_names": np.array(self.grammar_names),
+            "source": np.frombuffer(self.source, dtype=np.uint8),
+        }
+        for field in INDEX_FIELDS + POSITION_FIELDS + ("flags",):
+            arrays[field] = getattr(self, field)
+        np.savez_compressed(filename, **arrays)
+
+    @classmethod
+    def load(cls, filename: str):
+        """Load an ArrayAST saved by save()
+
+        Args:
+            filename (str): path of the .npz file
+
+        Returns:
+            ArrayAST: columnar AST
+        """
+        with np.load(filename, allow_pickle=False) as data:
+            arrays = {key: data[key] for key in data.files}
+        source = arrays.pop("source").tobytes()
+        return cls(arrays, source)
+
+    @staticmethod
+    def load_source(filename: str) -> bytes:
+        """Load only the source saved with an ArrayAST, without the node arrays
+
+        Args:
+            filename (str): path of the .npz file
+
+        Returns:
+            bytes: contents of the parsed file
+        """
+        with np.load(filename, allow_pickle=False) as data:
+            return data["source"].tobytes()
+
+    def walk(self):
+        """Cursor at the root node. Same interface as tree_sitter.TreeCursor
+
+        Returns:
+            ArrayCursor: cursor
+        """
+        return ArrayCursor(self)
+
+    @property
+    def root_node(self):
+        return ArrayNode(self, 0)
+
+    def text(self, index: int) -> str:
+        """Decoded source text of a node
+
+        Args:
+            index (int): node index
+
+        Returns:
+            str: text
+        """
+        return str(
+            self.source_view[self.start_byte[index] : self.end_byte[index]], "utf-8"
+        )
+
+    def to_dict(self, index: int = 0) -> dict:
+        """Build the dictionary AST, the same as generate_ast.tree_to_dict()
+
+        Args:
+            index (int, optional): node to start from. Defaults to the root.
+
+        Returns:
+            dict: dictionary AST (of LazyNodes)
+        """
+        node = ArrayNode(self, index)
+        local_data = LazyNode(self.source_view, name=node.grammar_name)
+        local_data["children"] = [self.to_dict(child.index) for child in node.children]
+
+        flags = int(self.flags[index])
+        local_data.update(
+            {
+                "kind_id": node.kind_id,
+                "grammar_id": node.grammar_name,
+                "type": node.type,
+                "is_named": bool(flags & IS_NAMED),
+                "is_extra": bool(flags & IS_EXTRA),
+                "has_changes": False,
+                "has_error": bool(flags & HAS_ERROR),
+                "is_error": bool(flags & IS_ERROR),
+                "start_byte": node.start_byte,
+                "end_byte": node.end_byte,
+                "start_point": list(node.start_point),
+                "end_point": list(node.end_point),
+                "child_count": len(local_data["children"]),
+                "named_child_count": sum(
+                    1 for child in local_data["children"] if child["is_named"]
+                ),
+            }
+        )
+        return local_data
+
+
+class ArrayNode:
+    """A node of an ArrayAST. Mirrors the parts of tree_sitter.Node the engine uses."""
+
+    __slots__ = ("ast", "index")
+
+    def __init__(self, ast: ArrayAST, index: int):
+        self.ast = ast
+        self.index = index
+
+    @property
+    def kind_id(self) -> int:
+        return int(self.ast.kind_id[self.index])
+
+    @property
+    def type(self) -> str:
+        return self.ast.type_names[self.ast.kind_id[self.index]]
+
+    @property
+    def grammar_name(self) -> str:
+        return self.ast.grammar_names[self.ast.grammar_id[self.index]]
+
+    @property
+    def is_named(self) -> bool:
+        return bool(self.ast.flags[self.index] & IS_NAMED)
+
+    @property
+    def start_byte(self) -> int:
+        return int(self.ast.start_byte[self.index])
+
+    @property
+    def end_byte(self) -> int:
+        return int(self.ast.end_byte[self.index])
+
+    @property
+    def start_point(self) -> tuple[int, int]:
+        return (
+            int(self.ast.start_row[self.index]),
+            int(self.ast.start_column[self.index]),
+        )
+
+    @property
+    def end_point(self) -> tuple[int, int]:
+        return (int(self.ast.end_row[self.index]), int(self.ast.end_column[self.index]))
+
+    @property
+    def text(self) -> bytes:
+        return bytes(
+            self.ast.source_view[
+                self.ast.start_byte[self.index] : self.ast.end_byte[self.index]
+            ]
+        )
+
+    @property
+    def children(self) -> list:
+        out = []
+        child = self.ast.first_child[self.index]
+        while child != NO_NODE:
+            out.append(ArrayNode(self.ast, int(child)))
+            child = self.ast.next_sibling[child]
+        return out
+
+
+class ArrayCursor:
+    """Cursor over an ArrayAST. Mirrors tree_sitter.TreeCursor"""
+
+    __slots__ = ("ast", "index")
+
+    def __init__(self, ast: ArrayAST, index: int = 0):
+        self.ast = ast
+        self.index = index
+
+    @property
+    def node(self) -> ArrayNode:
+        return ArrayNode(self.ast, self.index)
+
+    def goto_first_child(self) -> bool:
+        child = self.ast.first_child[self.index]
+        if child == NO_NODE:
+            return False
+        self.index = int(child)
+        return True
+
+    def goto_next_sibling(self) -> bool:
+        sibling = self.ast.next_sibling[self.index]
+        if sibling == NO_NODE:
+            return False
+        self.index = int(sibling)
+        return True
+
+    def goto_parent(self) -> bool:
+        parent = self.ast.parent[self.index]
+        if parent == NO_NODE:
+            return False
+        self.index = int(parent)
+        return True
+
+
+def _name_table(names: dict) -> np.ndarray:
+    """Turn {id: name} into an array indexed by id
+
+    Args:
+        names (dict[int, str]): names of the ids used
+
+    Returns:
+        np.ndarray: name table. Unused ids are empty strings
+    """
+    table = [""] * (max(names) + 1 if names else 0)
+    for num, name in names.items():
+        table[num] = name
+    return np.array(table)
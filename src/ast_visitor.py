@@ -0,0 +1,261 @@
+"""
+ast_visitor.py
+
+Single pass extraction of the data the CoreEngine needs from a Java parse tree.
+
+Instead of converting the whole tree-sitter tree into nested dictionaries
+(see generate_ast.tree_to_dict) and then walking those dictionaries once per
+extractor, this walks the tree-sitter tree directly with a cursor and collects
+tokens, imports, symbols and method invocations at the same time.
+
+The output matches tokens.pullToken, tokens.pullImport,
+SymbolTable.findSymbols and SymbolTable.getMethods, in the same order.
+"""
+
+from .scope_index import declaration_scope
+
+TOKEN_TYPES = ("type_identifier", "boolean_type")
+IMPORT_TYPE = "scoped_identifier"
+DECLARATION_TYPES = (
+    "formal_parameter",
+    "field_declaration",
+    "local_variable_declaration",
+)
+INVOCATION_TYPE = "method_invocation"
+
+# Extractors still looking at a subtree. Each extractor stops descending at
+# the nodes it matches, just like the recursive versions do.
+_TOKENS = 1
+_IMPORTS = 2
+_SYMBOLS = 4
+_METHODS = 8
+_ALL = _TOKENS | _IMPORTS | _SYMBOLS | _METHODS
+
+
+class JavaASTVisitor:
+    """Cursor based visitor over a parsed Java tree."""
+
+    # Node types whose results a subclass can reuse from an earlier visit.
+    # See _start_chunk() and incremental.IncrementalVisitor
+    chunk_types = ()
+
+    def __init__(self, tree, source: bytes):
+        """Set up the visitor. Call visit() to run it.
+
+        Args:
+            tree (tree_sitter.Tree): Parsed tree
+            source (bytes): Source the tree was parsed from
+        """
+        self.tree = tree
+        self.source = memoryview(source)
+
+        self.tokens = []  # same as tokens.pullToken
+        self.imports = []  # same as tokens.pullImport
+        self.symbols = []  # same as SymbolTable.findSymbols
+        self.methods = []  # same as SymbolTable.getMethods
+        self.visited = False
+
+    def text(self, node) -> str:
+        """Get source text of a node
+
+        Args:
+            node (tree_sitter.Node): Node in the tree
+
+        Returns:
+            str: decoded text of the node
+        """
+        return str(self.source[node.start_byte : node.end_byte], "utf-8")
+
+    def visit(self):
+        """Walk the tree once and fill tokens, imports, symbols and methods.
+
+        Returns:
+            JavaASTVisitor: self, so it can be chained.
+        """
+        if self.visited:
+            return self
+
+        cursor = self.tree.walk()
+        # one entry per level we descended into:
+        # [flags for children, method flags per child, child index, pending method record, chunk, node]
+        stack = []
+        flags = _ALL
+
+        while True:
+            node = cursor.node
+            chunk = None
+            if self.chunk_types and node.type in self.chunk_types:
+                chunk = self._start_chunk(node, flags)
+
+            if chunk is False:
+                # results were reused. Skip the subtree.
+                child_flags, allowed, record, chunk = 0, None, None, None
+            else:
+                child_flags, allowed, record = self.__enter(node, flags, stack)
+
+            if (
+                child_flags or (allowed and any(allowed))
+            ) and cursor.goto_first_child():
+                stack.append([child_flags, allowed, 0, record, chunk, node])
+                flags = child_flags
+                if allowed and allowed[0]:
+                    flags |= _METHODS
+                continue
+
+            if record is not None:
+                self.methods.append(record)
+            if chunk is not None:
+                self._end_chunk(chunk)
+
+            # go to the next sibling, or back up the tree until there is one.
+            while stack:
+                level = stack[-1]
+                if cursor.goto_next_sibling():
+                    level[2] += 1
+                    flags = level[0]
+                    if level[1] and level[1][level[2]]:
+                        flags |= _METHODS
+                    break
+
+                cursor.goto_parent()
+                stack.pop()
+                if level[3] is not None:
+                    self.methods.append(level[3])
+                if level[4] is not None:
+                    self._end_chunk(level[4])
+            else:
+                break
+
+        self.visited = True
+        return self
+
+    def _start_chunk(self, node, flags: int):
+        """Called before visiting a node listed in chunk_types.
+
+        Args:
+            node (tree_sitter.Node): node about to be visited
+            flags (int): extractors active for the node
+
+        Returns:
+            False if the results of the node were added without visiting it.
+            Otherwise, None or a value to pass to _end_chunk() once the node is done.
+        """
+        return None
+
+    def _end_chunk(self, chunk):
+        """Called after visiting a node that _start_chunk() returned a value for.
+
+        Args:
+            chunk: the value returned by _start_chunk()
+        """
+        pass
+
+    def __enter(self, node, flags: int, stack: list):
+        """Run each active extractor on a node.
+
+        Args:
+            node (tree_sitter.Node): current node
+            flags (int): extractors active for this node
+            stack (list): levels above the node (see visit())
+
+        Returns:
+            int: extractors active for the children
+            list[bool] | None: per child, if the method extractor continues there.
+            dict | None: method record to add once the node's children are done.
+        """
+        node_type = node.type
+        child_flags = flags
+        allowed = None
+        record = None
+
+        if flags & _TOKENS and node_type in TOKEN_TYPES:
+            text = self.text(node)
+            if text:
+                self.tokens.append(text)
+            child_flags &= ~_TOKENS
+
+        if flags & _IMPORTS and (
+            node_type == IMPORT_TYPE or node.grammar_name == IMPORT_TYPE
+        ):
+            text = self.text(node)
+            if text:
+                self.imports.append(text)
+            child_flags &= ~_IMPORTS
+
+        if flags & _SYMBOLS and node.grammar_name in DECLARATION_TYPES:
+            self.__declaration(node, stack)
+            child_flags &= ~_SYMBOLS
+
+        if flags & _METHODS and node.grammar_name == INVOCATION_TYPE:
+            child_flags &= ~_METHODS
+            children = node.children
+            allowed = [False] * len(children)
+            identifiers = []
+            line = 0
+
+            for num, child in enumerate(children):
+                if child.type == INVOCATION_TYPE:
+                    # nested call, like a.b().c(). Only the inner call is kept.
+                    allowed[num] = True
+                    identifiers = None
+                    break
+                if child.type == "identifier":
+                    identifiers.append(self.text(child))
+                    line = child.start_point[0]
+                if child.type == "argument_list":
+                    allowed[num] = True
+
+            if identifiers is not None and len(identifiers) >= 2:
+                record = {
+                    "name": identifiers[0],
+                    "method": identifiers[1],
+                    "line": line,
+                    "byte": node.start_byte,
+                }
+
+        return child_flags, allowed, record
+
+    def __declaration(self, node, stack: list):
+        """Add the symbol declared by a parameter, field, or local variable.
+
+        Args:
+            node (tree_sitter.Node): declaration node
+            stack (list): levels above the node (see visit())
+        """
+        is_parameter = node.grammar_name == "formal_parameter"
+
+        typeID = ""
+        name = ""
+        startPoint = 0
+
+        for x in reversed(node.children):
+            if x.type == "type_identifier":
+                typeID = self.text(x)
+            elif is_parameter and x.type == "identifier":
+                name = self.text(x)
+                startPoint = x.start_point[0]
+            elif not is_parameter and x.type == "variable_declarator":
+                children = x.children
+                count = 0
+                while children[count].grammar_name != "identifier":
+                    count += 1
+                name = self.text(children[count])  # get first identifier.
+                startPoint = children[count].start_point[0]
+
+        if typeID != "":
+            parent = stack[-1][5] if stack else node
+            grandparent = stack[-2][5] if len(stack) > 1 else None
+            scope = declaration_scope(
+                node.grammar_name,
+                node.start_byte,
+                (parent.start_byte, parent.end_byte),
+                (
+                    None
+                    if grandparent is None
+                    else (grandparent.start_byte, grandparent.end_byte)
+                ),
+            )
+            self.symbols.append(
+                {"class": typeID, "name": name, "line": startPoint, "scope": scope}
+            )
+            # ignore primitives.
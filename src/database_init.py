@@ -3,6 +3,7 @@ import json
 import os
 import sqlite3
 from .database_manager import DatabaseManager
+from .label_index import LABEL_FIXES_DDL
 
 
 RED_COLOR = "\033[1m\033[38;5;9m"
@@ -52,6 +53,7 @@ def __init_ai_res_db():
             )
             """
     )
+    cur.execute(LABEL_FIXES_DDL)
     cur.execute(
         """
             CREATE TABLE IF NOT EXISTS "settings" (
@@ -208,6 +210,28 @@ def __init_output_db():
                 )
                 """
     )
+    cur.execute(
+        """
+                CREATE TABLE IF NOT EXISTS "blob_cache" (
+                    "blob_hash"	TEXT,
+                    "classes"	TEXT,
+                    "functions"	TEXT,
+                    PRIMARY KEY("blob_hash")
+                )
+                """
+    )
+    cur.execute(
+        """
+                CREATE TABLE IF NOT EXISTS "ai_batches" (
+                    "batch_id"	TEXT,
+                    "kind"	TEXT,
+                    "input_file"	TEXT,
+                    "status"	TEXT,
+                    "created"	TEXT,
+                    PRIMARY KEY("batch_id")
+                )
+                """
+    )
     cur.execute(
         """
             CREATE UNIQUE INDEX IF NOT EXISTS "QuickFileClassFunction" ON "api_file_register" (
@@ -219,6 +243,13 @@ def __init_output_db():
             """
     )
 
+    cur.execute(
+        """CREATE INDEX IF NOT EXISTS "QuickFileCommit" ON "files_changed" (
+            "filename",
+            "commit_hash"
+        )"""
+    )
+
     cur.execute(
         """CREATE INDEX IF NOT EXISTS "QuickFunctionCache" ON "function_cache" (
             "classname",
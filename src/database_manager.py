@@ -47,6 +47,8 @@ class DatabaseManager:
         dbfile: str = "./output/main.db",
         cachefile: str = "./output/ai_result_backup.db",
         label_file: str = "./data/subdomain_labels.json",
+        batch_files: int = 100,
+        batch_seconds: float = 5.0,
     ):
         """Construct and open connection to database.
 
@@ -54,11 +56,24 @@ class DatabaseManager:
             dbfile (str, optional): _description_. Defaults to "./output/main.db".
             cachefile (str, optional): _description_. Defaults to "./output/cache.db".
             label_file (str, optional): List of labels/sublabels for APIs
+            batch_files (int, optional): Files queued (see queue_file_processed) before writing them. Defaults to 100.
+            batch_seconds (float, optional): Longest time queued files wait to be written. Defaults to 5.0.
         """
         self.conn = sqlite3.connect(dbfile)
         self.cache_file = cachefile
         self.cache_update = False
 
+        # queued writes, see flush()
+        self.batch_files = batch_files
+        self.batch_seconds = batch_seconds
+        self.queued_apis = []
+        self.queued_processed = []
+        self.last_flush = time.time()
+
+        # in-process copy of api_cache and function_cache, see preload_classifications()
+        self.domain_cache = None  # classname -> domain
+        self.subdomain_cache = None  # (classname, function_name) -> subdomain
+
         with open(label_file, "r", encoding="UTF-8") as f:
             self.domain_labels = json.load(f)
 
@@ -255,6 +270,7 @@ class DatabaseManager:
                 (class_name,),
             )  # Don't store a repeated response. Save the response in api_cache.
             self.cache_update = True
+            self.__loaded_classifications([(class_name, domain)])
             return True
         else:
             return False
@@ -313,12 +329,122 @@ class DatabaseManager:
                 ),
             )
             self.cache_update = True
+            self.__loaded_subdomains([(class_name, function_name, sub_domain)])
             return True
         else:
             return False
 
+    def store_class_classifications(self, rows: Iterable[tuple]) -> int:
+        """Store many class/API domain classifications. Classes already in the cache are skipped.
+
+        Args:
+            rows (Iterable[tuple]): (class_name, domain, context_token_number,
+                response_token_number, context, response), as in store_class_classification()
+
+        Returns:
+            int: number of new records
+        """
+        rows = list(rows)
+        cur = self.conn.cursor()
+        before = self.conn.total_changes
+        cur.executemany(
+            "INSERT OR IGNORE INTO api_cache (classname, domain, context_tokens, response_tokens, context, response) VALUES (?,?,?,?,?,?)",
+            rows,
+        )
+        added = self.conn.total_changes - before
+        # Don't store a repeated response. Save the response in api_cache.
+        cur.executemany(
+            """INSERT INTO function_cache (classname, function_name, subdomain)
+                SELECT ?, 'N/A', 'N/A' WHERE NOT EXISTS (
+                    SELECT 1 FROM function_cache WHERE classname = ? AND function_name = 'N/A'
+                )""",
+            ((row[0], row[0]) for row in rows),
+        )
+        if added:
+            self.cache_update = True
+        self.__loaded_classifications((row[0], row[1]) for row in rows)
+        return added
+
+    def store_function_classifications(self, rows: Iterable[tuple]) -> int:
+        """Store many function subdomains. Functions already in the cache are skipped.
+
+        Args:
+            rows (Iterable[tuple]): (class_name, function_name, sub_domain, context_token_number,
+                response_token_number, context, response), as in store_function_classification()
+
+        Raises:
+            ValueError: A class is not classified yet
+
+        Returns:
+            int: number of new records
+        """
+        rows = list(rows)
+        cur = self.conn.cursor()
+        for class_name in set(row[0] for row in rows):
+            if self.cache_classify_API(class_name) is None:
+                raise ValueError(
+                    f"Please classify class first by running store_class_classification({class_name}, DOMAIN). Class {class_name} is not currently in the database"
+                )
+
+        before = self.conn.total_changes
+        cur.executemany(
+            """INSERT INTO function_cache (classname, function_name, subdomain, context_tokens, response_tokens, context, response)
+                SELECT ?, ?, ?, ?, ?, ?, ? WHERE NOT EXISTS (
+                    SELECT 1 FROM function_cache WHERE classname = ? AND function_name = ?
+                )""",
+            ((*row, row[0], row[1]) for row in rows),
+        )
+        added = self.conn.total_changes - before
+        if added:
+            self.cache_update = True
+        self.__loaded_subdomains(rows)
+        return added
+
+    def store_batch(self, batch_id: str, kind: str, input_file: str):
+        """Remember a submitted OpenAI batch, so it is picked up again if the run stops.
+
+        Args:
+            batch_id (str): OpenAI batch id
+            kind (str): what the batch classifies. "API" or "FUNC"
+            input_file (str): JSONL file the batch was made from
+        """
+        cur = self.conn.cursor()
+        cur.execute(
+            "INSERT INTO ai_batches (batch_id, kind, input_file, status, created) VALUES (?,?,?,'submitted',?)",
+            (batch_id, kind, input_file, datetime.now()),
+        )
+        self.conn.commit()
+
+    def get_open_batches(self, kind: str) -> list[str]:
+        """Batches submitted but not collected yet.
+
+        Args:
+            kind (str): "API" or "FUNC"
+
+        Returns:
+            list[str]: batch ids, oldest first
+        """
+        cur = self.conn.cursor()
+        cur.execute(
+            "SELECT batch_id FROM ai_batches WHERE kind = ? AND status = 'submitted' ORDER BY created",
+            (kind,),
+        )
+        return [row[0] for row in cur.fetchall()]
+
+    def finish_batch(self, batch_id: str, status: str):
+        """Mark a batch as collected.
+
+        Args:
+            batch_id (str): OpenAI batch id
+            status (str): final OpenAI batch status (completed, expired...)
+        """
+        cur = self.conn.cursor()
+        cur.execute(
+            "UPDATE ai_batches SET status = ? WHERE batch_id = ?", (status, batch_id)
+        )
+
     def manageDownload(self, file: str, commit: str, repo: Repository) -> str:
-        """Create an entry on the files downloaded table. Return temp name
+        """Create an entry on the files downloaded table. Return the temp name to save it under, if saved
 
         Args:
             file (str): filename
@@ -356,6 +482,21 @@ class DatabaseManager:
             (status, file, commit, repo.num),
         )
 
+    def mark_files_as_processed(
+        self, files: Iterable[tuple[str, str, Repository]], status: str = "y"
+    ):
+        """Mark many files as processed with one statement.
+
+        Args:
+            files (Iterable[tuple[str, str, Repository]]): (file path, commit hash, repository) of each file
+            status (str, optional): status of the files. Defaults to 'y' meaning success.
+        """
+        cur = self.conn.cursor()
+        cur.executemany(
+            "UPDATE files_changed SET processed=? WHERE filename=? AND commit_hash=? AND repoNum = ?",
+            ((status, file, commit, repo.num) for file, commit, repo in files),
+        )
+
     def cache_classify_API(self, api: str) -> str | None:
         """Classify API from cache
 
@@ -365,12 +506,17 @@ class DatabaseManager:
         Returns:
             (str | None): domain or None if not in cache
         """
+        if self.domain_cache is not None and api in self.domain_cache:
+            return self.domain_cache[api]
+
         cur = self.conn.cursor()
         cur.execute(f"SELECT domain FROM api_cache WHERE classname = ?", (api,))
         row = cur.fetchone()
         if row is None:
             return None
         else:
+            if self.domain_cache is not None:
+                self.domain_cache[api] = row[0]
             return row[0]
 
     def cache_classify_function(self, api: str, function_name: str) -> str | None:
@@ -383,6 +529,10 @@ class DatabaseManager:
         Returns:
             (str | None): subdomain or None if not in cache
         """
+        key = (api, function_name)
+        if self.subdomain_cache is not None and key in self.subdomain_cache:
+            return self.subdomain_cache[key]
+
         cur = self.conn.cursor()
         cur.execute(
             f"SELECT subdomain FROM function_cache WHERE function_name = ? AND classname = ?",
@@ -392,8 +542,94 @@ class DatabaseManager:
         if row is None:
             return None
         else:
+            if self.subdomain_cache is not None:
+                self.subdomain_cache[key] = row[0]
             return row[0]
 
+    def get_unclassified_apis(self) -> tuple[list[str], list[tuple[str, str]]]:
+        """Classes and functions used by some file that are not classified yet.
+
+        Returns:
+            list[str]: class names missing from api_cache
+            list[tuple[str, str]]: (class name, function name) missing from function_cache
+        """
+        cur = self.conn.cursor()
+        cur.execute("""SELECT DISTINCT r.classname FROM api_file_register AS r
+                WHERE r.classname IS NOT NULL AND NOT EXISTS (
+                    SELECT 1 FROM api_cache AS c WHERE c.classname = r.classname
+                )
+                ORDER BY r.classname""")
+        classes = [row[0] for row in cur.fetchall()]
+        cur.execute(
+            """SELECT DISTINCT r.classname, r.function_name FROM api_file_register AS r
+                WHERE r.classname IS NOT NULL AND r.function_name != 'N/A' AND NOT EXISTS (
+                    SELECT 1 FROM function_cache AS f
+                    WHERE f.classname = r.classname AND f.function_name = r.function_name
+                )
+                ORDER BY r.classname, r.function_name"""
+        )
+        functions = cur.fetchall()
+        return classes, functions
+
+    def preload_classifications(self):
+        """Load every cached domain and subdomain into memory.
+
+        cache_classify_API() and cache_classify_function() then answer from memory, and only
+        query the database for names that are not loaded.
+        """
+        cur = self.conn.cursor()
+        cur.execute("SELECT classname, domain FROM api_cache")
+        self.domain_cache = dict(cur.fetchall())
+
+        # same row as cache_classify_function() when a function is in the table twice
+        self.subdomain_cache = {}
+        cur.execute(
+            "SELECT classname, function_name, subdomain FROM function_cache ORDER BY classname, function_name, subdomain"
+        )
+        for class_name, function_name, subdomain in cur:
+            self.subdomain_cache.setdefault((class_name, function_name), subdomain)
+
+    def invalidate_classifications(
+        self, api: Optional[str] = None, function_name: Optional[str] = None
+    ):
+        """Drop classifications loaded by preload_classifications(), after the tables changed.
+
+        Args:
+            api (Optional[str], optional): Class to drop. Defaults to None, to drop everything.
+            function_name (Optional[str], optional): Function of the class to drop. Defaults to None,
+                to drop the class domain.
+        """
+        if api is None:
+            self.domain_cache = None
+            self.subdomain_cache = None
+        elif function_name is None:
+            if self.domain_cache is not None:
+                self.domain_cache.pop(api, None)
+        elif self.subdomain_cache is not None:
+            self.subdomain_cache.pop((api, function_name), None)
+
+    def __loaded_classifications(self, rows: Iterable[tuple[str, str]]):
+        """Add stored class domains to the classifications loaded by preload_classifications().
+
+        Names already in the table keep the loaded domain, like INSERT OR IGNORE.
+        """
+        if self.domain_cache is None:
+            return
+        for class_name, domain in rows:
+            self.domain_cache.setdefault(class_name, domain)
+            if self.subdomain_cache is not None:
+                self.subdomain_cache.setdefault((class_name, "N/A"), "N/A")
+
+    def __loaded_subdomains(self, rows: Iterable[tuple]):
+        """Add stored function subdomains to the classifications loaded by preload_classifications().
+
+        Functions already in the table keep the loaded subdomain, like the store methods.
+        """
+        if self.subdomain_cache is None:
+            return
+        for class_name, function_name, sub_domain, *_ in rows:
+            self.subdomain_cache.setdefault((class_name, function_name), sub_domain)
+
     def mark_file_api_use(
         self, file: str, commit_hash: str, class_name: str, repo: Repository
     ) -> bool:
@@ -459,6 +695,148 @@ class DatabaseManager:
         else:
             return False
 
+    def cache_blob_extraction(
+        self, blob_hash: str
+    ) -> tuple[list[str], list[str]] | None:
+        """Get the classes and functions extracted earlier from identical file contents
+
+        Args:
+            blob_hash (str): hash of the file contents (see processing.blob_hash)
+
+        Returns:
+            (tuple[list[str], list[str]] | None): classes and functions ("class::function"),
+                or None if these contents were not analyzed yet
+        """
+        cur = self.conn.cursor()
+        cur.execute(
+            "SELECT classes, functions FROM blob_cache WHERE blob_hash = ?",
+            (blob_hash,),
+        )
+        row = cur.fetchone()
+        if row is None:
+            return None
+        else:
+            return json.loads(row[0]), json.loads(row[1])
+
+    def store_blob_extraction(
+        self, blob_hash: str, classes: Iterable[str], functions: Iterable[str]
+    ):
+        """Remember the classes and functions extracted from some file contents
+
+        Args:
+            blob_hash (str): hash of the file contents (see processing.blob_hash)
+            classes (Iterable[str]): full class names used
+            functions (Iterable[str]): functions used, like "class::function"
+        """
+        cur = self.conn.cursor()
+        cur.execute(
+            "INSERT OR REPLACE INTO blob_cache (blob_hash, classes, functions) VALUES (?,?,?)",
+            (blob_hash, json.dumps(list(classes)), json.dumps(list(functions))),
+        )
+
+    def register_file_apis(
+        self,
+        file: str,
+        commit_hash: str,
+        classes: Iterable[str],
+        functions: Iterable[str],
+        repo: Repository,
+    ):
+        """Mark file using all these classes and functions at once.
+
+        Same as calling mark_file_api_use() and mark_file_function_use() on each.
+
+        Args:
+            file (str): File path
+            commit_hash (str): Commit Hash
+            classes (Iterable[str]): Class APIs
+            functions (Iterable[str]): functions, like "class::function". Unknown classes are skipped.
+            repo (Repository): Repository
+        """
+        cur = self.conn.cursor()
+        cur.executemany(
+            "INSERT OR IGNORE INTO api_file_register (filename, commit_hash, classname, function_name, repoNum) VALUES (?,?,?,?,?)",
+            self.__file_api_rows(file, commit_hash, classes, functions, repo),
+        )
+
+    def __file_api_rows(
+        self,
+        file: str,
+        commit_hash: str,
+        classes: Iterable[str],
+        functions: Iterable[str],
+        repo: Repository,
+    ) -> list[tuple]:
+        rows = [
+            (file, commit_hash, class_name, "N/A", repo.num) for class_name in classes
+        ]
+        for function in functions:
+            class_name, function_name = function.split("::", 1)
+            if class_name == "Unknown":
+                continue
+            rows.append((file, commit_hash, class_name, function_name, repo.num))
+        return rows
+
+    def queue_file_apis(
+        self,
+        file: str,
+        commit_hash: str,
+        classes: Iterable[str],
+        functions: Iterable[str],
+        repo: Repository,
+    ):
+        """Same as register_file_apis(), but written on the next flush().
+
+        Args:
+            file (str): File path
+            commit_hash (str): Commit Hash
+            classes (Iterable[str]): Class APIs
+            functions (Iterable[str]): functions, like "class::function". Unknown classes are skipped.
+            repo (Repository): Repository
+        """
+        self.queued_apis.extend(
+            self.__file_api_rows(file, commit_hash, classes, functions, repo)
+        )
+
+    def queue_file_processed(
+        self, file: str, commit: str, repo: Repository, status: str = "y"
+    ):
+        """Same as mark_file_as_processed(), but written on the next flush().
+
+        Queue the file's APIs first. Every batch_files files or batch_seconds seconds, the queue
+        is flushed. A file is marked as processed in the same transaction as its APIs, so if the
+        program stops, the files that were not written are still unprocessed and are done again
+        on the next run.
+
+        Args:
+            file (str): file path
+            commit (str): commit hash
+            repo (Repository): Repository of commit.
+            status (str, optional): status of the file. Defaults to 'y' meaning success.
+        """
+        self.queued_processed.append((status, file, commit, repo.num))
+        if (
+            len(self.queued_processed) >= self.batch_files
+            or time.time() - self.last_flush >= self.batch_seconds
+        ):
+            self.flush()
+
+    def flush(self):
+        """Write queued APIs and processed files in one transaction, and save."""
+        cur = self.conn.cursor()
+        cur.executemany(
+            "INSERT OR IGNORE INTO api_file_register (filename, commit_hash, classname, function_name, repoNum) VALUES (?,?,?,?,?)",
+            self.queued_apis,
+        )
+        cur.executemany(
+            "UPDATE files_changed SET processed=? WHERE filename=? AND commit_hash=? AND repoNum = ?",
+            self.queued_processed,
+        )
+        self.queued_apis = []
+        self.queued_processed = []
+        self.save()
+        self.last_flush = time.time()
+
     def save(self):
         """Commit all changes to file"""
         self.conn.commit()
@@ -479,19 +857,11 @@ class DatabaseManager:
         cur.execute(
             "SELECT classname, domain, context_tokens, response_tokens, context, response FROM api_cache WHERE transferred IS NULL"
         )
-        rows = cur.fetchall()
-        for row in rows:
-            backup.execute(
-                "SELECT classname, domain FROM apis WHERE classname = ?", (row[0],)
-            )
-            test = backup.fetchone()
-            if test is None:
-                backup.execute(
-                    "INSERT INTO apis (classname, domain, context_tokens, response_tokens, context, response) VALUES (?, ?, ?, ?, ?, ?)",
-                    (row[0], row[1], row[2], row[3], row[4], row[5]),
-                )
-            else:
-                pass  # assume backup is right! Differing domains.
+        # assume backup is right when it already has a class or function (differing domains).
+        backup.executemany(
+            "INSERT OR IGNORE INTO apis (classname, domain, context_tokens, response_tokens, context, response) VALUES (?, ?, ?, ?, ?, ?)",
+            cur.fetchall(),
+        )
         cur.execute("UPDATE api_cache SET transferred = 1 WHERE transferred IS NULL")
         self.conn.commit()
 
@@ -500,20 +870,10 @@ class DatabaseManager:
         cur.execute(
             "SELECT classname, function_name, subdomain, context_tokens, response_tokens, context, response FROM function_cache WHERE transferred IS NULL"
         )
-        rows = cur.fetchall()
-        for row in rows:
-            backup.execute(
-                "SELECT classname, function_name, subdomain FROM functions WHERE classname = ? AND function_name = ?",
-                (row[0], row[1]),
-            )
-            test = backup.fetchone()
-            if test is None:
-                backup.execute(
-                    "INSERT INTO functions (classname, function_name, subdomain, context_tokens, response_tokens, context, response) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                    (row[0], row[1], row[2], row[3], row[4], row[5], row[6]),
-                )
-            else:
-                pass  # assume backup is right! Differing subdomains.
+        backup.executemany(
+            "INSERT OR IGNORE INTO functions (classname, function_name, subdomain, context_tokens, response_tokens, context, response) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            cur.fetchall(),
+        )
 
         cur.execute(
             "UPDATE function_cache SET transferred = 1 WHERE transferred IS NULL"
@@ -561,6 +921,7 @@ class DatabaseManager:
         self.conn.commit()
         backup.close()
         backup_connection.close()
+        self.invalidate_classifications()
 
     def save_pr_data(self, pr_data: dict, repo: Repository):
         """Save data from a PR into the database
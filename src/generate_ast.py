@@ -13,10 +13,13 @@ By Benjamin Carter, TJ Potter, and Brent McLennan
 import json
 import os
 import sys
+import threading
 
 import tree_sitter_java
 from tree_sitter import Language, Parser
 
+from .ast_visitor import JavaASTVisitor
+
 
 # Determine the shared library extension based on the platform
 if os.name == "posix" and sys.platform.startswith("darwin"):
@@ -65,6 +68,166 @@ else:
 # )
 
 
+# Registry of tree-sitter grammars, by file extension.
+# To support another language, install its tree-sitter package and
+# register it here (or call register_language() at runtime).
+LANGUAGE_LIBRARIES = {
+    "java": tree_sitter_java.language,
+    # "py": tree_sitter_python.language,
+    # "c": tree_sitter_c.language,
+    # "cpp": tree_sitter_cpp.language,
+    # "cs": tree_sitter_c_sharp.language,
+    # "js": tree_sitter_javascript.language,
+}
+
+
+class ParserPool:
+    """Prepared tree-sitter parsers, keyed by file extension.
+
+    Languages are loaded once per process. Parsers are not thread safe, so
+    each thread gets its own parser per language, created on first use.
+    """
+
+    def __init__(self, libraries: dict):
+        """Create pool
+
+        Args:
+            libraries (dict): file extension -> function returning the tree-sitter language
+        """
+        self.libraries = libraries
+        self.languages = {}
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def register(self, file_end: str, language_library):
+        """Add (or replace) a language.
+
+        Args:
+            file_end (str): file extension without the dot. e.g. "py"
+            language_library (Callable): returns the tree-sitter language. e.g. tree_sitter_python.language
+        """
+        with self.lock:
+            self.libraries[file_end] = language_library
+            self.languages.pop(file_end, None)
+        self.local = threading.local()  # drop parsers using the old language
+
+    def get_language(self, file_end: str) -> Language:
+        """Get the language for a file extension
+
+        Args:
+            file_end (str): file extension without the dot
+
+        Raises:
+            ValueError: Unsupported language
+
+        Returns:
+            Language: tree-sitter language
+        """
+        language = self.languages.get(file_end)
+        if language is not None:
+            return language
+
+        with self.lock:
+            if file_end not in self.languages:
+                if file_end not in self.libraries:
+                    raise ValueError(
+                        "Unsupported language. "
+                        f"Supported options: {', '.join(self.libraries)}. "
+                        "Given: " + file_end
+                    )
+                self.languages[file_end] = Language(self.libraries[file_end]())
+            return self.languages[file_end]
+
+    def get_parser(self, file_end: str) -> Parser:
+        """Get this thread's parser for a file extension
+
+        Args:
+            file_end (str): file extension without the dot
+
+        Raises:
+            ValueError: Unsupported language
+
+        Returns:
+            Parser: prepared parser
+        """
+        parsers = getattr(self.local, "parsers", None)
+        if parsers is None:
+            parsers = self.local.parsers = {}
+
+        parser = parsers.get(file_end)
+        if parser is None:
+            parser = Parser(self.get_language(file_end))
+            parsers[file_end] = parser
+        return parser
+
+
+parser_pool = ParserPool(LANGUAGE_LIBRARIES)
+
+
+def register_language(file_end: str, language_library):
+    """Register a tree-sitter grammar for a file extension.
+
+    Args:
+        file_end (str): file extension without the dot. e.g. "py"
+        language_library (Callable): returns the tree-sitter language. e.g. tree_sitter_python.language
+    """
+    parser_pool.register(file_end, language_library)
+
+
+class LazyNode(dict):
+    """A dictionary AST node that decodes its "text" only when it is asked for.
+
+    Instead of storing a copy of its source, the node keeps "start_byte" and
+    "end_byte", which point into one memoryview of the file shared by every
+    node in the tree. node["text"] and node.get("text") still work.
+    """
+
+    __slots__ = ("source",)
+
+    def __init__(self, source: memoryview, *args, **kwargs):
+        """Create node
+
+        Args:
+            source (memoryview): Contents of the whole file
+        """
+        super().__init__(*args, **kwargs)
+        self.source = source
+
+    def __missing__(self, key):
+        if key == "text":
+            return self.text
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key == "text":
+            return self.text
+        return super().get(key, default)
+
+    @property
+    def text(self) -> str:
+        """Decoded source text of the node"""
+        return str(self.source[self["start_byte"] : self["end_byte"]], "utf-8")
+
+
+def materialize_text(node):
+    """Copy a dictionary AST, adding the "text" field to every LazyNode.
+
+    Args:
+        node (dict | list): AST fragment
+
+    Returns:
+        dict | list: plain dictionary AST
+    """
+    if isinstance(node, list):
+        return [materialize_text(x) for x in node]
+    if isinstance(node, dict):
+        out = {key: materialize_text(value) for key, value in node.items()}
+        if isinstance(node, LazyNode):
+            out["text"] = node.text
+        return out
+    return node
+
+
 def dict_to_json(input_dict: dict):
     """Convert a dictionary to JSON
 
@@ -76,16 +239,21 @@ def dict_to_json(input_dict: dict):
     """
 
     default = lambda o: str(o)
-    return json.dumps(input_dict, indent=1, default=default, skipkeys=True)
+    return json.dumps(
+        materialize_text(input_dict), indent=1, default=default, skipkeys=True
+    )
 
 
-def tree_to_dict(walk_pointer):
+def tree_to_dict(walk_pointer, source: memoryview | None = None):
     """
     Convert an abstract syntax tree into a dictionary.
     This uses a post-order traversal technique. Goto children, then go to child's sibling.
 
     Args:
         walkPointer (): The parse tree context.
+        source (memoryview, optional): Contents of the parsed file. If given, nodes
+            are LazyNodes that slice their text from it. Otherwise each node stores
+            its own decoded copy of the text.
 
     Returns:
         dictionary of it and it's children
@@ -94,15 +262,18 @@ def tree_to_dict(walk_pointer):
     # for each field name, get it's value.
     # If value is a node, recursive!
 
-    local_data: dict = {"name": walk_pointer.node.grammar_name}
+    if source is None:
+        local_data: dict = {"name": walk_pointer.node.grammar_name}
+    else:
+        local_data = LazyNode(source, name=walk_pointer.node.grammar_name)
 
     local_data["children"] = []
 
     if walk_pointer.goto_first_child():
-        local_data["children"].append(tree_to_dict(walk_pointer))
+        local_data["children"].append(tree_to_dict(walk_pointer, source))
 
         while walk_pointer.goto_next_sibling():
-            local_data["children"].append(tree_to_dict(walk_pointer))
+            local_data["children"].append(tree_to_dict(walk_pointer, source))
 
         walk_pointer.goto_parent()
 
@@ -125,64 +296,97 @@ def tree_to_dict(walk_pointer):
         "end_point": [walk_pointer.node.end_point[0], walk_pointer.node.end_point[1]],
         "child_count": walk_pointer.node.child_count,
         "named_child_count": walk_pointer.node.named_child_count,
-        "text": walk_pointer.node.text.decode(),
     }
-    local_data = {**local_data, **extra}
+    if source is None:
+        extra["text"] = walk_pointer.node.text.decode()
+    local_data.update(extra)
 
     # done.
     return local_data
 
 
-def generate_ast(filename):
-    """
-    TODO.
+def parse_file(filename):
+    """Parse a source file with tree-sitter.
+
+    Args:
+        filename (str): path of the file. The extension picks the language.
+
+    Raises:
+        ValueError: Unsupported language
+
+    Returns:
+        tree_sitter.Tree: parsed tree
+        bytes: contents of the file
     """
 
     file_end = filename.strip().split(".")[-1]
-    language_library = ""
-    # return dictionary AST.
-    if file_end == "java":
-        language_library = tree_sitter_java.language()
-    # elif file_end == "py":
-    #     language_library = tree_sitter_python.language()
-    #     file_end = "python"
-    # elif file_end == "c":
-    #     language_library = tree_sitter_c.language()
-    # elif file_end == "cpp":
-    #     language_library = tree_sitter_cpp.language()
-    # elif file_end == "cs":
-    #     language_library = tree_sitter_cs.language()
-    #     file_end = "c_sharp"
-    # elif file_end == "html":
-    #     language_library = tree_sitter_html.language()
-    # elif file_end == "css":
-    #     language_library = tree_sitter_css.language()
-    # elif file_end == "js":
-    #     language_library = tree_sitter_js.language()
-    #     file_end = "javascript"
-    else:
-        raise ValueError(
-            "Unsupported language. "
-            "Supported options: java, python, C, C#, C++, HTML, Javascript, CSS. "
-            "Given: " + file_end
-        )
-    # return dictionary AST.
-    # JAVA_LANGUAGE = Language("tree-sitter-java/libtree-sitter-java.{shared_library_extension}","java")
+    parser = parser_pool.get_parser(file_end)
 
-    file_language = Language(language_library)
+    with open(filename, "rb") as file:
+        source = file.read()
 
-    parser = Parser()
-    parser.set_language(file_language)
+    return parser.parse(source), source
 
-    # file_path, file_name = filename.rsplit('/', 1)
 
-    with open(filename, "rb") as file:
-        tree = parser.parse(file.read())
+def parse_source(source: bytes, file_end: str):
+    """Parse source code that is already in memory.
+
+    Args:
+        source (bytes): contents of the file
+        file_end (str): file extension without the dot. Picks the language.
+
+    Raises:
+        ValueError: Unsupported language
+
+    Returns:
+        tree_sitter.Tree: parsed tree
+    """
+    return parser_pool.get_parser(file_end).parse(source)
+
+
+def generate_ast(filename):
+    """Generate the dictionary AST of a file. See tree_to_dict()
+
+    Args:
+        filename (str): path of the file
+
+    Returns:
+        dict: dictionary AST
+    """
+    tree, source = parse_file(filename)
 
     tree_walk = tree.walk()
 
     # run recursive loop
-    return tree_to_dict(tree_walk)
+    return tree_to_dict(tree_walk, memoryview(source))
+
+
+def visit_ast(filename) -> JavaASTVisitor:
+    """Parse a file and extract tokens, imports, symbols and methods in one pass.
+
+    Does not build the dictionary AST. Can be given to JavaProgram in place of it.
+
+    Args:
+        filename (str): path of the file
+
+    Returns:
+        JavaASTVisitor: visited tree
+    """
+    tree, source = parse_file(filename)
+    return JavaASTVisitor(tree, source).visit()
+
+
+def visit_source(source: bytes, file_end: str) -> JavaASTVisitor:
+    """Same as visit_ast(), for source code already in memory.
+
+    Args:
+        source (bytes): contents of the file
+        file_end (str): file extension without the dot
+
+    Returns:
+        JavaASTVisitor: visited tree
+    """
+    return JavaASTVisitor(parse_source(source, file_end), source).visit()
 
 
 # maybe create a separate function that pulls the files from github?
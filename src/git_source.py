@@ -0,0 +1,158 @@
+"""
+git_source.py
+
+Reads files from a local clone instead of downloading them from GitHub.
+
+LocalGitSource keeps one `git cat-file --batch` process open and asks it for
+`<commit>:<path>` blobs, so every file of a PR range is read without any
+network access. It can be used in place of github_pull.FilePrefetcher (see
+processing.process_files).
+
+A file missing from the clone raises ValueError, like a failed download. If
+the git process itself is gone, every later read would fail too, so that
+raises GitProcessError instead.
+"""
+
+import os
+import subprocess
+from typing import Optional
+
+
+class GitProcessError(RuntimeError):
+    """The `git cat-file` process stopped. No file can be read anymore."""
+
+
+class LocalGitSource:
+    """Source of file contents backed by a local (bare) clone."""
+
+    def __init__(self, repo_path: str):
+        """Start reading from a clone.
+
+        Args:
+            repo_path (str): path of the clone or mirror (bare or not)
+
+        Raises:
+            ValueError: Not a git repository
+        """
+        if not os.path.isdir(repo_path):
+            raise ValueError(f"Git repository not found: {repo_path}")
+        try:
+            subprocess.run(
+                ["git", "-C", repo_path, "rev-parse", "--git-dir"],
+                check=True,
+                capture_output=True,
+            )
+        except subprocess.CalledProcessError as e:
+            raise ValueError(
+                f"Not a git repository: {repo_path}\n{e.stderr.decode(errors='replace')}"
+            )
+
+        self.repo_path = repo_path
+        self.process = subprocess.Popen(
+            ["git", "-C", repo_path, "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    @classmethod
+    def from_github(cls, repo_owner: str, repo_name: str, repo_path: str):
+        """Mirror a GitHub repository, if not done yet, and read from it.
+
+        A mirror also has refs/pull/*, so commits of PRs that were never merged are there too.
+
+        Args:
+            repo_owner (str): Repo Owner
+            repo_name (str): Repo Name
+            repo_path (str): where to keep the mirror
+
+        Returns:
+            LocalGitSource: source
+        """
+        if not os.path.exists(repo_path):
+            subprocess.run(
+                [
+                    "git",
+                    "clone",
+                    "--mirror",
+                    f"https://github.com/{repo_owner}/{repo_name}.git",
+                    repo_path,
+                ],
+                check=True,
+            )
+        return cls(repo_path)
+
+    def read(self, commit: str, file_path: str) -> bytes:
+        """Read a file as of a commit
+
+        Args:
+            commit (str): Commit
+            file_path (str): File path with file name
+
+        Raises:
+            ValueError: File or commit not in the repository.
+            GitProcessError: The git process stopped.
+
+        Returns:
+            bytes: file contents
+        """
+        if "\n" in commit or "\n" in file_path:
+            raise ValueError(f"Invalid file name {commit, file_path}")
+        if self.process.poll() is not None:
+            raise GitProcessError(
+                f"git cat-file exited with code {self.process.returncode}"
+            )
+
+        try:
+            self.process.stdin.write(f"{commit}:{file_path}\n".encode("utf-8"))
+            self.process.stdin.flush()
+        except (BrokenPipeError, ValueError) as e:
+            raise GitProcessError(f"git cat-file stopped: {e}")
+
+        # "<sha> <type> <size>", or "<object> missing" / "<object> ambiguous"
+        header = self.process.stdout.readline().decode("utf-8").rstrip("\n")
+        if not header:
+            raise GitProcessError(f"git cat-file stopped reading {commit, file_path}")
+        if header.endswith((" missing", " ambiguous")):
+            raise ValueError(f"File not in local repository {commit, file_path}")
+        sha, object_type, size = header.split(" ")
+        content = self.process.stdout.read(int(size) + 1)[:-1]  # drop the "\n"
+        if object_type != "blob":
+            raise ValueError(f"Not a file {commit, file_path}: {object_type}")
+        return content
+
+    def get(
+        self,
+        repo_owner: Optional[str],
+        repo_name: Optional[str],
+        commit: str,
+        file_path: str,
+    ) -> bytes:
+        """Same as github_pull.FilePrefetcher.get(). The repository is the local clone.
+
+        Args:
+            repo_owner (Optional[str]): Repo Owner. Not used
+            repo_name (Optional[str]): Repo Name. Not used
+            commit (str): Commit
+            file_path (str): File path with file name
+
+        Raises:
+            ValueError: File or commit not in the repository.
+            GitProcessError: The git process stopped.
+
+        Returns:
+            bytes: file contents
+        """
+        return self.read(commit, file_path)
+
+    def close(self):
+        """Stop the git process"""
+        if self.process.poll() is None:
+            self.process.stdin.close()
+            self.process.wait()
+        self.process.stdout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -1,4 +1,86 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# responses worth retrying (rate limits and server errors)
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+_session = None
+
+
+def make_session(
+    pool_size: int = 10, retries: int = 5, backoff: float = 0.5
+) -> requests.Session:
+    """Create a session that keeps connections alive and retries with backoff
+
+    Args:
+        pool_size (int, optional): connections kept open per host. Defaults to 10.
+        retries (int, optional): retries per request. Defaults to 5.
+        backoff (float, optional): backoff factor in seconds (0.5, 1, 2, 4...). Defaults to 0.5.
+
+    Returns:
+        requests.Session: session
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=RETRY_STATUS,
+        allowed_methods=["GET"],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Shared session for downloads
+
+    Returns:
+        requests.Session: session
+    """
+    global _session
+    if _session is None:
+        _session = make_session()
+    return _session
+
+
+def fetch_github_file(
+    repo_owner: str,
+    repo_name: str,
+    commit: str,
+    file_path: str,
+    session: Optional[requests.Session] = None,
+) -> bytes:
+    """Download file from github into memory
+
+    Args:
+        repo_owner (str): Repo Owner
+        repo_name (str): Repo Name
+        commit (str): Commit
+        file_path (str): File path with file name
+        session (Optional[requests.Session], optional): Session to use. Defaults to the shared one.
+
+    Raises:
+        ValueError: Network or Download Failure.
+
+    Returns:
+        bytes: file contents
+    """
+    if session is None:
+        session = get_session()
+
+    base_url = f"https://raw.githubusercontent.com/{repo_owner}/{repo_name}"
+    url = f"{base_url}/{commit}/{file_path}"
+
+    response = session.get(url)
+    if response.ok and response.status_code == 200:
+        return response.content
+    raise ValueError(f"Network Failed to Download File! Code: {response.status_code}")
 
 
 def get_github_single_file(
@@ -16,18 +98,77 @@ def get_github_single_file(
     Raises:
         ValueError: Network or Download Failure.
     """
-    base_url = f"https://raw.githubusercontent.com/{repo_owner}/{repo_name}"
-    url = f"{base_url}/{commit}/{file_path}"
+    content = fetch_github_file(repo_owner, repo_name, commit, file_path)
+    f = open(download_to, "wb")
+    f.write(content)
+    f.close()
 
-    response = requests.get(url)
-    if response.ok and response.status_code == 200:
-        f = open(download_to, "wb")
-        f.write(response.content)
-        f.close()
-    else:
-        raise ValueError(
-            f"Network Failed to Download File! Code: {response.status_code}"
-        )
+
+class FilePrefetcher:
+    """Downloads files ahead of when they are needed, a few at a time."""
+
+    def __init__(
+        self, files: Iterable[tuple[str, str, str, str]], max_in_flight: int = 8
+    ):
+        """Start downloading.
+
+        Args:
+            files (Iterable[tuple[str, str, str, str]]): (repo owner, repo name, commit, file path)
+                of each file, in the order they will be asked for.
+            max_in_flight (int, optional): Downloads running or done but not asked for yet. Defaults to 8.
+        """
+        self.files = iter(files)
+        self.max_in_flight = max_in_flight
+        self.session = make_session(max_in_flight)
+        self.executor = ThreadPoolExecutor(max_in_flight)
+        self.pending = deque()  # (file, Future), oldest first
+        self.__fill()
+
+    def __fill(self):
+        while len(self.pending) < self.max_in_flight:
+            file = next(self.files, None)
+            if file is None:
+                return
+            future = self.executor.submit(fetch_github_file, *file, self.session)
+            self.pending.append((file, future))
+
+    def get(
+        self, repo_owner: str, repo_name: str, commit: str, file_path: str
+    ) -> bytes:
+        """Wait for the next file.
+
+        Args:
+            repo_owner (str): Repo Owner
+            repo_name (str): Repo Name
+            commit (str): Commit
+            file_path (str): File path with file name
+
+        Raises:
+            ValueError: Network or Download Failure.
+
+        Returns:
+            bytes: file contents
+        """
+        if not self.pending:
+            raise ValueError("No more files to download")
+        file, future = self.pending.popleft()
+        if file != (repo_owner, repo_name, commit, file_path):
+            raise ValueError(
+                f"Files requested out of order: {file_path} instead of {file[3]}"
+            )
+        self.__fill()
+        return future.result()
+
+    def close(self):
+        """Stop downloading"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
 
 def get_github_file_content(repo_owner, repo_name, file_path, file_name):
@@ -0,0 +1,291 @@
+"""
+incremental.py
+
+Incremental analysis of files that show up again and again between commits.
+
+IncrementalAnalyzer keeps the last tree-sitter tree of each (repo, path).
+When a new version of the file comes in, the difference between the two
+versions is applied to the old tree as tree-sitter edits and the file is
+re-parsed incrementally. Class members (methods, constructors, fields...)
+that did not change reuse the tokens, imports, symbols and method invocations
+found last time; only the changed ones are visited again.
+"""
+
+from collections import OrderedDict
+import difflib
+
+from tree_sitter import Point
+
+from .ast_visitor import JavaASTVisitor
+from .generate_ast import parser_pool
+
+# Class members are the unit of reuse.
+MEMBER_TYPES = frozenset(
+    (
+        "method_declaration",
+        "constructor_declaration",
+        "compact_constructor_declaration",
+        "field_declaration",
+        "static_initializer",
+    )
+)
+
+
+def line_offsets(lines: list[bytes]) -> list[int]:
+    """Byte offset of the start of each line, plus the end of the file
+
+    Args:
+        lines (list[bytes]): lines, with line endings kept
+
+    Returns:
+        list[int]: offsets. One more than the number of lines
+    """
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line))
+    return offsets
+
+
+def line_point(lines: list[bytes], row: int, first_row: int = None) -> Point:
+    """Point at the start of a line, or at the end of the file.
+
+    Args:
+        lines (list[bytes]): lines, with line endings kept
+        row (int): line index. len(lines) for the end of the file.
+        first_row (int, optional): row the point ends up at, if different from row.
+
+    Returns:
+        Point: row and byte column
+    """
+    if first_row is None:
+        first_row = row
+    if row == len(lines) and lines and not lines[-1].endswith(b"\n"):
+        # no newline at the end of the file, the end is on the last line.
+        return Point(first_row - 1, len(lines[-1]))
+    return Point(first_row, 0)
+
+
+def source_edits(old_source: bytes, new_source: bytes) -> list[dict]:
+    """Find the edits that turn one version of a file into another.
+
+    The edits are line based and are listed last to first, so that they can be
+    given to tree_sitter.Tree.edit() in that order without adjusting offsets.
+
+    Args:
+        old_source (bytes): previous contents
+        new_source (bytes): new contents
+
+    Returns:
+        list[dict]: keyword arguments for tree_sitter.Tree.edit()
+    """
+    old_lines = old_source.splitlines(keepends=True)
+    new_lines = new_source.splitlines(keepends=True)
+    old_offsets = line_offsets(old_lines)
+    new_offsets = line_offsets(new_lines)
+
+    # skip the unchanged start and end, only diff what is in between.
+    prefix = 0
+    shortest = min(len(old_lines), len(new_lines))
+    while prefix < shortest and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < shortest - prefix and old_lines[-1 - suffix] == new_lines[-1 - suffix]
+    ):
+        suffix += 1
+
+    matcher = difflib.SequenceMatcher(
+        None,
+        old_lines[prefix : len(old_lines) - suffix],
+        new_lines[prefix : len(new_lines) - suffix],
+    )
+
+    edits = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        i1 += prefix
+        i2 += prefix
+        j1 += prefix
+        j2 += prefix
+        start_byte = old_offsets[i1]
+        new_rows = j2 - j1
+        new_end_point = line_point(new_lines, j2, i1 + new_rows)
+        edits.append(
+            {
+                "start_byte": start_byte,
+                "old_end_byte": old_offsets[i2],
+                "new_end_byte": start_byte + new_offsets[j2] - new_offsets[j1],
+                "start_point": line_point(old_lines, i1),
+                "old_end_point": line_point(old_lines, i2),
+                "new_end_point": new_end_point,
+            }
+        )
+
+    edits.reverse()
+    return edits
+
+
+class IncrementalVisitor(JavaASTVisitor):
+    """JavaASTVisitor that reuses the results of unchanged class members."""
+
+    chunk_types = MEMBER_TYPES
+
+    def __init__(
+        self,
+        tree,
+        source: bytes,
+        changed_ranges: list | None = None,
+        previous: dict | None = None,
+    ):
+        """Set up the visitor. Call visit() to run it.
+
+        Args:
+            tree (tree_sitter.Tree): Parsed tree
+            source (bytes): Source the tree was parsed from
+            changed_ranges (list[tree_sitter.Range] | None): Ranges of the tree whose structure
+                changed since the previous version. None if there is no previous version.
+            previous (dict | None): members of the previous visit (see members)
+        """
+        super().__init__(tree, source)
+        self.changed_ranges = changed_ranges or []
+        self.previous = previous or {}
+
+        # results of each member, to reuse on the next version.
+        # (flags, member text) -> (tokens, imports, symbols, methods). Lines relative to the member.
+        self.members = {}
+        self.reused = 0
+        self.revisited = 0
+
+    def __changed(self, node) -> bool:
+        for changed in self.changed_ranges:
+            if (
+                changed.start_byte < node.end_byte
+                and node.start_byte < changed.end_byte
+            ):
+                return True
+        return False
+
+    def _start_chunk(self, node, flags: int):
+        key = (flags, bytes(self.source[node.start_byte : node.end_byte]))
+        row = node.start_point[0]
+        start = node.start_byte
+
+        found = self.previous.get(key)
+        if found is not None and not self.__changed(node):
+            tokens, imports, symbols, methods = found
+            self.tokens.extend(tokens)
+            self.imports.extend(imports)
+            for symbol in symbols:
+                scope = symbol["scope"]
+                if scope is None:
+                    # scope is the class body around the member (fields)
+                    scope = (node.parent.start_byte, node.parent.end_byte)
+                else:
+                    scope = (scope[0] + start, scope[1] + start)
+                self.symbols.append(
+                    {**symbol, "line": symbol["line"] + row, "scope": scope}
+                )
+            for method in methods:
+                self.methods.append(
+                    {
+                        **method,
+                        "line": method["line"] + row,
+                        "byte": method["byte"] + start,
+                    }
+                )
+            self.members[key] = found
+            self.reused += 1
+            return False
+
+        self.revisited += 1
+        return (
+            key,
+            node,
+            len(self.tokens),
+            len(self.imports),
+            len(self.symbols),
+            len(self.methods),
+        )
+
+    def _end_chunk(self, chunk):
+        key, node, tokens, imports, symbols, methods = chunk
+        row = node.start_point[0]
+        start = node.start_byte
+        end = node.end_byte
+
+        # positions relative to the member, so they can move with it.
+        relative_symbols = []
+        for x in self.symbols[symbols:]:
+            scope = x["scope"]
+            if start <= scope[0] and scope[1] <= end:
+                scope = (scope[0] - start, scope[1] - start)
+            else:
+                scope = None
+            relative_symbols.append({**x, "line": x["line"] - row, "scope": scope})
+
+        self.members[key] = (
+            self.tokens[tokens:],
+            self.imports[imports:],
+            relative_symbols,
+            [
+                {**x, "line": x["line"] - row, "byte": x["byte"] - start}
+                for x in self.methods[methods:]
+            ],
+        )
+
+
+class IncrementalAnalyzer:
+    """Keeps the last version of each file and analyzes new versions incrementally."""
+
+    def __init__(self, max_files: int = 256):
+        """Set up analyzer
+
+        Args:
+            max_files (int, optional): Number of files to keep the last version of. Defaults to 256.
+        """
+        self.max_files = max_files
+        # key -> (tree, source, members)
+        self.files = OrderedDict()
+
+    def visit(self, key, source: bytes, file_end: str) -> IncrementalVisitor:
+        """Parse and visit a version of a file.
+
+        Args:
+            key (Hashable): identifies the file. e.g. (repo number, path)
+            source (bytes): contents of this version
+            file_end (str): file extension without the dot
+
+        Raises:
+            ValueError: Unsupported language
+
+        Returns:
+            IncrementalVisitor: visited tree
+        """
+        parser = parser_pool.get_parser(file_end)
+
+        previous = self.files.pop(key, None)
+        visitor = None
+        if previous is not None and not previous[0].root_node.has_error:
+            old_tree, old_source, members = previous
+            for edit in source_edits(old_source, source):
+                old_tree.edit(**edit)
+            tree = parser.parse(source, old_tree)
+
+            # Error recovery can differ from a full parse. Only trust clean trees.
+            if not tree.root_node.has_error:
+                visitor = IncrementalVisitor(
+                    tree, source, old_tree.changed_ranges(tree), members
+                )
+
+        if visitor is None:
+            tree = parser.parse(source)
+            visitor = IncrementalVisitor(tree, source)
+
+        visitor.visit()
+
+        self.files[key] = (tree, source, visitor.members)
+        while len(self.files) > self.max_files:
+            self.files.popitem(last=False)
+
+        return visitor
@@ -6,6 +6,8 @@ By Benjamin Carter, Dylan Johnson, and Hunter Jenkins
 This program constitutes the main of the CoreEngine
 """
 
+from .ast_visitor import JavaASTVisitor
+from .scope_index import ScopeIndex
 from .symbol_table import SymbolTable
 from . import tokens as tokenExtract
 
@@ -15,11 +17,11 @@ from . import tokens as tokenExtract
 class JavaProgram:
     """Class represents a Java AST Tree."""
 
-    def __init__(self, javaAST: dict):
+    def __init__(self, javaAST: dict | JavaASTVisitor):
         """Set up the class. Requires AST.
 
         Args:
-            javaAST (dict): AST
+            javaAST (dict | JavaASTVisitor): Dictionary AST or a tree visitor (see generate_ast.visit_ast)
         """
         self.ast = javaAST
 
@@ -67,8 +69,18 @@ class JavaProgram:
 
         ast = self.ast
 
-        tokens = set(tokenExtract.pullToken(ast))
-        imports = set(tokenExtract.pullImport(ast))
+        if isinstance(ast, JavaASTVisitor):
+            ast.visit()
+            tokens = set(ast.tokens)
+            imports = set(ast.imports)
+        else:
+            tokens = set()
+            imports = set()
+            for kind, text in tokenExtract.pullTokensAndImports(ast):
+                if kind == tokenExtract.TOKEN:
+                    tokens.add(text)
+                elif kind == tokenExtract.IMPORT:
+                    imports.add(text)
 
         result = {}
         importItems = {}
@@ -94,6 +106,12 @@ class JavaProgram:
 
     def populateSymbolTable(self):
         """Pre-generate symbols and methods"""
+        if isinstance(self.ast, JavaASTVisitor):
+            self.ast.visit()
+            self.symbols = self.ast.symbols
+            self.methods = self.ast.methods
+            return
+
         pgrmTables = SymbolTable(self.ast)
         self.symbols = pgrmTables.findSymbols()  # gets all classes with variable names.
         self.methods = pgrmTables.getMethods()  # gets all methods from variable name.
@@ -113,39 +131,24 @@ class JavaProgram:
         if not (self.completeTable is None):
             return self.completeTable
 
+        # index symbols by class, and each method invocation by the declaration
+        # of its receiver that is in scope where it is called.
+        symbolsByClass = {}
+        for variable in self.symbols:
+            symbolsByClass.setdefault(variable["class"], []).append(variable)
+        scopes = ScopeIndex(self.symbols)
+        methodsBySymbol = {}
+        for method in self.methods:
+            variable = scopes.resolve(method["name"], method["byte"])
+            if variable is not None:
+                methodsBySymbol.setdefault(id(variable), []).append(method)
+
         out = {}
         for className in self.classes:
             out[className] = {"full": self.classes[className], "varlist": []}
 
-            for num, variable in enumerate(self.symbols):
-                if variable["class"] != className:
-                    continue
-                variableName = variable["name"]
-                lineNumber = variable["line"]
-
-                nextLine = -1
-                for vr in self.symbols[num + 1 :]:
-                    # see if there are any more!
-                    if vr["class"] != className:
-                        continue
-                    # if(variable["line"] > lineNumber):
-                    nextLine = vr["line"] - 1
-                    break  # CHECK! We may need to move this back.
-
-                methodOut = []
-                for method in self.methods:
-                    # check to see if it is referencing the same variable
-                    if method["name"] != variableName:
-                        continue
-
-                    # TODO: instead of comparing line numbers, compare depth in AST tree.
-                    # print(className, method["name"], lineNumber, nextLine, method["line"])
-                    # if(method["line"] < lineNumber):
-                    #     continue
-                    # if(nextLine != -1 and method["line"] > nextLine):
-                    #     continue
-                    # print("Append!")
-                    methodOut.append(method)
+            for variable in symbolsByClass.get(className, []):
+                methodOut = methodsBySymbol.get(id(variable), [])
 
                 out[className]["varlist"].append(
                     {"variable": variable, "methods": methodOut}
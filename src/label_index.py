@@ -0,0 +1,515 @@
+"""
+label_index.py
+
+Nearest label lookup for clean_domains / clean_subdomains (ai_taxonomy).
+
+Finding the label closest to a hallucinated AI answer used to run the spaCy
+pipeline on every candidate label, on every call. LabelVectors computes the
+vector of each "label: description" text once and keeps them, normalized, in
+a .npz file next to the label files. A LabelIndex is the matrix of one label
+set; matching an answer is one matrix-vector product (cosine similarity)
+instead of hundreds of pipeline runs.
+
+Most wrong answers are not that wrong ("databases (db)", "Cloud-Scalability ",
+"Integration: combining..."), so LabelIndex first tries normalized keys and
+near misses, and vectors only come into play when those fail. The same wrong
+answers keep coming back, so LabelFixCache remembers how each one was fixed,
+in ai_result_backup.db.
+"""
+
+import atexit
+from collections import Counter, OrderedDict
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Callable
+
+import numpy as np
+
+# Part of LabelIndex.fingerprint. Bump it when find_key() / find_close() change, so the fixes
+# LabelFixCache keeps from the old rules are not used anymore.
+MATCHING_VERSION = 2
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale vectors (rows) to length 1. Zero vectors stay zero.
+
+    Args:
+        vectors (np.ndarray): one vector per row
+
+    Returns:
+        np.ndarray: normalized float32 vectors
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+def label_key(text: str) -> str:
+    """Normalized form of a label: lowercase words, without punctuation or extra spaces.
+
+    Args:
+        text (str): label, or an AI answer
+
+    Returns:
+        str: key. "Databases (DB) " -> "databases db"
+    """
+    return " ".join(re.findall(r"[a-z0-9]+", text.lower()))
+
+
+def edit_distance(a: str, b: str, bound: int) -> int:
+    """Levenshtein distance, if at most bound.
+
+    Args:
+        a (str): text
+        b (str): text
+        bound (int): largest distance of interest
+
+    Returns:
+        int: distance, or bound + 1 if it is larger than bound
+    """
+    if abs(len(a) - len(b)) > bound:
+        return bound + 1
+    previous = list(range(len(b) + 1))
+    for i, char in enumerate(a, 1):
+        current = [i]
+        for j, other in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char != other),
+                )
+            )
+        if min(current) > bound:
+            return bound + 1
+        previous = current
+    return previous[-1]
+
+
+def bigrams(text: str) -> Counter:
+    """Pairs of consecutive characters of a text, with counts
+
+    Args:
+        text (str): text
+
+    Returns:
+        Counter: bigram -> count
+    """
+    return Counter(text[num : num + 2] for num in range(len(text) - 1))
+
+
+class LabelIndex:
+    """One label set: normalized keys for cheap lookups, vectors for cosine similarity."""
+
+    def __init__(
+        self,
+        labels: list[str],
+        texts: list[str],
+        vectors: "LabelVectors",
+        fingerprint: str = "",
+    ):
+        """Make index. Vectors are looked up on the first similarity query.
+
+        Args:
+            labels (list[str]): labels
+            texts (list[str]): text of each label to compare answers with
+            vectors (LabelVectors): where the vectors of texts come from
+            fingerprint (str, optional): identifies the label set and vectors, see LabelFixCache
+        """
+        self.labels = labels
+        self.texts = texts
+        self.vectors = vectors
+        self.fingerprint = fingerprint
+        self.matrix = None
+        # made by find_close() when first needed
+        self.prefixes = None
+        self.grams = None
+
+        # key -> label. A label is also found without its "Domain-" prefix, unless that is ambiguous.
+        self.keys = {}
+        suffixes = {}
+        for label in labels:
+            self.keys.setdefault(label_key(label), label)
+            if "-" in label:
+                suffixes.setdefault(label_key(label.split("-", 1)[1]), []).append(label)
+        for key, found in suffixes.items():
+            if len(found) == 1:
+                self.keys.setdefault(key, found[0])
+
+    def __candidates(self, text: str) -> list[str]:
+        """Keys an answer could be: as is, without a trailing description, without a domain
+        prefix, without what is in parentheses"""
+        heads = [text]
+        for separator in ("\n", " - ", ": "):
+            if separator in text:
+                heads.append(text.split(separator, 1)[0])
+        heads += [re.sub(r"\(.*?\)", " ", head) for head in heads if "(" in head]
+        candidates = []
+        for head in heads:
+            candidates.append(label_key(head))
+            if "-" in head:
+                candidates.append(label_key(head.split("-", 1)[1]))
+        return [key for key in candidates if key]
+
+    def find_key(self, text: str) -> str | None:
+        """Label whose normalized key is the answer's. Case, whitespace, punctuation, a
+        "Domain-" prefix, an abbreviation in parentheses or a trailing description don't matter.
+
+        Args:
+            text (str): AI answer
+
+        Returns:
+            str | None: label, None if not found
+        """
+        for key in self.__candidates(text):
+            found = self.keys.get(key)
+            if found is not None:
+                return found
+        return None
+
+    def find_close(self, text: str) -> str | None:
+        """Label that shares all but the last word with the answer, or the only label within a
+        few typos of it.
+
+        The shared words must be at least two ("Test Framework" is not "Test"), and the start of
+        no other label ("Data Processing Tools" when there are "Data Processing" and "Data
+        Processing Pipeline").
+
+        Args:
+            text (str): AI answer
+
+        Returns:
+            str | None: label, None if not found
+        """
+        candidates = self.__candidates(text)
+        if self.prefixes is None:
+            self.__make_prefixes()
+
+        # the answer, or the answer without its last word, starts one label and one only
+        for key in candidates:
+            words = key.split(" ")
+            for end in (len(words), len(words) - 1):
+                found = self.prefixes.get(" ".join(words[:end])) if end > 1 else None
+                if found is None or len({label for label, _ in found}) > 1:
+                    continue
+                label, extra_words = min(found, key=lambda entry: entry[1])
+                if extra_words <= 1:
+                    return label
+
+        # one typo per 6 characters
+        for key in candidates:
+            bound = max(1, len(key) // 6)
+            key_grams = bigrams(key)
+            best = None
+            best_distance = bound + 1
+            tie = False
+            for other_key, label in self.keys.items():
+                if abs(len(key) - len(other_key)) > bound:
+                    continue
+                # each edit changes at most 2 bigrams: skip keys that share too few
+                shared = sum((key_grams & self.grams[other_key]).values())
+                if shared < max(len(key), len(other_key)) - 1 - 2 * bound:
+                    continue
+                distance = edit_distance(key, other_key, bound)
+                if distance < best_distance:
+                    best, best_distance, tie = label, distance, False
+                elif distance == best_distance and distance <= bound and label != best:
+                    tie = True
+            if best is not None and not tie:
+                return best
+        return None
+
+    def __make_prefixes(self):
+        """prefixes: first two or more words of a key -> [(label, words of the key after them)]"""
+        self.prefixes = {}
+        self.grams = {}
+        for key in self.keys:
+            self.grams[key] = bigrams(key)
+        for label in self.labels:
+            words = label_key(label).split(" ")
+            for end in range(2, len(words) + 1):
+                self.prefixes.setdefault(" ".join(words[:end]), []).append(
+                    (label, len(words) - end)
+                )
+
+    def best(self, vector: np.ndarray) -> str | None:
+        """Label most similar to a vector.
+
+        Args:
+            vector (np.ndarray): normalized vector
+
+        Returns:
+            str | None: first label with the highest similarity. None if no similarity is positive.
+        """
+        if not self.labels:
+            return None
+        if self.matrix is None:
+            self.matrix = self.vectors.lookup(self.texts)
+        similarities = self.matrix @ vector
+        num = int(np.argmax(similarities))
+        if similarities[num] > 0.0:
+            return self.labels[num]
+        return None
+
+
+class LabelVectors:
+    """Vectors of label texts, computed once and persisted in a .npz file."""
+
+    def __init__(
+        self,
+        path: str,
+        vectorize: Callable[[list[str]], np.ndarray],
+        model: str,
+        max_indexes: int = 256,
+    ):
+        """Load the stored vectors, if they were made by the same model.
+
+        Args:
+            path (str): .npz file, e.g. "./output/label_vectors.npz"
+            vectorize (Callable[[list[str]], np.ndarray]): texts -> one vector per row
+            model (str): name of the vectorizer. Vectors of another model are not reused.
+            max_indexes (int, optional): label sets kept in memory. Defaults to 256.
+        """
+        self.path = path
+        self.vectorize = vectorize
+        self.model = model
+        self.max_indexes = max_indexes
+
+        self.rows = {}  # text -> row of self.vectors
+        self.vectors = None
+        # (label items, lowercase) -> LabelIndex
+        self.indexes = OrderedDict()
+
+        if os.path.exists(path):
+            with np.load(path, allow_pickle=False) as stored:
+                if str(stored["model"]) == model:
+                    self.rows = {
+                        str(text): num for num, text in enumerate(stored["texts"])
+                    }
+                    self.vectors = stored["vectors"]
+
+    def save(self):
+        """Write the vectors to the .npz file"""
+        texts = sorted(self.rows, key=self.rows.get)
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp = self.path + ".tmp.npz"
+        np.savez(
+            temp,
+            model=np.array(self.model),
+            texts=np.array(texts, dtype=str),
+            vectors=self.vectors,
+        )
+        os.replace(temp, self.path)
+
+    def lookup(self, texts: list[str]) -> np.ndarray:
+        """Normalized vectors of texts. Texts seen for the first time are vectorized and stored.
+
+        Args:
+            texts (list[str]): texts
+
+        Returns:
+            np.ndarray: one row per text
+        """
+        new = list(dict.fromkeys(text for text in texts if text not in self.rows))
+        if new:
+            added = normalize(self.vectorize(new))
+            if self.vectors is None or len(self.vectors) == 0:
+                self.vectors = added
+            else:
+                self.vectors = np.concatenate((self.vectors, added))
+            for text in new:
+                self.rows[text] = len(self.rows)
+            if os.path.isdir(os.path.dirname(self.path) or "."):
+                self.save()
+
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        return self.vectors[[self.rows[text] for text in texts]]
+
+    def query(self, text: str) -> np.ndarray:
+        """Normalized vector of a text, without storing it (AI answers are rarely seen twice).
+
+        Args:
+            text (str): text
+
+        Returns:
+            np.ndarray: vector
+        """
+        return normalize(self.vectorize([text]))[0]
+
+    def index(self, labels: dict[str, str], lowercase: bool = False) -> LabelIndex:
+        """Index of a label set. Texts are "label: description", as the AI is asked for.
+
+        Args:
+            labels (dict[str, str]): label -> description
+            lowercase (bool, optional): compare lowercased texts. Defaults to False.
+
+        Returns:
+            LabelIndex: index
+        """
+        key = (tuple(labels.items()), lowercase)
+        found = self.indexes.get(key)
+        if found is not None:
+            self.indexes.move_to_end(key)
+            return found
+
+        if lowercase:
+            texts = [
+                f"{label.lower()}: {desc.lower()}" for label, desc in labels.items()
+            ]
+        else:
+            texts = [f"{label}: {desc}" for label, desc in labels.items()]
+        fingerprint = hashlib.sha1(
+            json.dumps([texts, list(labels), self.model, MATCHING_VERSION]).encode(
+                "utf-8"
+            )
+        ).hexdigest()
+        found = LabelIndex(list(labels), texts, self, fingerprint)
+
+        self.indexes[key] = found
+        while len(self.indexes) > self.max_indexes:
+            self.indexes.popitem(last=False)
+        return found
+
+
+# table of LabelFixCache. Also created with the other ai_result_backup.db tables, see database_init.
+LABEL_FIXES_DDL = """CREATE TABLE IF NOT EXISTS "label_fixes" (
+    "answer"	TEXT,
+    "fingerprint"	TEXT,
+    "label"	TEXT,
+    "used"	REAL,
+    PRIMARY KEY("answer", "fingerprint")
+)"""
+
+
+class LabelFixCache:
+    """Bounded LRU of fixed labels: (answer, label set fingerprint) -> label.
+
+    Kept in the label_fixes table of a database (ai_result_backup.db) so it survives restarts.
+    Nothing is read or written before the first lookup.
+    """
+
+    def __init__(self, path: str | None, max_entries: int = 10000):
+        """Set up cache.
+
+        Args:
+            path (str | None): sqlite database. None, or a folder that does not exist, to keep
+                the cache in memory only.
+            max_entries (int, optional): fixes kept. Defaults to 10000.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self.conn = None
+        self.entries = None  # (answer, fingerprint) -> label. Most recently used last.
+        self.touched = {}  # (answer, fingerprint) -> time of use, not written yet
+        self.lock = threading.Lock()
+
+    def __open(self):
+        self.entries = OrderedDict()
+        if self.path is None or not os.path.isdir(os.path.dirname(self.path) or "."):
+            return
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute(LABEL_FIXES_DDL)
+        rows = self.conn.execute(
+            "SELECT answer, fingerprint, label FROM label_fixes ORDER BY used DESC LIMIT ?",
+            (self.max_entries,),
+        ).fetchall()
+        for answer, fingerprint, label in reversed(rows):
+            self.entries[(answer, fingerprint)] = label
+        atexit.register(self.flush)
+
+    def get(
+        self, answer: str, fingerprint: str, fallback: str | None = None
+    ) -> str | None:
+        """Label an answer was fixed to before.
+
+        Args:
+            answer (str): AI answer
+            fingerprint (str): LabelIndex.fingerprint of the label set
+            fallback (str | None, optional): other answer to look up if answer is not cached.
+                Counts as one lookup in stats().
+
+        Returns:
+            str | None: label, None if not cached
+        """
+        key = (answer, fingerprint)
+        with self.lock:
+            if self.entries is None:
+                self.__open()
+            label = self.entries.get(key)
+            if label is None and fallback is not None:
+                key = (fallback, fingerprint)
+                label = self.entries.get(key)
+            if label is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(key)
+            self.touched[key] = time.time()
+            return label
+
+    def put(self, answer: str, fingerprint: str, label: str):
+        """Remember a fix, and write it (and the pending uses) to the database.
+
+        Args:
+            answer (str): AI answer
+            fingerprint (str): LabelIndex.fingerprint of the label set
+            label (str): label the answer was fixed to
+        """
+        key = (answer, fingerprint)
+        with self.lock:
+            if self.entries is None:
+                self.__open()
+            self.entries[key] = label
+            self.entries.move_to_end(key)
+            self.touched[key] = time.time()
+
+            evicted = []
+            while len(self.entries) > self.max_entries:
+                evicted.append(self.entries.popitem(last=False)[0])
+                self.touched.pop(evicted[-1], None)
+            if self.conn is not None and evicted:
+                self.conn.executemany(
+                    "DELETE FROM label_fixes WHERE answer = ? AND fingerprint = ?",
+                    evicted,
+                )
+            self.__flush()
+
+    def __flush(self):
+        if self.conn is not None and self.touched:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO label_fixes (answer, fingerprint, label, used) VALUES (?,?,?,?)",
+                (
+                    (answer, fingerprint, self.entries[(answer, fingerprint)], used)
+                    for (answer, fingerprint), used in self.touched.items()
+                ),
+            )
+            self.conn.commit()
+        self.touched = {}
+
+    def flush(self):
+        """Write the recent uses of cached fixes (kept in memory until the next put())."""
+        with self.lock:
+            self.__flush()
+
+    def stats(self) -> dict[str, float]:
+        """Hit and miss counters since the start.
+
+        Returns:
+            dict[str, float]: hits, misses, hit_rate
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -5,27 +5,156 @@
 #
 # This program constitutes the main of the CoreEngine
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import fnmatch
+import hashlib
 import os
 import sys
-from typing import Optional
+from typing import Iterable, Optional
 import tqdm
-from . import github_pull
+from . import ai_taxonomy, github_pull
+from .ai_batch import BatchClassifier
 from .ai_taxonomy import AICachedClassifier, load_data
+from .array_ast import ArrayAST
+from .ast_visitor import JavaASTVisitor
 from .database_manager import DatabaseManager, Repository
-from .generate_ast import generate_ast
+from .generate_ast import visit_source
+from .git_source import GitProcessError, LocalGitSource
+from .incremental import IncrementalAnalyzer
 from .java_ast import JavaProgram
 
-
 RED_COLOR = "\033[1m\033[38;5;9m"
 YELLOW_COLOR = "\033[1m\033[38;5;11m"
 RESET_COLOR = "\033[0m"
 
 
+def blob_hash(source: bytes) -> str:
+    """Hash file contents. Same as git's blob hash (git hash-object)
+
+    Args:
+        source (bytes): file contents
+
+    Returns:
+        str: hex digest
+    """
+    digest = hashlib.sha1(b"blob %d\0" % len(source))
+    digest.update(source)
+    return digest.hexdigest()
+
+
+def skip_status(
+    file: str,
+    extensions: Iterable[str] = (".java",),
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> Optional[str]:
+    """Check if a file should be analyzed.
+
+    Args:
+        file (str): file path
+        extensions (Iterable[str], default=(".java",)): extensions of the languages to analyze
+        include (Optional[Iterable[str]], default=None): globs. If given, the path must match one.
+        exclude (Optional[Iterable[str]], default=None): globs. The path must not match any.
+
+    Returns:
+        str | None: status to mark the file with if it is skipped. None to analyze it.
+    """
+    if os.path.splitext(file)[1] not in extensions:
+        return "Time Save Not Java"
+    if include is not None and not any(fnmatch(file, glob) for glob in include):
+        return "Excluded"
+    if exclude is not None and any(fnmatch(file, glob) for glob in exclude):
+        return "Excluded"
+    return None
+
+
+def ast_cache_file(
+    ast_cache: str, repo: Repository, commit_hash: str, file: str
+) -> str:
+    """Where the AST of a file is saved in the AST cache
+
+    Args:
+        ast_cache (str): AST cache directory
+        repo (Repository): Repository of the file
+        commit_hash (str): commit
+        file (str): file path
+
+    Returns:
+        str: path of the .npz file
+    """
+    return os.path.join(ast_cache, repo.owner, repo.name, commit_hash, file + ".npz")
+
+
+def extract_apis(
+    source: bytes,
+    file_end: str,
+    ast_file: Optional[str] = None,
+    incremental: Optional[IncrementalAnalyzer] = None,
+    key=None,
+) -> tuple[Optional[str], set, list]:
+    """Parse a file and find the classes and functions it uses.
+
+    Only needs the source, so it can run in a worker process.
+
+    Args:
+        source (bytes): contents of the file
+        file_end (str): file extension without the dot
+        ast_file (Optional[str], default=None): Saved AST to use, or to create if it does not exist.
+        incremental (Optional[IncrementalAnalyzer], default=None): Analyzer to parse with. Main process only.
+        key (Hashable, default=None): File key for the incremental analyzer.
+
+    Returns:
+        str | None: status to mark the file with if it failed. None if it worked.
+        set: classes (full names)
+        list: functions (class::function)
+    """
+    # generated AST.
+    try:
+        if incremental is not None:
+            result = incremental.visit(key, source, file_end)
+            if ast_file is not None and not os.path.exists(ast_file):
+                os.makedirs(os.path.dirname(ast_file), exist_ok=True)
+                ArrayAST.from_tree(result.tree, source).save(ast_file)
+        elif ast_file is not None:
+            if os.path.exists(ast_file):
+                saved_ast = ArrayAST.load(ast_file)
+            else:
+                saved_ast = ArrayAST.from_source(source, file_end)
+                os.makedirs(os.path.dirname(ast_file), exist_ok=True)
+                saved_ast.save(ast_file)
+            result = JavaASTVisitor(saved_ast, saved_ast.source)
+        else:
+            result = visit_source(source, file_end)
+    except:
+        return "unsupported lang", set(), []
+
+    # parse AST
+    pgrm = JavaProgram(result)
+    try:
+        plain_classes = pgrm.getClasses()  # converts all class names to full names.
+        functions = list(pgrm.getFunctions().keys())
+    except:
+        return "ERROR in Java Parsing", set(), []
+
+    return None, plain_classes, functions
+
+
 def process_files(
     ai: AICachedClassifier,
     db: DatabaseManager,
     pr=None,
     repo: Optional[Repository] = None,
+    ast_cache: Optional[str] = None,
+    incremental: Optional[IncrementalAnalyzer] = None,
+    workers: int = 1,
+    downloads: int = 8,
+    save_downloads: bool = False,
+    git_repo: Optional[str] = None,
+    classify: bool = True,
+    extensions: Iterable[str] = (".java",),
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
 ):
     """Process files that have not been processed yet
 
@@ -34,108 +163,264 @@ def process_files(
         db (DatabaseManager): Database Engine
         pr (Optional[int], default=None): Set to pr # for processing files from a specific PR # (None for all.)
         repo (Optional[Repository], default=None): Set to repo # for processing files from a specific repo.
+        ast_cache (Optional[str], default=None): Directory to keep parsed ASTs in (see ArrayAST).
+            Files with a saved AST are not downloaded or parsed again. None to disable.
+        incremental (Optional[IncrementalAnalyzer], default=None): Re-parse new versions of files
+            incrementally from the previous version seen. Pass the same analyzer to every call. None to disable.
+        workers (int, default=1): Number of processes parsing files. Classification and database
+            writes stay in this process. Can't be used with incremental.
+        downloads (int, default=8): Number of files downloaded ahead of time, while others are parsed.
+        save_downloads (bool, default=False): Write downloaded files to output/downloaded_files
+            before parsing them, for debugging. By default they are only kept in memory.
+        git_repo (Optional[str], default=None): Local clone or mirror of repo to read
+            files from, instead of downloading them from GitHub. See LocalGitSource.
+        classify (bool, default=True): Classify the new classes and functions once all files are
+            processed. False to leave them for a later classify_pending() call.
+        extensions (Iterable[str], default=(".java",)): extensions of the files to analyze.
+        include (Optional[Iterable[str]], default=None): only analyze paths matching one of these globs.
+        exclude (Optional[Iterable[str]], default=None): don't analyze paths matching one of these globs.
+            Skipped files are marked in bulk before anything is downloaded.
     """
     if repo is None and pr is not None:
         raise NotImplementedError(
             "If specifying PR #, please indicate Repository # too"
         )
+    if repo is None and git_repo is not None:
+        # the clone only has the files of its own repository
+        raise ValueError("Reading from git_repo requires the Repository it clones")
+    if workers > 1 and incremental is not None:
+        raise ValueError("Incremental analysis only works with workers=1")
 
-    files = db.get_unprocessed_files(pr, repo)
+    all_files = db.get_unprocessed_files(pr, repo)
     # later change to process files from one PR! db.get_unprocessed_files(pr)
     files_done = set()
 
-    # Go file by file
-    for fileElement in tqdm.tqdm(files, smoothing=0.05, leave=False):
-        # extract file path and commit_hash
-        file = fileElement[0]
-        commit_hash = fileElement[1]
-        spc_repo = fileElement[2]
-
+    # Only keep the files to analyze. Mark the others all at once.
+    files = []
+    skipped = {}  # status -> [(file, commit_hash, repo)]
+    for file, commit_hash, spc_repo in all_files:
         # verify if there are no repeat files!
         if (file, commit_hash) in files_done:
             print(file, commit_hash)
             raise ValueError("Repeat! Fails assert! Log Bug Report!")
         files_done.add((file, commit_hash))
 
-        # download from GitHub
-        saveLocation = db.manageDownload(file, commit_hash, spc_repo)
+        status = skip_status(file, extensions, include, exclude)
+        if status is None:
+            files.append((file, commit_hash, spc_repo))
+        else:
+            skipped.setdefault(status, []).append((file, commit_hash, spc_repo))
+    for status, skipped_files in skipped.items():
+        db.mark_files_as_processed(skipped_files, status)
+    db.save()
+
+    # answer classification cache lookups from memory
+    db.preload_classifications()
 
-        # quick hack to skip all files except java files to save time!
-        name, ending = os.path.splitext(file)
-        if ending != ".java":
-            db.mark_file_as_processed(
+    file_source = None
+    pool = None
+    pending = deque()  # files being parsed by the pool, oldest first
+    in_flight = {}  # content hash -> Future, for copies of a file still being parsed
+
+    # on errors too: stop the workers and the downloads or git process
+    try:
+        if git_repo is not None:
+            file_source = LocalGitSource(git_repo)
+        else:
+            # download the files that will be needed in the background, in order.
+            to_download = []
+            for file, commit_hash, spc_repo in files:
+                if ast_cache is not None and os.path.exists(
+                    ast_cache_file(ast_cache, spc_repo, commit_hash, file)
+                ):
+                    continue
+                to_download.append((spc_repo.owner, spc_repo.name, commit_hash, file))
+            file_source = github_pull.FilePrefetcher(to_download, downloads)
+
+        pool = ProcessPoolExecutor(workers) if workers > 1 else None
+
+        # Go file by file
+        for fileElement in tqdm.tqdm(files, smoothing=0.05, leave=False):
+            # extract file path and commit_hash
+            file = fileElement[0]
+            commit_hash = fileElement[1]
+            spc_repo = fileElement[2]
+
+            name, ending = os.path.splitext(file)
+
+            # reuse the saved AST, if there is one.
+            source = None
+            ast_file = None
+            saveLocation = None
+            if ast_cache is not None:
+                ast_file = ast_cache_file(ast_cache, spc_repo, commit_hash, file)
+                if os.path.exists(ast_file):
+                    source = ArrayAST.load_source(ast_file)
+
+            on_disk = False  # saved to saveLocation
+            if source is None:
+                # download from GitHub
+                saveLocation = db.manageDownload(file, commit_hash, spc_repo)
+                try:
+                    source = file_source.get(
+                        spc_repo.owner, spc_repo.name, commit_hash, file
+                    )
+                    if save_downloads:
+                        with open(saveLocation, "wb") as f:
+                            f.write(source)
+                        on_disk = True
+                except GitProcessError:
+                    # not this file's fault, don't mark it.
+                    raise
+                except Exception as e:
+                    print(
+                        f"\t{YELLOW_COLOR}Error downloading file {commit_hash, file}. Likely requires a different commit. Please check. \n Error: {e}{RESET_COLOR}",
+                        file=sys.stderr,
+                    )
+                    db.queue_file_processed(
+                        file, commit_hash, status="Error downloading", repo=spc_repo
+                    )
+                    continue
+                # print("\tDownloaded: ", commit_hash, file)
+
+            # Same contents were already analyzed (likely under another commit).
+            # Everything in it is classified already, only register it for this file.
+            content_hash = blob_hash(source)
+            cached = db.cache_blob_extraction(content_hash)
+            if cached is not None:
+                plain_classes, functions = cached
+                db.queue_file_apis(
+                    file, commit_hash, plain_classes, functions, spc_repo
+                )
+                db.queue_file_processed(file, commit_hash, spc_repo)
+                if on_disk:
+                    os.unlink(saveLocation)
+                continue
+
+            file_info = (
                 file,
                 commit_hash,
-                repo=spc_repo,
-                status="Time Save Not Java",
-            )
-            continue
-        try:
-            github_pull.get_github_single_file(
-                spc_repo.owner, spc_repo.name, commit_hash, file, saveLocation
+                spc_repo,
+                saveLocation,
+                on_disk,
+                content_hash,
             )
-        except Exception as e:
-            print(
-                f"\t{YELLOW_COLOR}Error downloading file {commit_hash, file}. Likely requires a different commit. Please check. \n Error: {e}{RESET_COLOR}",
-                file=sys.stderr,
-            )
-            db.mark_file_as_processed(
-                file, commit_hash, status="Error downloading", repo=spc_repo
-            )
-            continue
-        # print("\tDownloaded: ", commit_hash, file)
-
-        # generated AST.
-        try:
-            result = generate_ast(saveLocation)
-        except:
-            db.mark_file_as_processed(
-                file, commit_hash, status="unsupported lang", repo=spc_repo
-            )
-            continue
-
-        # parse AST
-        pgrm = JavaProgram(result)
-        try:
-            plain_classes = pgrm.getClasses()  # converts all class names to full names.
-            functions = pgrm.getFunctions().keys()
-        except:
-            print(
-                f"\t{YELLOW_COLOR}Can't parse Java Program {saveLocation}. {RESET_COLOR}",
-                file=sys.stderr,
-            )
-            db.mark_file_as_processed(
-                file, commit_hash, status="ERROR in Java Parsing", repo=spc_repo
-            )
-            continue
-
-        # classify api's
-        local_domain_cache = {}
-        for class_name in plain_classes:
-            domain = ai.classify_API(class_name)  # automatically saves it to cache.
-            local_domain_cache[class_name] = domain
-            db.mark_file_api_use(file, commit_hash, class_name, spc_repo)
-        db.save()
-
-        # classify functions
-        for function in functions:
-            tokens = function.split("::")
-            class_name = tokens[0]
-            if class_name == "Unknown":
+            if pool is None:
+                extracted = extract_apis(
+                    source, ending[1:], ast_file, incremental, (spc_repo.num, file)
+                )
+                __store_file(db, file_info, extracted)
                 continue
-            function_name = tokens[1]
-
-            class_domain = local_domain_cache[class_name]
-            ai.classify_function(
-                class_name, function_name, class_domain
-            )  # automatically saves it to cache. Save for later.
-            db.mark_file_function_use(
-                file, commit_hash, class_name, function_name, spc_repo
-            )
 
-        # mark as processed and continue
-        db.mark_file_as_processed(file, commit_hash, spc_repo)
-        os.unlink(saveLocation)
-        db.save()
+            # parse in the pool, store results in order as they are done.
+            future = in_flight.get(content_hash)
+            if future is None:
+                future = pool.submit(extract_apis, source, ending[1:], ast_file)
+                in_flight[content_hash] = future
+            pending.append((file_info, future))
+
+            while len(pending) > workers * 2 or (pending and pending[0][1].done()):
+                __finish_pending(db, pending, in_flight)
+
+        while pending:
+            __finish_pending(db, pending, in_flight)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if file_source is not None:
+            file_source.close()
+
+    db.flush()
+
+    if classify:
+        classify_pending(ai, db)
+
+
+def classify_pending(ai: AICachedClassifier, db: DatabaseManager, batch: bool = False):
+    """Classify every class and function used by a processed file that is not classified yet.
+
+    Each class and function is classified once, no matter how many files use it. Files
+    are registered before this runs, so an interrupted run picks up where it stopped.
+
+    Args:
+        ai (AICachedClassifier): AI Classifier Engine
+        db (DatabaseManager): Database Engine
+        batch (bool, optional): go through the OpenAI Batch API (see ai_batch). Defaults to False.
+    """
+    classes, functions = db.get_unclassified_apis()
+    if not classes and not functions:
+        return
+    print(f"\tClassifying {len(classes)} classes and {len(functions)} functions")
+
+    if batch and not ai_taxonomy.USE_DEBUG_VALUES:
+        BatchClassifier(ai, db).run()
+        return
+
+    def save(num: int, classification: str):
+        progress.update(1)
+        # new AI results cost money. Save them right away.
+        if db.cache_update:
+            db.save()
+
+    # requests run concurrently, see AIClassifier.scheduler
+    with tqdm.tqdm(total=len(classes), smoothing=0.05, leave=False) as progress:
+        ai.classify_APIs(classes, save)
+
+    function_classes = sorted(set(class_name for class_name, _ in functions))
+    class_domains = dict(zip(function_classes, ai.classify_APIs(function_classes)))
+    with tqdm.tqdm(total=len(functions), smoothing=0.05, leave=False) as progress:
+        ai.classify_functions(
+            [
+                (class_name, function_name, class_domains[class_name])
+                for class_name, function_name in functions
+            ],
+            save,
+        )
 
     db.save()
+
+
+def __finish_pending(db: DatabaseManager, pending: deque, in_flight: dict):
+    """Wait for the oldest file in the pool and store it.
+
+    Args:
+        db (DatabaseManager): Database Engine
+        pending (deque): (file info, Future) of files in the pool, oldest first
+        in_flight (dict[str, Future]): content hash -> Future
+    """
+    file_info, future = pending.popleft()
+    content_hash = file_info[5]
+    if in_flight.get(content_hash) is future and not any(
+        other is future for _, other in pending
+    ):
+        del in_flight[content_hash]
+    __store_file(db, file_info, future.result())
+
+
+def __store_file(db: DatabaseManager, file_info: tuple, extracted: tuple):
+    """Save the APIs of a parsed file. They are classified later, see classify_pending().
+
+    Args:
+        db (DatabaseManager): Database Engine
+        file_info (tuple): file, commit_hash, repo, download location, saved to disk, content hash
+        extracted (tuple): output of extract_apis()
+    """
+    file, commit_hash, spc_repo, saveLocation, on_disk, content_hash = file_info
+    status, plain_classes, functions = extracted
+
+    if status == "ERROR in Java Parsing":
+        print(
+            f"\t{YELLOW_COLOR}Can't parse Java Program {saveLocation if on_disk else (commit_hash, file)}. {RESET_COLOR}",
+            file=sys.stderr,
+        )
+    if status is not None:
+        db.queue_file_processed(file, commit_hash, status=status, repo=spc_repo)
+        return
+
+    db.store_blob_extraction(content_hash, plain_classes, functions)
+
+    # mark as processed and continue. Written in batches (see DatabaseManager.flush)
+    db.queue_file_apis(file, commit_hash, plain_classes, functions, spc_repo)
+    db.queue_file_processed(file, commit_hash, spc_repo)
+    if on_disk:
+        os.unlink(saveLocation)
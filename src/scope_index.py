@@ -0,0 +1,97 @@
+"""
+scope_index.py
+
+Resolves the receiver of a method invocation (the `x` in `x.foo()`) to the
+declaration of `x` that is in scope where the call is made.
+
+Every symbol found by SymbolTable or JavaASTVisitor carries the byte range
+where its declaration is visible ("scope"), and every method invocation its
+byte position ("byte"). Scopes come from the tree, so they nest: the scopes of
+a name form a tree of intervals. ScopeIndex keeps them sorted by start with a
+pointer to the enclosing interval, and finds the nearest enclosing
+declaration with a binary search.
+"""
+
+from bisect import bisect_right
+
+
+def declaration_scope(
+    kind: str,
+    start_byte: int,
+    parent: tuple[int, int],
+    grandparent: tuple[int, int] | None = None,
+) -> tuple[int, int]:
+    """Byte range where a declaration is visible.
+
+    Args:
+        kind (str): formal_parameter, field_declaration or local_variable_declaration
+        start_byte (int): start of the declaration
+        parent (tuple[int, int]): byte range of the declaration's parent node
+        grandparent (tuple[int, int] | None, optional): byte range of the parent's parent
+
+    Returns:
+        tuple[int, int]: start and end byte of the scope
+    """
+    if kind == "formal_parameter":
+        # parameters -> method, constructor or lambda
+        return grandparent if grandparent is not None else parent
+    if kind == "local_variable_declaration":
+        # from the declaration to the end of the block
+        return (start_byte, parent[1])
+    # fields: the whole class body
+    return parent
+
+
+class ScopeIndex:
+    """Nearest enclosing declaration lookup, by variable name."""
+
+    def __init__(self, symbols: list[dict]):
+        """Index symbols by name and scope.
+
+        Args:
+            symbols (list[dict]): symbols with a "scope". [{class, name, line, scope}, ...]
+        """
+        byName = {}
+        for symbol in symbols:
+            byName.setdefault(symbol["name"], []).append(symbol)
+
+        # name -> (starts, ends, enclosing index, symbols), sorted by start
+        self.scopes = {}
+        for name, declarations in byName.items():
+            # outer scopes before the scopes they contain. Same scope keeps source order.
+            declarations.sort(key=lambda x: (x["scope"][0], -x["scope"][1]))
+            starts = []
+            ends = []
+            enclosing = []
+            open_scopes = []
+            for num, symbol in enumerate(declarations):
+                start, end = symbol["scope"]
+                while open_scopes and ends[open_scopes[-1]] < end:
+                    open_scopes.pop()
+                enclosing.append(open_scopes[-1] if open_scopes else -1)
+                open_scopes.append(num)
+                starts.append(start)
+                ends.append(end)
+            self.scopes[name] = (starts, ends, enclosing, declarations)
+
+    def resolve(self, name: str, position: int) -> dict | None:
+        """Find the declaration of a variable visible at a position.
+
+        Args:
+            name (str): variable name
+            position (int): byte position of the use
+
+        Returns:
+            dict | None: the symbol, or None if no declaration is in scope
+        """
+        found = self.scopes.get(name)
+        if found is None:
+            return None
+        starts, ends, enclosing, declarations = found
+
+        num = bisect_right(starts, position) - 1
+        while num != -1:
+            if position < ends[num]:
+                return declarations[num]
+            num = enclosing[num]
+        return None
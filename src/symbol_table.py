@@ -1,3 +1,6 @@
+from .scope_index import declaration_scope
+
+
 class SymbolTable():
     def __init__(self, ast : dict):
         """Create Symbol Table Object
@@ -8,6 +11,7 @@ class SymbolTable():
         self.ast = ast
         self.symbols = []
         self.methodTable = []
+        self.parents = []  # nodes above the one being searched
     # in class def.
     # formal identifier. func(string A)
     # object_creation_expression
@@ -20,7 +24,7 @@ class SymbolTable():
         """Find all symbols (variables) used in the program
 
         Returns:
-            list[dict]: Symbol Dictionary. [{class, name, line}, ...]
+            list[dict]: Symbol Dictionary. [{class, name, line, scope}, ...]
         """
         # LRP
         self.__findSymbol(self.ast)
@@ -41,7 +45,7 @@ class SymbolTable():
                     startPoint = x["start_point"][0]
 
             if(typeID != ''):
-                self.symbols.append({"class":typeID, "name":name, "line":startPoint})
+                self.symbols.append({"class":typeID, "name":name, "line":startPoint, "scope":self.__scope(node)})
                 # ignore primitives.
 
             return
@@ -64,7 +68,7 @@ class SymbolTable():
                     startPoint = children[count]["start_point"][0]
 
             if(typeID != ''):
-                self.symbols.append({"class":typeID, "name":name, "line":startPoint})
+                self.symbols.append({"class":typeID, "name":name, "line":startPoint, "scope":self.__scope(node)})
                 # ignore primitives.
 
             return
@@ -87,7 +91,7 @@ class SymbolTable():
                     startPoint = children[count]["start_point"][0]
 
             if(typeID != ''):
-                self.symbols.append({"class":typeID, "name":name, "line":startPoint})
+                self.symbols.append({"class":typeID, "name":name, "line":startPoint, "scope":self.__scope(node)})
                 # ignore primitives.
             return
 
@@ -95,17 +99,29 @@ class SymbolTable():
         if(len(node["children"]) == 0):
             return # nothing here!
 
+        self.parents.append(node)
         for n in node["children"]:
             # check
             self.__findSymbol(n)
+        self.parents.pop()
 
         # that's it! Nothing here.
 
+    def __scope(self, node):
+        parent = self.parents[-1] if self.parents else node
+        grandparent = self.parents[-2] if len(self.parents) > 1 else None
+        return declaration_scope(
+            node["name"],
+            node["start_byte"],
+            (parent["start_byte"], parent["end_byte"]),
+            None if grandparent is None else (grandparent["start_byte"], grandparent["end_byte"]),
+        )
+
     def getMethods(self):
         """Find all methods and invocations used in the program
 
         Returns:
-            list[dict]: Method Dictionary. [{name (variable name), method, line}, ...]
+            list[dict]: Method Dictionary. [{name (variable name), method, line, byte}, ...]
         """
         self.__getMethod(self.ast)
         return self.methodTable
@@ -132,7 +148,7 @@ class SymbolTable():
                     self.__getMethod(x)
 
             if(len(tokens) >= 2):
-                self.methodTable.append({"name":tokens[0], "method":tokens[1], "line":startPoint})
+                self.methodTable.append({"name":tokens[0], "method":tokens[1], "line":startPoint, "byte":node["start_byte"]})
                 # ignore primitives.
 
             return
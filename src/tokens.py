@@ -109,5 +109,55 @@ def pullImportPython(jsonDirect, key="dotted_name"):
 
 
 
-# found_tokens = pullToken(data)
-# print(found_tokens)
+# kinds yielded by pullTokensAndImports
+TOKEN = "token"
+IMPORT = "import"
+
+_TOKENS = 1
+_IMPORTS = 2
+
+
+def pullTokensAndImports(
+    jsonDirect, key="type_identifier", importKey="scoped_identifier"
+):
+    """Finds tokens and imports in one pass. Same results as pullToken and pullImport.
+
+    Walks the "children" of the AST iteratively, without building lists.
+    Tokens come out in the same order as pullToken, imports in the same order as pullImport.
+
+    Args:
+        jsonDirect (dict | list): AST Tree JSON fragment
+        key (str, optional): Token search key. Defaults to "type_identifier".
+        importKey (str, optional): Import search key. Defaults to "scoped_identifier".
+
+    Yields:
+        tuple[str, str]: (kind, text). kind is TOKEN or IMPORT
+    """
+    stack = [(jsonDirect, _TOKENS | _IMPORTS)]
+    while stack:
+        node, flags = stack.pop()
+
+        if isinstance(node, list):
+            stack.extend((item, flags) for item in reversed(node))
+            continue
+        if not isinstance(node, dict):
+            continue
+
+        node_type = node.get("type")
+        if flags & _TOKENS and (node_type == key or node_type == "boolean_type"):
+            text_value = node.get("text")
+            if text_value:
+                yield TOKEN, text_value
+            flags &= ~_TOKENS
+
+        if flags & _IMPORTS:
+            if node_type == importKey or node.get("grammar_id") == importKey:
+                text_value = node.get("text")
+                if text_value:
+                    yield IMPORT, text_value
+                flags &= ~_IMPORTS
+
+        if flags:
+            children = node.get("children", [])
+            stack.extend((child, flags) for child in reversed(children))
+
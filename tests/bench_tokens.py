@@ -0,0 +1,72 @@
+"""
+bench_tokens.py
+
+Benchmark of tokens.pullTokensAndImports() against the recursive walkers it
+replaced (pullToken + pullImport) on the Java files of tests/corpus.
+
+python tests/bench_tokens.py [FILE.java ...]
+"""
+
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src import tokens as tokenExtract  # noqa: E402
+from src.generate_ast import generate_ast  # noqa: E402
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+
+
+def best_of(function, runs: int) -> tuple[float, object]:
+    """Run function a few times.
+
+    Args:
+        function (Callable): function to time
+        runs (int): number of runs
+
+    Returns:
+        float: fastest run, in ms
+        object: result of the last run
+    """
+    best = None
+    for _ in range(runs):
+        st = time.perf_counter()
+        result = function()
+        took = (time.perf_counter() - st) * 1000
+        best = took if best is None else min(best, took)
+    return best, result
+
+
+def recursive(ast) -> tuple[list, list]:
+    return tokenExtract.pullToken(ast), tokenExtract.pullImport(ast)
+
+
+def single_pass(ast) -> tuple[list, list]:
+    tokens = []
+    imports = []
+    for kind, text in tokenExtract.pullTokensAndImports(ast):
+        if kind == tokenExtract.TOKEN:
+            tokens.append(text)
+        else:
+            imports.append(text)
+    return tokens, imports
+
+
+def main(filenames: list[str], runs: int = 5):
+    for filename in filenames:
+        ast = generate_ast(filename)
+        old_time, old = best_of(lambda: recursive(ast), runs)
+        new_time, new = best_of(lambda: single_pass(ast), runs)
+        print(
+            f"{os.path.basename(filename)} ({os.path.getsize(filename) // 1024} KB): "
+            f"pullToken + pullImport {old_time:.1f} ms, "
+            f"pullTokensAndImports {new_time:.1f} ms, "
+            f"same output: {old == new}"
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or sorted(glob.glob(os.path.join(CORPUS, "*.java"))))
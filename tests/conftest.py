@@ -0,0 +1,52 @@
+"""
+conftest.py
+
+Fixtures shared by the tests that need the ./output working directory.
+"""
+
+import builtins
+import contextlib
+import io
+import os
+
+import pytest
+import tiktoken
+
+from src import database_init
+from src.database_manager import DatabaseManager
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Empty working directory with ./data and ./output, like the repository root."""
+    os.symlink(DATA, tmp_path / "data")
+    os.makedirs(tmp_path / "output")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OPENAI_API_KEY", "x")
+    return tmp_path
+
+
+class WordEncoding:
+    """Stands in for a tiktoken encoding: one token per word."""
+
+    def encode(self, text: str) -> list[int]:
+        return [len(word) for word in text.split()]
+
+
+@pytest.fixture
+def word_tokens(monkeypatch):
+    """tiktoken.get_encoding() without the download of the real encodings."""
+    monkeypatch.setattr(tiktoken, "get_encoding", lambda name: WordEncoding())
+
+
+@pytest.fixture
+def database(workdir, monkeypatch):
+    """DatabaseManager of new databases made by database_init."""
+    monkeypatch.setattr(builtins, "input", lambda prompt="": "yes")
+    with contextlib.redirect_stdout(io.StringIO()):
+        database_init.start()
+    db = DatabaseManager()
+    yield db
+    db.close()
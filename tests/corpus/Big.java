@@ -0,0 +1,3615 @@
+package org.example.app;
+
+import java.util.List;
+import java.util.ArrayList;
+import java.util.Map;
+import java.io.*;
+import static java.lang.Math.max;
+import javax.swing.JFrame;
+import org.example.db.Connection;
+import org.other.Connection;
+
+@org.example.Annotated
+public class Big extends JFrame {
+    private Connection conn;
+
+    public void method0(Connection c0, JFrame f0) {
+        ArrayList list0 = new ArrayList();
+        list0.add(c0.get(f0.getTitle()));
+        Connection conn = c0;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list0.size()); conn.commit(); }
+        f0.setVisible(list0.isEmpty());
+    }
+
+    public void method1(Connection c1, JFrame f1) {
+        ArrayList list1 = new ArrayList();
+        list1.add(c1.get(f1.getTitle()));
+        Connection conn = c1;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list1.size()); conn.commit(); }
+        f1.setVisible(list1.isEmpty());
+    }
+
+    public void method2(Connection c2, JFrame f2) {
+        ArrayList list2 = new ArrayList();
+        list2.add(c2.get(f2.getTitle()));
+        Connection conn = c2;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list2.size()); conn.commit(); }
+        f2.setVisible(list2.isEmpty());
+    }
+
+    public void method3(Connection c3, JFrame f3) {
+        ArrayList list3 = new ArrayList();
+        list3.add(c3.get(f3.getTitle()));
+        Connection conn = c3;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list3.size()); conn.commit(); }
+        f3.setVisible(list3.isEmpty());
+    }
+
+    public void method4(Connection c4, JFrame f4) {
+        ArrayList list4 = new ArrayList();
+        list4.add(c4.get(f4.getTitle()));
+        Connection conn = c4;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list4.size()); conn.commit(); }
+        f4.setVisible(list4.isEmpty());
+    }
+
+    public void method5(Connection c5, JFrame f5) {
+        ArrayList list5 = new ArrayList();
+        list5.add(c5.get(f5.getTitle()));
+        Connection conn = c5;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list5.size()); conn.commit(); }
+        f5.setVisible(list5.isEmpty());
+    }
+
+    public void method6(Connection c6, JFrame f6) {
+        ArrayList list6 = new ArrayList();
+        list6.add(c6.get(f6.getTitle()));
+        Connection conn = c6;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list6.size()); conn.commit(); }
+        f6.setVisible(list6.isEmpty());
+    }
+
+    public void method7(Connection c7, JFrame f7) {
+        ArrayList list7 = new ArrayList();
+        list7.add(c7.get(f7.getTitle()));
+        Connection conn = c7;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list7.size()); conn.commit(); }
+        f7.setVisible(list7.isEmpty());
+    }
+
+    public void method8(Connection c8, JFrame f8) {
+        ArrayList list8 = new ArrayList();
+        list8.add(c8.get(f8.getTitle()));
+        Connection conn = c8;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list8.size()); conn.commit(); }
+        f8.setVisible(list8.isEmpty());
+    }
+
+    public void method9(Connection c9, JFrame f9) {
+        ArrayList list9 = new ArrayList();
+        list9.add(c9.get(f9.getTitle()));
+        Connection conn = c9;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list9.size()); conn.commit(); }
+        f9.setVisible(list9.isEmpty());
+    }
+
+    public void method10(Connection c10, JFrame f10) {
+        ArrayList list10 = new ArrayList();
+        list10.add(c10.get(f10.getTitle()));
+        Connection conn = c10;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list10.size()); conn.commit(); }
+        f10.setVisible(list10.isEmpty());
+    }
+
+    public void method11(Connection c11, JFrame f11) {
+        ArrayList list11 = new ArrayList();
+        list11.add(c11.get(f11.getTitle()));
+        Connection conn = c11;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list11.size()); conn.commit(); }
+        f11.setVisible(list11.isEmpty());
+    }
+
+    public void method12(Connection c12, JFrame f12) {
+        ArrayList list12 = new ArrayList();
+        list12.add(c12.get(f12.getTitle()));
+        Connection conn = c12;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list12.size()); conn.commit(); }
+        f12.setVisible(list12.isEmpty());
+    }
+
+    public void method13(Connection c13, JFrame f13) {
+        ArrayList list13 = new ArrayList();
+        list13.add(c13.get(f13.getTitle()));
+        Connection conn = c13;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list13.size()); conn.commit(); }
+        f13.setVisible(list13.isEmpty());
+    }
+
+    public void method14(Connection c14, JFrame f14) {
+        ArrayList list14 = new ArrayList();
+        list14.add(c14.get(f14.getTitle()));
+        Connection conn = c14;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list14.size()); conn.commit(); }
+        f14.setVisible(list14.isEmpty());
+    }
+
+    public void method15(Connection c15, JFrame f15) {
+        ArrayList list15 = new ArrayList();
+        list15.add(c15.get(f15.getTitle()));
+        Connection conn = c15;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list15.size()); conn.commit(); }
+        f15.setVisible(list15.isEmpty());
+    }
+
+    public void method16(Connection c16, JFrame f16) {
+        ArrayList list16 = new ArrayList();
+        list16.add(c16.get(f16.getTitle()));
+        Connection conn = c16;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list16.size()); conn.commit(); }
+        f16.setVisible(list16.isEmpty());
+    }
+
+    public void method17(Connection c17, JFrame f17) {
+        ArrayList list17 = new ArrayList();
+        list17.add(c17.get(f17.getTitle()));
+        Connection conn = c17;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list17.size()); conn.commit(); }
+        f17.setVisible(list17.isEmpty());
+    }
+
+    public void method18(Connection c18, JFrame f18) {
+        ArrayList list18 = new ArrayList();
+        list18.add(c18.get(f18.getTitle()));
+        Connection conn = c18;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list18.size()); conn.commit(); }
+        f18.setVisible(list18.isEmpty());
+    }
+
+    public void method19(Connection c19, JFrame f19) {
+        ArrayList list19 = new ArrayList();
+        list19.add(c19.get(f19.getTitle()));
+        Connection conn = c19;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list19.size()); conn.commit(); }
+        f19.setVisible(list19.isEmpty());
+    }
+
+    public void method20(Connection c20, JFrame f20) {
+        ArrayList list20 = new ArrayList();
+        list20.add(c20.get(f20.getTitle()));
+        Connection conn = c20;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list20.size()); conn.commit(); }
+        f20.setVisible(list20.isEmpty());
+    }
+
+    public void method21(Connection c21, JFrame f21) {
+        ArrayList list21 = new ArrayList();
+        list21.add(c21.get(f21.getTitle()));
+        Connection conn = c21;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list21.size()); conn.commit(); }
+        f21.setVisible(list21.isEmpty());
+    }
+
+    public void method22(Connection c22, JFrame f22) {
+        ArrayList list22 = new ArrayList();
+        list22.add(c22.get(f22.getTitle()));
+        Connection conn = c22;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list22.size()); conn.commit(); }
+        f22.setVisible(list22.isEmpty());
+    }
+
+    public void method23(Connection c23, JFrame f23) {
+        ArrayList list23 = new ArrayList();
+        list23.add(c23.get(f23.getTitle()));
+        Connection conn = c23;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list23.size()); conn.commit(); }
+        f23.setVisible(list23.isEmpty());
+    }
+
+    public void method24(Connection c24, JFrame f24) {
+        ArrayList list24 = new ArrayList();
+        list24.add(c24.get(f24.getTitle()));
+        Connection conn = c24;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list24.size()); conn.commit(); }
+        f24.setVisible(list24.isEmpty());
+    }
+
+    public void method25(Connection c25, JFrame f25) {
+        ArrayList list25 = new ArrayList();
+        list25.add(c25.get(f25.getTitle()));
+        Connection conn = c25;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list25.size()); conn.commit(); }
+        f25.setVisible(list25.isEmpty());
+    }
+
+    public void method26(Connection c26, JFrame f26) {
+        ArrayList list26 = new ArrayList();
+        list26.add(c26.get(f26.getTitle()));
+        Connection conn = c26;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list26.size()); conn.commit(); }
+        f26.setVisible(list26.isEmpty());
+    }
+
+    public void method27(Connection c27, JFrame f27) {
+        ArrayList list27 = new ArrayList();
+        list27.add(c27.get(f27.getTitle()));
+        Connection conn = c27;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list27.size()); conn.commit(); }
+        f27.setVisible(list27.isEmpty());
+    }
+
+    public void method28(Connection c28, JFrame f28) {
+        ArrayList list28 = new ArrayList();
+        list28.add(c28.get(f28.getTitle()));
+        Connection conn = c28;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list28.size()); conn.commit(); }
+        f28.setVisible(list28.isEmpty());
+    }
+
+    public void method29(Connection c29, JFrame f29) {
+        ArrayList list29 = new ArrayList();
+        list29.add(c29.get(f29.getTitle()));
+        Connection conn = c29;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list29.size()); conn.commit(); }
+        f29.setVisible(list29.isEmpty());
+    }
+
+    public void method30(Connection c30, JFrame f30) {
+        ArrayList list30 = new ArrayList();
+        list30.add(c30.get(f30.getTitle()));
+        Connection conn = c30;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list30.size()); conn.commit(); }
+        f30.setVisible(list30.isEmpty());
+    }
+
+    public void method31(Connection c31, JFrame f31) {
+        ArrayList list31 = new ArrayList();
+        list31.add(c31.get(f31.getTitle()));
+        Connection conn = c31;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list31.size()); conn.commit(); }
+        f31.setVisible(list31.isEmpty());
+    }
+
+    public void method32(Connection c32, JFrame f32) {
+        ArrayList list32 = new ArrayList();
+        list32.add(c32.get(f32.getTitle()));
+        Connection conn = c32;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list32.size()); conn.commit(); }
+        f32.setVisible(list32.isEmpty());
+    }
+
+    public void method33(Connection c33, JFrame f33) {
+        ArrayList list33 = new ArrayList();
+        list33.add(c33.get(f33.getTitle()));
+        Connection conn = c33;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list33.size()); conn.commit(); }
+        f33.setVisible(list33.isEmpty());
+    }
+
+    public void method34(Connection c34, JFrame f34) {
+        ArrayList list34 = new ArrayList();
+        list34.add(c34.get(f34.getTitle()));
+        Connection conn = c34;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list34.size()); conn.commit(); }
+        f34.setVisible(list34.isEmpty());
+    }
+
+    public void method35(Connection c35, JFrame f35) {
+        ArrayList list35 = new ArrayList();
+        list35.add(c35.get(f35.getTitle()));
+        Connection conn = c35;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list35.size()); conn.commit(); }
+        f35.setVisible(list35.isEmpty());
+    }
+
+    public void method36(Connection c36, JFrame f36) {
+        ArrayList list36 = new ArrayList();
+        list36.add(c36.get(f36.getTitle()));
+        Connection conn = c36;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list36.size()); conn.commit(); }
+        f36.setVisible(list36.isEmpty());
+    }
+
+    public void method37(Connection c37, JFrame f37) {
+        ArrayList list37 = new ArrayList();
+        list37.add(c37.get(f37.getTitle()));
+        Connection conn = c37;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list37.size()); conn.commit(); }
+        f37.setVisible(list37.isEmpty());
+    }
+
+    public void method38(Connection c38, JFrame f38) {
+        ArrayList list38 = new ArrayList();
+        list38.add(c38.get(f38.getTitle()));
+        Connection conn = c38;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list38.size()); conn.commit(); }
+        f38.setVisible(list38.isEmpty());
+    }
+
+    public void method39(Connection c39, JFrame f39) {
+        ArrayList list39 = new ArrayList();
+        list39.add(c39.get(f39.getTitle()));
+        Connection conn = c39;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list39.size()); conn.commit(); }
+        f39.setVisible(list39.isEmpty());
+    }
+
+    public void method40(Connection c40, JFrame f40) {
+        ArrayList list40 = new ArrayList();
+        list40.add(c40.get(f40.getTitle()));
+        Connection conn = c40;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list40.size()); conn.commit(); }
+        f40.setVisible(list40.isEmpty());
+    }
+
+    public void method41(Connection c41, JFrame f41) {
+        ArrayList list41 = new ArrayList();
+        list41.add(c41.get(f41.getTitle()));
+        Connection conn = c41;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list41.size()); conn.commit(); }
+        f41.setVisible(list41.isEmpty());
+    }
+
+    public void method42(Connection c42, JFrame f42) {
+        ArrayList list42 = new ArrayList();
+        list42.add(c42.get(f42.getTitle()));
+        Connection conn = c42;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list42.size()); conn.commit(); }
+        f42.setVisible(list42.isEmpty());
+    }
+
+    public void method43(Connection c43, JFrame f43) {
+        ArrayList list43 = new ArrayList();
+        list43.add(c43.get(f43.getTitle()));
+        Connection conn = c43;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list43.size()); conn.commit(); }
+        f43.setVisible(list43.isEmpty());
+    }
+
+    public void method44(Connection c44, JFrame f44) {
+        ArrayList list44 = new ArrayList();
+        list44.add(c44.get(f44.getTitle()));
+        Connection conn = c44;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list44.size()); conn.commit(); }
+        f44.setVisible(list44.isEmpty());
+    }
+
+    public void method45(Connection c45, JFrame f45) {
+        ArrayList list45 = new ArrayList();
+        list45.add(c45.get(f45.getTitle()));
+        Connection conn = c45;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list45.size()); conn.commit(); }
+        f45.setVisible(list45.isEmpty());
+    }
+
+    public void method46(Connection c46, JFrame f46) {
+        ArrayList list46 = new ArrayList();
+        list46.add(c46.get(f46.getTitle()));
+        Connection conn = c46;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list46.size()); conn.commit(); }
+        f46.setVisible(list46.isEmpty());
+    }
+
+    public void method47(Connection c47, JFrame f47) {
+        ArrayList list47 = new ArrayList();
+        list47.add(c47.get(f47.getTitle()));
+        Connection conn = c47;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list47.size()); conn.commit(); }
+        f47.setVisible(list47.isEmpty());
+    }
+
+    public void method48(Connection c48, JFrame f48) {
+        ArrayList list48 = new ArrayList();
+        list48.add(c48.get(f48.getTitle()));
+        Connection conn = c48;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list48.size()); conn.commit(); }
+        f48.setVisible(list48.isEmpty());
+    }
+
+    public void method49(Connection c49, JFrame f49) {
+        ArrayList list49 = new ArrayList();
+        list49.add(c49.get(f49.getTitle()));
+        Connection conn = c49;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list49.size()); conn.commit(); }
+        f49.setVisible(list49.isEmpty());
+    }
+
+    public void method50(Connection c50, JFrame f50) {
+        ArrayList list50 = new ArrayList();
+        list50.add(c50.get(f50.getTitle()));
+        Connection conn = c50;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list50.size()); conn.commit(); }
+        f50.setVisible(list50.isEmpty());
+    }
+
+    public void method51(Connection c51, JFrame f51) {
+        ArrayList list51 = new ArrayList();
+        list51.add(c51.get(f51.getTitle()));
+        Connection conn = c51;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list51.size()); conn.commit(); }
+        f51.setVisible(list51.isEmpty());
+    }
+
+    public void method52(Connection c52, JFrame f52) {
+        ArrayList list52 = new ArrayList();
+        list52.add(c52.get(f52.getTitle()));
+        Connection conn = c52;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list52.size()); conn.commit(); }
+        f52.setVisible(list52.isEmpty());
+    }
+
+    public void method53(Connection c53, JFrame f53) {
+        ArrayList list53 = new ArrayList();
+        list53.add(c53.get(f53.getTitle()));
+        Connection conn = c53;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list53.size()); conn.commit(); }
+        f53.setVisible(list53.isEmpty());
+    }
+
+    public void method54(Connection c54, JFrame f54) {
+        ArrayList list54 = new ArrayList();
+        list54.add(c54.get(f54.getTitle()));
+        Connection conn = c54;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list54.size()); conn.commit(); }
+        f54.setVisible(list54.isEmpty());
+    }
+
+    public void method55(Connection c55, JFrame f55) {
+        ArrayList list55 = new ArrayList();
+        list55.add(c55.get(f55.getTitle()));
+        Connection conn = c55;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list55.size()); conn.commit(); }
+        f55.setVisible(list55.isEmpty());
+    }
+
+    public void method56(Connection c56, JFrame f56) {
+        ArrayList list56 = new ArrayList();
+        list56.add(c56.get(f56.getTitle()));
+        Connection conn = c56;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list56.size()); conn.commit(); }
+        f56.setVisible(list56.isEmpty());
+    }
+
+    public void method57(Connection c57, JFrame f57) {
+        ArrayList list57 = new ArrayList();
+        list57.add(c57.get(f57.getTitle()));
+        Connection conn = c57;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list57.size()); conn.commit(); }
+        f57.setVisible(list57.isEmpty());
+    }
+
+    public void method58(Connection c58, JFrame f58) {
+        ArrayList list58 = new ArrayList();
+        list58.add(c58.get(f58.getTitle()));
+        Connection conn = c58;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list58.size()); conn.commit(); }
+        f58.setVisible(list58.isEmpty());
+    }
+
+    public void method59(Connection c59, JFrame f59) {
+        ArrayList list59 = new ArrayList();
+        list59.add(c59.get(f59.getTitle()));
+        Connection conn = c59;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list59.size()); conn.commit(); }
+        f59.setVisible(list59.isEmpty());
+    }
+
+    public void method60(Connection c60, JFrame f60) {
+        ArrayList list60 = new ArrayList();
+        list60.add(c60.get(f60.getTitle()));
+        Connection conn = c60;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list60.size()); conn.commit(); }
+        f60.setVisible(list60.isEmpty());
+    }
+
+    public void method61(Connection c61, JFrame f61) {
+        ArrayList list61 = new ArrayList();
+        list61.add(c61.get(f61.getTitle()));
+        Connection conn = c61;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list61.size()); conn.commit(); }
+        f61.setVisible(list61.isEmpty());
+    }
+
+    public void method62(Connection c62, JFrame f62) {
+        ArrayList list62 = new ArrayList();
+        list62.add(c62.get(f62.getTitle()));
+        Connection conn = c62;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list62.size()); conn.commit(); }
+        f62.setVisible(list62.isEmpty());
+    }
+
+    public void method63(Connection c63, JFrame f63) {
+        ArrayList list63 = new ArrayList();
+        list63.add(c63.get(f63.getTitle()));
+        Connection conn = c63;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list63.size()); conn.commit(); }
+        f63.setVisible(list63.isEmpty());
+    }
+
+    public void method64(Connection c64, JFrame f64) {
+        ArrayList list64 = new ArrayList();
+        list64.add(c64.get(f64.getTitle()));
+        Connection conn = c64;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list64.size()); conn.commit(); }
+        f64.setVisible(list64.isEmpty());
+    }
+
+    public void method65(Connection c65, JFrame f65) {
+        ArrayList list65 = new ArrayList();
+        list65.add(c65.get(f65.getTitle()));
+        Connection conn = c65;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list65.size()); conn.commit(); }
+        f65.setVisible(list65.isEmpty());
+    }
+
+    public void method66(Connection c66, JFrame f66) {
+        ArrayList list66 = new ArrayList();
+        list66.add(c66.get(f66.getTitle()));
+        Connection conn = c66;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list66.size()); conn.commit(); }
+        f66.setVisible(list66.isEmpty());
+    }
+
+    public void method67(Connection c67, JFrame f67) {
+        ArrayList list67 = new ArrayList();
+        list67.add(c67.get(f67.getTitle()));
+        Connection conn = c67;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list67.size()); conn.commit(); }
+        f67.setVisible(list67.isEmpty());
+    }
+
+    public void method68(Connection c68, JFrame f68) {
+        ArrayList list68 = new ArrayList();
+        list68.add(c68.get(f68.getTitle()));
+        Connection conn = c68;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list68.size()); conn.commit(); }
+        f68.setVisible(list68.isEmpty());
+    }
+
+    public void method69(Connection c69, JFrame f69) {
+        ArrayList list69 = new ArrayList();
+        list69.add(c69.get(f69.getTitle()));
+        Connection conn = c69;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list69.size()); conn.commit(); }
+        f69.setVisible(list69.isEmpty());
+    }
+
+    public void method70(Connection c70, JFrame f70) {
+        ArrayList list70 = new ArrayList();
+        list70.add(c70.get(f70.getTitle()));
+        Connection conn = c70;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list70.size()); conn.commit(); }
+        f70.setVisible(list70.isEmpty());
+    }
+
+    public void method71(Connection c71, JFrame f71) {
+        ArrayList list71 = new ArrayList();
+        list71.add(c71.get(f71.getTitle()));
+        Connection conn = c71;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list71.size()); conn.commit(); }
+        f71.setVisible(list71.isEmpty());
+    }
+
+    public void method72(Connection c72, JFrame f72) {
+        ArrayList list72 = new ArrayList();
+        list72.add(c72.get(f72.getTitle()));
+        Connection conn = c72;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list72.size()); conn.commit(); }
+        f72.setVisible(list72.isEmpty());
+    }
+
+    public void method73(Connection c73, JFrame f73) {
+        ArrayList list73 = new ArrayList();
+        list73.add(c73.get(f73.getTitle()));
+        Connection conn = c73;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list73.size()); conn.commit(); }
+        f73.setVisible(list73.isEmpty());
+    }
+
+    public void method74(Connection c74, JFrame f74) {
+        ArrayList list74 = new ArrayList();
+        list74.add(c74.get(f74.getTitle()));
+        Connection conn = c74;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list74.size()); conn.commit(); }
+        f74.setVisible(list74.isEmpty());
+    }
+
+    public void method75(Connection c75, JFrame f75) {
+        ArrayList list75 = new ArrayList();
+        list75.add(c75.get(f75.getTitle()));
+        Connection conn = c75;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list75.size()); conn.commit(); }
+        f75.setVisible(list75.isEmpty());
+    }
+
+    public void method76(Connection c76, JFrame f76) {
+        ArrayList list76 = new ArrayList();
+        list76.add(c76.get(f76.getTitle()));
+        Connection conn = c76;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list76.size()); conn.commit(); }
+        f76.setVisible(list76.isEmpty());
+    }
+
+    public void method77(Connection c77, JFrame f77) {
+        ArrayList list77 = new ArrayList();
+        list77.add(c77.get(f77.getTitle()));
+        Connection conn = c77;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list77.size()); conn.commit(); }
+        f77.setVisible(list77.isEmpty());
+    }
+
+    public void method78(Connection c78, JFrame f78) {
+        ArrayList list78 = new ArrayList();
+        list78.add(c78.get(f78.getTitle()));
+        Connection conn = c78;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list78.size()); conn.commit(); }
+        f78.setVisible(list78.isEmpty());
+    }
+
+    public void method79(Connection c79, JFrame f79) {
+        ArrayList list79 = new ArrayList();
+        list79.add(c79.get(f79.getTitle()));
+        Connection conn = c79;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list79.size()); conn.commit(); }
+        f79.setVisible(list79.isEmpty());
+    }
+
+    public void method80(Connection c80, JFrame f80) {
+        ArrayList list80 = new ArrayList();
+        list80.add(c80.get(f80.getTitle()));
+        Connection conn = c80;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list80.size()); conn.commit(); }
+        f80.setVisible(list80.isEmpty());
+    }
+
+    public void method81(Connection c81, JFrame f81) {
+        ArrayList list81 = new ArrayList();
+        list81.add(c81.get(f81.getTitle()));
+        Connection conn = c81;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list81.size()); conn.commit(); }
+        f81.setVisible(list81.isEmpty());
+    }
+
+    public void method82(Connection c82, JFrame f82) {
+        ArrayList list82 = new ArrayList();
+        list82.add(c82.get(f82.getTitle()));
+        Connection conn = c82;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list82.size()); conn.commit(); }
+        f82.setVisible(list82.isEmpty());
+    }
+
+    public void method83(Connection c83, JFrame f83) {
+        ArrayList list83 = new ArrayList();
+        list83.add(c83.get(f83.getTitle()));
+        Connection conn = c83;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list83.size()); conn.commit(); }
+        f83.setVisible(list83.isEmpty());
+    }
+
+    public void method84(Connection c84, JFrame f84) {
+        ArrayList list84 = new ArrayList();
+        list84.add(c84.get(f84.getTitle()));
+        Connection conn = c84;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list84.size()); conn.commit(); }
+        f84.setVisible(list84.isEmpty());
+    }
+
+    public void method85(Connection c85, JFrame f85) {
+        ArrayList list85 = new ArrayList();
+        list85.add(c85.get(f85.getTitle()));
+        Connection conn = c85;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list85.size()); conn.commit(); }
+        f85.setVisible(list85.isEmpty());
+    }
+
+    public void method86(Connection c86, JFrame f86) {
+        ArrayList list86 = new ArrayList();
+        list86.add(c86.get(f86.getTitle()));
+        Connection conn = c86;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list86.size()); conn.commit(); }
+        f86.setVisible(list86.isEmpty());
+    }
+
+    public void method87(Connection c87, JFrame f87) {
+        ArrayList list87 = new ArrayList();
+        list87.add(c87.get(f87.getTitle()));
+        Connection conn = c87;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list87.size()); conn.commit(); }
+        f87.setVisible(list87.isEmpty());
+    }
+
+    public void method88(Connection c88, JFrame f88) {
+        ArrayList list88 = new ArrayList();
+        list88.add(c88.get(f88.getTitle()));
+        Connection conn = c88;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list88.size()); conn.commit(); }
+        f88.setVisible(list88.isEmpty());
+    }
+
+    public void method89(Connection c89, JFrame f89) {
+        ArrayList list89 = new ArrayList();
+        list89.add(c89.get(f89.getTitle()));
+        Connection conn = c89;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list89.size()); conn.commit(); }
+        f89.setVisible(list89.isEmpty());
+    }
+
+    public void method90(Connection c90, JFrame f90) {
+        ArrayList list90 = new ArrayList();
+        list90.add(c90.get(f90.getTitle()));
+        Connection conn = c90;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list90.size()); conn.commit(); }
+        f90.setVisible(list90.isEmpty());
+    }
+
+    public void method91(Connection c91, JFrame f91) {
+        ArrayList list91 = new ArrayList();
+        list91.add(c91.get(f91.getTitle()));
+        Connection conn = c91;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list91.size()); conn.commit(); }
+        f91.setVisible(list91.isEmpty());
+    }
+
+    public void method92(Connection c92, JFrame f92) {
+        ArrayList list92 = new ArrayList();
+        list92.add(c92.get(f92.getTitle()));
+        Connection conn = c92;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list92.size()); conn.commit(); }
+        f92.setVisible(list92.isEmpty());
+    }
+
+    public void method93(Connection c93, JFrame f93) {
+        ArrayList list93 = new ArrayList();
+        list93.add(c93.get(f93.getTitle()));
+        Connection conn = c93;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list93.size()); conn.commit(); }
+        f93.setVisible(list93.isEmpty());
+    }
+
+    public void method94(Connection c94, JFrame f94) {
+        ArrayList list94 = new ArrayList();
+        list94.add(c94.get(f94.getTitle()));
+        Connection conn = c94;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list94.size()); conn.commit(); }
+        f94.setVisible(list94.isEmpty());
+    }
+
+    public void method95(Connection c95, JFrame f95) {
+        ArrayList list95 = new ArrayList();
+        list95.add(c95.get(f95.getTitle()));
+        Connection conn = c95;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list95.size()); conn.commit(); }
+        f95.setVisible(list95.isEmpty());
+    }
+
+    public void method96(Connection c96, JFrame f96) {
+        ArrayList list96 = new ArrayList();
+        list96.add(c96.get(f96.getTitle()));
+        Connection conn = c96;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list96.size()); conn.commit(); }
+        f96.setVisible(list96.isEmpty());
+    }
+
+    public void method97(Connection c97, JFrame f97) {
+        ArrayList list97 = new ArrayList();
+        list97.add(c97.get(f97.getTitle()));
+        Connection conn = c97;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list97.size()); conn.commit(); }
+        f97.setVisible(list97.isEmpty());
+    }
+
+    public void method98(Connection c98, JFrame f98) {
+        ArrayList list98 = new ArrayList();
+        list98.add(c98.get(f98.getTitle()));
+        Connection conn = c98;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list98.size()); conn.commit(); }
+        f98.setVisible(list98.isEmpty());
+    }
+
+    public void method99(Connection c99, JFrame f99) {
+        ArrayList list99 = new ArrayList();
+        list99.add(c99.get(f99.getTitle()));
+        Connection conn = c99;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list99.size()); conn.commit(); }
+        f99.setVisible(list99.isEmpty());
+    }
+
+    public void method100(Connection c100, JFrame f100) {
+        ArrayList list100 = new ArrayList();
+        list100.add(c100.get(f100.getTitle()));
+        Connection conn = c100;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list100.size()); conn.commit(); }
+        f100.setVisible(list100.isEmpty());
+    }
+
+    public void method101(Connection c101, JFrame f101) {
+        ArrayList list101 = new ArrayList();
+        list101.add(c101.get(f101.getTitle()));
+        Connection conn = c101;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list101.size()); conn.commit(); }
+        f101.setVisible(list101.isEmpty());
+    }
+
+    public void method102(Connection c102, JFrame f102) {
+        ArrayList list102 = new ArrayList();
+        list102.add(c102.get(f102.getTitle()));
+        Connection conn = c102;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list102.size()); conn.commit(); }
+        f102.setVisible(list102.isEmpty());
+    }
+
+    public void method103(Connection c103, JFrame f103) {
+        ArrayList list103 = new ArrayList();
+        list103.add(c103.get(f103.getTitle()));
+        Connection conn = c103;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list103.size()); conn.commit(); }
+        f103.setVisible(list103.isEmpty());
+    }
+
+    public void method104(Connection c104, JFrame f104) {
+        ArrayList list104 = new ArrayList();
+        list104.add(c104.get(f104.getTitle()));
+        Connection conn = c104;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list104.size()); conn.commit(); }
+        f104.setVisible(list104.isEmpty());
+    }
+
+    public void method105(Connection c105, JFrame f105) {
+        ArrayList list105 = new ArrayList();
+        list105.add(c105.get(f105.getTitle()));
+        Connection conn = c105;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list105.size()); conn.commit(); }
+        f105.setVisible(list105.isEmpty());
+    }
+
+    public void method106(Connection c106, JFrame f106) {
+        ArrayList list106 = new ArrayList();
+        list106.add(c106.get(f106.getTitle()));
+        Connection conn = c106;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list106.size()); conn.commit(); }
+        f106.setVisible(list106.isEmpty());
+    }
+
+    public void method107(Connection c107, JFrame f107) {
+        ArrayList list107 = new ArrayList();
+        list107.add(c107.get(f107.getTitle()));
+        Connection conn = c107;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list107.size()); conn.commit(); }
+        f107.setVisible(list107.isEmpty());
+    }
+
+    public void method108(Connection c108, JFrame f108) {
+        ArrayList list108 = new ArrayList();
+        list108.add(c108.get(f108.getTitle()));
+        Connection conn = c108;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list108.size()); conn.commit(); }
+        f108.setVisible(list108.isEmpty());
+    }
+
+    public void method109(Connection c109, JFrame f109) {
+        ArrayList list109 = new ArrayList();
+        list109.add(c109.get(f109.getTitle()));
+        Connection conn = c109;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list109.size()); conn.commit(); }
+        f109.setVisible(list109.isEmpty());
+    }
+
+    public void method110(Connection c110, JFrame f110) {
+        ArrayList list110 = new ArrayList();
+        list110.add(c110.get(f110.getTitle()));
+        Connection conn = c110;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list110.size()); conn.commit(); }
+        f110.setVisible(list110.isEmpty());
+    }
+
+    public void method111(Connection c111, JFrame f111) {
+        ArrayList list111 = new ArrayList();
+        list111.add(c111.get(f111.getTitle()));
+        Connection conn = c111;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list111.size()); conn.commit(); }
+        f111.setVisible(list111.isEmpty());
+    }
+
+    public void method112(Connection c112, JFrame f112) {
+        ArrayList list112 = new ArrayList();
+        list112.add(c112.get(f112.getTitle()));
+        Connection conn = c112;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list112.size()); conn.commit(); }
+        f112.setVisible(list112.isEmpty());
+    }
+
+    public void method113(Connection c113, JFrame f113) {
+        ArrayList list113 = new ArrayList();
+        list113.add(c113.get(f113.getTitle()));
+        Connection conn = c113;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list113.size()); conn.commit(); }
+        f113.setVisible(list113.isEmpty());
+    }
+
+    public void method114(Connection c114, JFrame f114) {
+        ArrayList list114 = new ArrayList();
+        list114.add(c114.get(f114.getTitle()));
+        Connection conn = c114;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list114.size()); conn.commit(); }
+        f114.setVisible(list114.isEmpty());
+    }
+
+    public void method115(Connection c115, JFrame f115) {
+        ArrayList list115 = new ArrayList();
+        list115.add(c115.get(f115.getTitle()));
+        Connection conn = c115;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list115.size()); conn.commit(); }
+        f115.setVisible(list115.isEmpty());
+    }
+
+    public void method116(Connection c116, JFrame f116) {
+        ArrayList list116 = new ArrayList();
+        list116.add(c116.get(f116.getTitle()));
+        Connection conn = c116;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list116.size()); conn.commit(); }
+        f116.setVisible(list116.isEmpty());
+    }
+
+    public void method117(Connection c117, JFrame f117) {
+        ArrayList list117 = new ArrayList();
+        list117.add(c117.get(f117.getTitle()));
+        Connection conn = c117;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list117.size()); conn.commit(); }
+        f117.setVisible(list117.isEmpty());
+    }
+
+    public void method118(Connection c118, JFrame f118) {
+        ArrayList list118 = new ArrayList();
+        list118.add(c118.get(f118.getTitle()));
+        Connection conn = c118;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list118.size()); conn.commit(); }
+        f118.setVisible(list118.isEmpty());
+    }
+
+    public void method119(Connection c119, JFrame f119) {
+        ArrayList list119 = new ArrayList();
+        list119.add(c119.get(f119.getTitle()));
+        Connection conn = c119;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list119.size()); conn.commit(); }
+        f119.setVisible(list119.isEmpty());
+    }
+
+    public void method120(Connection c120, JFrame f120) {
+        ArrayList list120 = new ArrayList();
+        list120.add(c120.get(f120.getTitle()));
+        Connection conn = c120;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list120.size()); conn.commit(); }
+        f120.setVisible(list120.isEmpty());
+    }
+
+    public void method121(Connection c121, JFrame f121) {
+        ArrayList list121 = new ArrayList();
+        list121.add(c121.get(f121.getTitle()));
+        Connection conn = c121;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list121.size()); conn.commit(); }
+        f121.setVisible(list121.isEmpty());
+    }
+
+    public void method122(Connection c122, JFrame f122) {
+        ArrayList list122 = new ArrayList();
+        list122.add(c122.get(f122.getTitle()));
+        Connection conn = c122;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list122.size()); conn.commit(); }
+        f122.setVisible(list122.isEmpty());
+    }
+
+    public void method123(Connection c123, JFrame f123) {
+        ArrayList list123 = new ArrayList();
+        list123.add(c123.get(f123.getTitle()));
+        Connection conn = c123;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list123.size()); conn.commit(); }
+        f123.setVisible(list123.isEmpty());
+    }
+
+    public void method124(Connection c124, JFrame f124) {
+        ArrayList list124 = new ArrayList();
+        list124.add(c124.get(f124.getTitle()));
+        Connection conn = c124;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list124.size()); conn.commit(); }
+        f124.setVisible(list124.isEmpty());
+    }
+
+    public void method125(Connection c125, JFrame f125) {
+        ArrayList list125 = new ArrayList();
+        list125.add(c125.get(f125.getTitle()));
+        Connection conn = c125;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list125.size()); conn.commit(); }
+        f125.setVisible(list125.isEmpty());
+    }
+
+    public void method126(Connection c126, JFrame f126) {
+        ArrayList list126 = new ArrayList();
+        list126.add(c126.get(f126.getTitle()));
+        Connection conn = c126;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list126.size()); conn.commit(); }
+        f126.setVisible(list126.isEmpty());
+    }
+
+    public void method127(Connection c127, JFrame f127) {
+        ArrayList list127 = new ArrayList();
+        list127.add(c127.get(f127.getTitle()));
+        Connection conn = c127;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list127.size()); conn.commit(); }
+        f127.setVisible(list127.isEmpty());
+    }
+
+    public void method128(Connection c128, JFrame f128) {
+        ArrayList list128 = new ArrayList();
+        list128.add(c128.get(f128.getTitle()));
+        Connection conn = c128;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list128.size()); conn.commit(); }
+        f128.setVisible(list128.isEmpty());
+    }
+
+    public void method129(Connection c129, JFrame f129) {
+        ArrayList list129 = new ArrayList();
+        list129.add(c129.get(f129.getTitle()));
+        Connection conn = c129;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list129.size()); conn.commit(); }
+        f129.setVisible(list129.isEmpty());
+    }
+
+    public void method130(Connection c130, JFrame f130) {
+        ArrayList list130 = new ArrayList();
+        list130.add(c130.get(f130.getTitle()));
+        Connection conn = c130;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list130.size()); conn.commit(); }
+        f130.setVisible(list130.isEmpty());
+    }
+
+    public void method131(Connection c131, JFrame f131) {
+        ArrayList list131 = new ArrayList();
+        list131.add(c131.get(f131.getTitle()));
+        Connection conn = c131;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list131.size()); conn.commit(); }
+        f131.setVisible(list131.isEmpty());
+    }
+
+    public void method132(Connection c132, JFrame f132) {
+        ArrayList list132 = new ArrayList();
+        list132.add(c132.get(f132.getTitle()));
+        Connection conn = c132;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list132.size()); conn.commit(); }
+        f132.setVisible(list132.isEmpty());
+    }
+
+    public void method133(Connection c133, JFrame f133) {
+        ArrayList list133 = new ArrayList();
+        list133.add(c133.get(f133.getTitle()));
+        Connection conn = c133;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list133.size()); conn.commit(); }
+        f133.setVisible(list133.isEmpty());
+    }
+
+    public void method134(Connection c134, JFrame f134) {
+        ArrayList list134 = new ArrayList();
+        list134.add(c134.get(f134.getTitle()));
+        Connection conn = c134;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list134.size()); conn.commit(); }
+        f134.setVisible(list134.isEmpty());
+    }
+
+    public void method135(Connection c135, JFrame f135) {
+        ArrayList list135 = new ArrayList();
+        list135.add(c135.get(f135.getTitle()));
+        Connection conn = c135;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list135.size()); conn.commit(); }
+        f135.setVisible(list135.isEmpty());
+    }
+
+    public void method136(Connection c136, JFrame f136) {
+        ArrayList list136 = new ArrayList();
+        list136.add(c136.get(f136.getTitle()));
+        Connection conn = c136;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list136.size()); conn.commit(); }
+        f136.setVisible(list136.isEmpty());
+    }
+
+    public void method137(Connection c137, JFrame f137) {
+        ArrayList list137 = new ArrayList();
+        list137.add(c137.get(f137.getTitle()));
+        Connection conn = c137;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list137.size()); conn.commit(); }
+        f137.setVisible(list137.isEmpty());
+    }
+
+    public void method138(Connection c138, JFrame f138) {
+        ArrayList list138 = new ArrayList();
+        list138.add(c138.get(f138.getTitle()));
+        Connection conn = c138;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list138.size()); conn.commit(); }
+        f138.setVisible(list138.isEmpty());
+    }
+
+    public void method139(Connection c139, JFrame f139) {
+        ArrayList list139 = new ArrayList();
+        list139.add(c139.get(f139.getTitle()));
+        Connection conn = c139;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list139.size()); conn.commit(); }
+        f139.setVisible(list139.isEmpty());
+    }
+
+    public void method140(Connection c140, JFrame f140) {
+        ArrayList list140 = new ArrayList();
+        list140.add(c140.get(f140.getTitle()));
+        Connection conn = c140;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list140.size()); conn.commit(); }
+        f140.setVisible(list140.isEmpty());
+    }
+
+    public void method141(Connection c141, JFrame f141) {
+        ArrayList list141 = new ArrayList();
+        list141.add(c141.get(f141.getTitle()));
+        Connection conn = c141;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list141.size()); conn.commit(); }
+        f141.setVisible(list141.isEmpty());
+    }
+
+    public void method142(Connection c142, JFrame f142) {
+        ArrayList list142 = new ArrayList();
+        list142.add(c142.get(f142.getTitle()));
+        Connection conn = c142;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list142.size()); conn.commit(); }
+        f142.setVisible(list142.isEmpty());
+    }
+
+    public void method143(Connection c143, JFrame f143) {
+        ArrayList list143 = new ArrayList();
+        list143.add(c143.get(f143.getTitle()));
+        Connection conn = c143;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list143.size()); conn.commit(); }
+        f143.setVisible(list143.isEmpty());
+    }
+
+    public void method144(Connection c144, JFrame f144) {
+        ArrayList list144 = new ArrayList();
+        list144.add(c144.get(f144.getTitle()));
+        Connection conn = c144;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list144.size()); conn.commit(); }
+        f144.setVisible(list144.isEmpty());
+    }
+
+    public void method145(Connection c145, JFrame f145) {
+        ArrayList list145 = new ArrayList();
+        list145.add(c145.get(f145.getTitle()));
+        Connection conn = c145;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list145.size()); conn.commit(); }
+        f145.setVisible(list145.isEmpty());
+    }
+
+    public void method146(Connection c146, JFrame f146) {
+        ArrayList list146 = new ArrayList();
+        list146.add(c146.get(f146.getTitle()));
+        Connection conn = c146;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list146.size()); conn.commit(); }
+        f146.setVisible(list146.isEmpty());
+    }
+
+    public void method147(Connection c147, JFrame f147) {
+        ArrayList list147 = new ArrayList();
+        list147.add(c147.get(f147.getTitle()));
+        Connection conn = c147;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list147.size()); conn.commit(); }
+        f147.setVisible(list147.isEmpty());
+    }
+
+    public void method148(Connection c148, JFrame f148) {
+        ArrayList list148 = new ArrayList();
+        list148.add(c148.get(f148.getTitle()));
+        Connection conn = c148;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list148.size()); conn.commit(); }
+        f148.setVisible(list148.isEmpty());
+    }
+
+    public void method149(Connection c149, JFrame f149) {
+        ArrayList list149 = new ArrayList();
+        list149.add(c149.get(f149.getTitle()));
+        Connection conn = c149;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list149.size()); conn.commit(); }
+        f149.setVisible(list149.isEmpty());
+    }
+
+    public void method150(Connection c150, JFrame f150) {
+        ArrayList list150 = new ArrayList();
+        list150.add(c150.get(f150.getTitle()));
+        Connection conn = c150;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list150.size()); conn.commit(); }
+        f150.setVisible(list150.isEmpty());
+    }
+
+    public void method151(Connection c151, JFrame f151) {
+        ArrayList list151 = new ArrayList();
+        list151.add(c151.get(f151.getTitle()));
+        Connection conn = c151;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list151.size()); conn.commit(); }
+        f151.setVisible(list151.isEmpty());
+    }
+
+    public void method152(Connection c152, JFrame f152) {
+        ArrayList list152 = new ArrayList();
+        list152.add(c152.get(f152.getTitle()));
+        Connection conn = c152;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list152.size()); conn.commit(); }
+        f152.setVisible(list152.isEmpty());
+    }
+
+    public void method153(Connection c153, JFrame f153) {
+        ArrayList list153 = new ArrayList();
+        list153.add(c153.get(f153.getTitle()));
+        Connection conn = c153;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list153.size()); conn.commit(); }
+        f153.setVisible(list153.isEmpty());
+    }
+
+    public void method154(Connection c154, JFrame f154) {
+        ArrayList list154 = new ArrayList();
+        list154.add(c154.get(f154.getTitle()));
+        Connection conn = c154;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list154.size()); conn.commit(); }
+        f154.setVisible(list154.isEmpty());
+    }
+
+    public void method155(Connection c155, JFrame f155) {
+        ArrayList list155 = new ArrayList();
+        list155.add(c155.get(f155.getTitle()));
+        Connection conn = c155;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list155.size()); conn.commit(); }
+        f155.setVisible(list155.isEmpty());
+    }
+
+    public void method156(Connection c156, JFrame f156) {
+        ArrayList list156 = new ArrayList();
+        list156.add(c156.get(f156.getTitle()));
+        Connection conn = c156;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list156.size()); conn.commit(); }
+        f156.setVisible(list156.isEmpty());
+    }
+
+    public void method157(Connection c157, JFrame f157) {
+        ArrayList list157 = new ArrayList();
+        list157.add(c157.get(f157.getTitle()));
+        Connection conn = c157;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list157.size()); conn.commit(); }
+        f157.setVisible(list157.isEmpty());
+    }
+
+    public void method158(Connection c158, JFrame f158) {
+        ArrayList list158 = new ArrayList();
+        list158.add(c158.get(f158.getTitle()));
+        Connection conn = c158;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list158.size()); conn.commit(); }
+        f158.setVisible(list158.isEmpty());
+    }
+
+    public void method159(Connection c159, JFrame f159) {
+        ArrayList list159 = new ArrayList();
+        list159.add(c159.get(f159.getTitle()));
+        Connection conn = c159;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list159.size()); conn.commit(); }
+        f159.setVisible(list159.isEmpty());
+    }
+
+    public void method160(Connection c160, JFrame f160) {
+        ArrayList list160 = new ArrayList();
+        list160.add(c160.get(f160.getTitle()));
+        Connection conn = c160;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list160.size()); conn.commit(); }
+        f160.setVisible(list160.isEmpty());
+    }
+
+    public void method161(Connection c161, JFrame f161) {
+        ArrayList list161 = new ArrayList();
+        list161.add(c161.get(f161.getTitle()));
+        Connection conn = c161;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list161.size()); conn.commit(); }
+        f161.setVisible(list161.isEmpty());
+    }
+
+    public void method162(Connection c162, JFrame f162) {
+        ArrayList list162 = new ArrayList();
+        list162.add(c162.get(f162.getTitle()));
+        Connection conn = c162;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list162.size()); conn.commit(); }
+        f162.setVisible(list162.isEmpty());
+    }
+
+    public void method163(Connection c163, JFrame f163) {
+        ArrayList list163 = new ArrayList();
+        list163.add(c163.get(f163.getTitle()));
+        Connection conn = c163;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list163.size()); conn.commit(); }
+        f163.setVisible(list163.isEmpty());
+    }
+
+    public void method164(Connection c164, JFrame f164) {
+        ArrayList list164 = new ArrayList();
+        list164.add(c164.get(f164.getTitle()));
+        Connection conn = c164;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list164.size()); conn.commit(); }
+        f164.setVisible(list164.isEmpty());
+    }
+
+    public void method165(Connection c165, JFrame f165) {
+        ArrayList list165 = new ArrayList();
+        list165.add(c165.get(f165.getTitle()));
+        Connection conn = c165;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list165.size()); conn.commit(); }
+        f165.setVisible(list165.isEmpty());
+    }
+
+    public void method166(Connection c166, JFrame f166) {
+        ArrayList list166 = new ArrayList();
+        list166.add(c166.get(f166.getTitle()));
+        Connection conn = c166;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list166.size()); conn.commit(); }
+        f166.setVisible(list166.isEmpty());
+    }
+
+    public void method167(Connection c167, JFrame f167) {
+        ArrayList list167 = new ArrayList();
+        list167.add(c167.get(f167.getTitle()));
+        Connection conn = c167;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list167.size()); conn.commit(); }
+        f167.setVisible(list167.isEmpty());
+    }
+
+    public void method168(Connection c168, JFrame f168) {
+        ArrayList list168 = new ArrayList();
+        list168.add(c168.get(f168.getTitle()));
+        Connection conn = c168;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list168.size()); conn.commit(); }
+        f168.setVisible(list168.isEmpty());
+    }
+
+    public void method169(Connection c169, JFrame f169) {
+        ArrayList list169 = new ArrayList();
+        list169.add(c169.get(f169.getTitle()));
+        Connection conn = c169;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list169.size()); conn.commit(); }
+        f169.setVisible(list169.isEmpty());
+    }
+
+    public void method170(Connection c170, JFrame f170) {
+        ArrayList list170 = new ArrayList();
+        list170.add(c170.get(f170.getTitle()));
+        Connection conn = c170;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list170.size()); conn.commit(); }
+        f170.setVisible(list170.isEmpty());
+    }
+
+    public void method171(Connection c171, JFrame f171) {
+        ArrayList list171 = new ArrayList();
+        list171.add(c171.get(f171.getTitle()));
+        Connection conn = c171;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list171.size()); conn.commit(); }
+        f171.setVisible(list171.isEmpty());
+    }
+
+    public void method172(Connection c172, JFrame f172) {
+        ArrayList list172 = new ArrayList();
+        list172.add(c172.get(f172.getTitle()));
+        Connection conn = c172;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list172.size()); conn.commit(); }
+        f172.setVisible(list172.isEmpty());
+    }
+
+    public void method173(Connection c173, JFrame f173) {
+        ArrayList list173 = new ArrayList();
+        list173.add(c173.get(f173.getTitle()));
+        Connection conn = c173;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list173.size()); conn.commit(); }
+        f173.setVisible(list173.isEmpty());
+    }
+
+    public void method174(Connection c174, JFrame f174) {
+        ArrayList list174 = new ArrayList();
+        list174.add(c174.get(f174.getTitle()));
+        Connection conn = c174;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list174.size()); conn.commit(); }
+        f174.setVisible(list174.isEmpty());
+    }
+
+    public void method175(Connection c175, JFrame f175) {
+        ArrayList list175 = new ArrayList();
+        list175.add(c175.get(f175.getTitle()));
+        Connection conn = c175;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list175.size()); conn.commit(); }
+        f175.setVisible(list175.isEmpty());
+    }
+
+    public void method176(Connection c176, JFrame f176) {
+        ArrayList list176 = new ArrayList();
+        list176.add(c176.get(f176.getTitle()));
+        Connection conn = c176;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list176.size()); conn.commit(); }
+        f176.setVisible(list176.isEmpty());
+    }
+
+    public void method177(Connection c177, JFrame f177) {
+        ArrayList list177 = new ArrayList();
+        list177.add(c177.get(f177.getTitle()));
+        Connection conn = c177;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list177.size()); conn.commit(); }
+        f177.setVisible(list177.isEmpty());
+    }
+
+    public void method178(Connection c178, JFrame f178) {
+        ArrayList list178 = new ArrayList();
+        list178.add(c178.get(f178.getTitle()));
+        Connection conn = c178;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list178.size()); conn.commit(); }
+        f178.setVisible(list178.isEmpty());
+    }
+
+    public void method179(Connection c179, JFrame f179) {
+        ArrayList list179 = new ArrayList();
+        list179.add(c179.get(f179.getTitle()));
+        Connection conn = c179;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list179.size()); conn.commit(); }
+        f179.setVisible(list179.isEmpty());
+    }
+
+    public void method180(Connection c180, JFrame f180) {
+        ArrayList list180 = new ArrayList();
+        list180.add(c180.get(f180.getTitle()));
+        Connection conn = c180;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list180.size()); conn.commit(); }
+        f180.setVisible(list180.isEmpty());
+    }
+
+    public void method181(Connection c181, JFrame f181) {
+        ArrayList list181 = new ArrayList();
+        list181.add(c181.get(f181.getTitle()));
+        Connection conn = c181;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list181.size()); conn.commit(); }
+        f181.setVisible(list181.isEmpty());
+    }
+
+    public void method182(Connection c182, JFrame f182) {
+        ArrayList list182 = new ArrayList();
+        list182.add(c182.get(f182.getTitle()));
+        Connection conn = c182;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list182.size()); conn.commit(); }
+        f182.setVisible(list182.isEmpty());
+    }
+
+    public void method183(Connection c183, JFrame f183) {
+        ArrayList list183 = new ArrayList();
+        list183.add(c183.get(f183.getTitle()));
+        Connection conn = c183;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list183.size()); conn.commit(); }
+        f183.setVisible(list183.isEmpty());
+    }
+
+    public void method184(Connection c184, JFrame f184) {
+        ArrayList list184 = new ArrayList();
+        list184.add(c184.get(f184.getTitle()));
+        Connection conn = c184;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list184.size()); conn.commit(); }
+        f184.setVisible(list184.isEmpty());
+    }
+
+    public void method185(Connection c185, JFrame f185) {
+        ArrayList list185 = new ArrayList();
+        list185.add(c185.get(f185.getTitle()));
+        Connection conn = c185;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list185.size()); conn.commit(); }
+        f185.setVisible(list185.isEmpty());
+    }
+
+    public void method186(Connection c186, JFrame f186) {
+        ArrayList list186 = new ArrayList();
+        list186.add(c186.get(f186.getTitle()));
+        Connection conn = c186;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list186.size()); conn.commit(); }
+        f186.setVisible(list186.isEmpty());
+    }
+
+    public void method187(Connection c187, JFrame f187) {
+        ArrayList list187 = new ArrayList();
+        list187.add(c187.get(f187.getTitle()));
+        Connection conn = c187;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list187.size()); conn.commit(); }
+        f187.setVisible(list187.isEmpty());
+    }
+
+    public void method188(Connection c188, JFrame f188) {
+        ArrayList list188 = new ArrayList();
+        list188.add(c188.get(f188.getTitle()));
+        Connection conn = c188;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list188.size()); conn.commit(); }
+        f188.setVisible(list188.isEmpty());
+    }
+
+    public void method189(Connection c189, JFrame f189) {
+        ArrayList list189 = new ArrayList();
+        list189.add(c189.get(f189.getTitle()));
+        Connection conn = c189;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list189.size()); conn.commit(); }
+        f189.setVisible(list189.isEmpty());
+    }
+
+    public void method190(Connection c190, JFrame f190) {
+        ArrayList list190 = new ArrayList();
+        list190.add(c190.get(f190.getTitle()));
+        Connection conn = c190;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list190.size()); conn.commit(); }
+        f190.setVisible(list190.isEmpty());
+    }
+
+    public void method191(Connection c191, JFrame f191) {
+        ArrayList list191 = new ArrayList();
+        list191.add(c191.get(f191.getTitle()));
+        Connection conn = c191;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list191.size()); conn.commit(); }
+        f191.setVisible(list191.isEmpty());
+    }
+
+    public void method192(Connection c192, JFrame f192) {
+        ArrayList list192 = new ArrayList();
+        list192.add(c192.get(f192.getTitle()));
+        Connection conn = c192;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list192.size()); conn.commit(); }
+        f192.setVisible(list192.isEmpty());
+    }
+
+    public void method193(Connection c193, JFrame f193) {
+        ArrayList list193 = new ArrayList();
+        list193.add(c193.get(f193.getTitle()));
+        Connection conn = c193;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list193.size()); conn.commit(); }
+        f193.setVisible(list193.isEmpty());
+    }
+
+    public void method194(Connection c194, JFrame f194) {
+        ArrayList list194 = new ArrayList();
+        list194.add(c194.get(f194.getTitle()));
+        Connection conn = c194;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list194.size()); conn.commit(); }
+        f194.setVisible(list194.isEmpty());
+    }
+
+    public void method195(Connection c195, JFrame f195) {
+        ArrayList list195 = new ArrayList();
+        list195.add(c195.get(f195.getTitle()));
+        Connection conn = c195;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list195.size()); conn.commit(); }
+        f195.setVisible(list195.isEmpty());
+    }
+
+    public void method196(Connection c196, JFrame f196) {
+        ArrayList list196 = new ArrayList();
+        list196.add(c196.get(f196.getTitle()));
+        Connection conn = c196;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list196.size()); conn.commit(); }
+        f196.setVisible(list196.isEmpty());
+    }
+
+    public void method197(Connection c197, JFrame f197) {
+        ArrayList list197 = new ArrayList();
+        list197.add(c197.get(f197.getTitle()));
+        Connection conn = c197;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list197.size()); conn.commit(); }
+        f197.setVisible(list197.isEmpty());
+    }
+
+    public void method198(Connection c198, JFrame f198) {
+        ArrayList list198 = new ArrayList();
+        list198.add(c198.get(f198.getTitle()));
+        Connection conn = c198;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list198.size()); conn.commit(); }
+        f198.setVisible(list198.isEmpty());
+    }
+
+    public void method199(Connection c199, JFrame f199) {
+        ArrayList list199 = new ArrayList();
+        list199.add(c199.get(f199.getTitle()));
+        Connection conn = c199;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list199.size()); conn.commit(); }
+        f199.setVisible(list199.isEmpty());
+    }
+
+    public void method200(Connection c200, JFrame f200) {
+        ArrayList list200 = new ArrayList();
+        list200.add(c200.get(f200.getTitle()));
+        Connection conn = c200;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list200.size()); conn.commit(); }
+        f200.setVisible(list200.isEmpty());
+    }
+
+    public void method201(Connection c201, JFrame f201) {
+        ArrayList list201 = new ArrayList();
+        list201.add(c201.get(f201.getTitle()));
+        Connection conn = c201;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list201.size()); conn.commit(); }
+        f201.setVisible(list201.isEmpty());
+    }
+
+    public void method202(Connection c202, JFrame f202) {
+        ArrayList list202 = new ArrayList();
+        list202.add(c202.get(f202.getTitle()));
+        Connection conn = c202;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list202.size()); conn.commit(); }
+        f202.setVisible(list202.isEmpty());
+    }
+
+    public void method203(Connection c203, JFrame f203) {
+        ArrayList list203 = new ArrayList();
+        list203.add(c203.get(f203.getTitle()));
+        Connection conn = c203;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list203.size()); conn.commit(); }
+        f203.setVisible(list203.isEmpty());
+    }
+
+    public void method204(Connection c204, JFrame f204) {
+        ArrayList list204 = new ArrayList();
+        list204.add(c204.get(f204.getTitle()));
+        Connection conn = c204;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list204.size()); conn.commit(); }
+        f204.setVisible(list204.isEmpty());
+    }
+
+    public void method205(Connection c205, JFrame f205) {
+        ArrayList list205 = new ArrayList();
+        list205.add(c205.get(f205.getTitle()));
+        Connection conn = c205;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list205.size()); conn.commit(); }
+        f205.setVisible(list205.isEmpty());
+    }
+
+    public void method206(Connection c206, JFrame f206) {
+        ArrayList list206 = new ArrayList();
+        list206.add(c206.get(f206.getTitle()));
+        Connection conn = c206;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list206.size()); conn.commit(); }
+        f206.setVisible(list206.isEmpty());
+    }
+
+    public void method207(Connection c207, JFrame f207) {
+        ArrayList list207 = new ArrayList();
+        list207.add(c207.get(f207.getTitle()));
+        Connection conn = c207;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list207.size()); conn.commit(); }
+        f207.setVisible(list207.isEmpty());
+    }
+
+    public void method208(Connection c208, JFrame f208) {
+        ArrayList list208 = new ArrayList();
+        list208.add(c208.get(f208.getTitle()));
+        Connection conn = c208;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list208.size()); conn.commit(); }
+        f208.setVisible(list208.isEmpty());
+    }
+
+    public void method209(Connection c209, JFrame f209) {
+        ArrayList list209 = new ArrayList();
+        list209.add(c209.get(f209.getTitle()));
+        Connection conn = c209;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list209.size()); conn.commit(); }
+        f209.setVisible(list209.isEmpty());
+    }
+
+    public void method210(Connection c210, JFrame f210) {
+        ArrayList list210 = new ArrayList();
+        list210.add(c210.get(f210.getTitle()));
+        Connection conn = c210;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list210.size()); conn.commit(); }
+        f210.setVisible(list210.isEmpty());
+    }
+
+    public void method211(Connection c211, JFrame f211) {
+        ArrayList list211 = new ArrayList();
+        list211.add(c211.get(f211.getTitle()));
+        Connection conn = c211;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list211.size()); conn.commit(); }
+        f211.setVisible(list211.isEmpty());
+    }
+
+    public void method212(Connection c212, JFrame f212) {
+        ArrayList list212 = new ArrayList();
+        list212.add(c212.get(f212.getTitle()));
+        Connection conn = c212;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list212.size()); conn.commit(); }
+        f212.setVisible(list212.isEmpty());
+    }
+
+    public void method213(Connection c213, JFrame f213) {
+        ArrayList list213 = new ArrayList();
+        list213.add(c213.get(f213.getTitle()));
+        Connection conn = c213;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list213.size()); conn.commit(); }
+        f213.setVisible(list213.isEmpty());
+    }
+
+    public void method214(Connection c214, JFrame f214) {
+        ArrayList list214 = new ArrayList();
+        list214.add(c214.get(f214.getTitle()));
+        Connection conn = c214;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list214.size()); conn.commit(); }
+        f214.setVisible(list214.isEmpty());
+    }
+
+    public void method215(Connection c215, JFrame f215) {
+        ArrayList list215 = new ArrayList();
+        list215.add(c215.get(f215.getTitle()));
+        Connection conn = c215;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list215.size()); conn.commit(); }
+        f215.setVisible(list215.isEmpty());
+    }
+
+    public void method216(Connection c216, JFrame f216) {
+        ArrayList list216 = new ArrayList();
+        list216.add(c216.get(f216.getTitle()));
+        Connection conn = c216;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list216.size()); conn.commit(); }
+        f216.setVisible(list216.isEmpty());
+    }
+
+    public void method217(Connection c217, JFrame f217) {
+        ArrayList list217 = new ArrayList();
+        list217.add(c217.get(f217.getTitle()));
+        Connection conn = c217;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list217.size()); conn.commit(); }
+        f217.setVisible(list217.isEmpty());
+    }
+
+    public void method218(Connection c218, JFrame f218) {
+        ArrayList list218 = new ArrayList();
+        list218.add(c218.get(f218.getTitle()));
+        Connection conn = c218;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list218.size()); conn.commit(); }
+        f218.setVisible(list218.isEmpty());
+    }
+
+    public void method219(Connection c219, JFrame f219) {
+        ArrayList list219 = new ArrayList();
+        list219.add(c219.get(f219.getTitle()));
+        Connection conn = c219;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list219.size()); conn.commit(); }
+        f219.setVisible(list219.isEmpty());
+    }
+
+    public void method220(Connection c220, JFrame f220) {
+        ArrayList list220 = new ArrayList();
+        list220.add(c220.get(f220.getTitle()));
+        Connection conn = c220;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list220.size()); conn.commit(); }
+        f220.setVisible(list220.isEmpty());
+    }
+
+    public void method221(Connection c221, JFrame f221) {
+        ArrayList list221 = new ArrayList();
+        list221.add(c221.get(f221.getTitle()));
+        Connection conn = c221;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list221.size()); conn.commit(); }
+        f221.setVisible(list221.isEmpty());
+    }
+
+    public void method222(Connection c222, JFrame f222) {
+        ArrayList list222 = new ArrayList();
+        list222.add(c222.get(f222.getTitle()));
+        Connection conn = c222;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list222.size()); conn.commit(); }
+        f222.setVisible(list222.isEmpty());
+    }
+
+    public void method223(Connection c223, JFrame f223) {
+        ArrayList list223 = new ArrayList();
+        list223.add(c223.get(f223.getTitle()));
+        Connection conn = c223;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list223.size()); conn.commit(); }
+        f223.setVisible(list223.isEmpty());
+    }
+
+    public void method224(Connection c224, JFrame f224) {
+        ArrayList list224 = new ArrayList();
+        list224.add(c224.get(f224.getTitle()));
+        Connection conn = c224;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list224.size()); conn.commit(); }
+        f224.setVisible(list224.isEmpty());
+    }
+
+    public void method225(Connection c225, JFrame f225) {
+        ArrayList list225 = new ArrayList();
+        list225.add(c225.get(f225.getTitle()));
+        Connection conn = c225;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list225.size()); conn.commit(); }
+        f225.setVisible(list225.isEmpty());
+    }
+
+    public void method226(Connection c226, JFrame f226) {
+        ArrayList list226 = new ArrayList();
+        list226.add(c226.get(f226.getTitle()));
+        Connection conn = c226;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list226.size()); conn.commit(); }
+        f226.setVisible(list226.isEmpty());
+    }
+
+    public void method227(Connection c227, JFrame f227) {
+        ArrayList list227 = new ArrayList();
+        list227.add(c227.get(f227.getTitle()));
+        Connection conn = c227;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list227.size()); conn.commit(); }
+        f227.setVisible(list227.isEmpty());
+    }
+
+    public void method228(Connection c228, JFrame f228) {
+        ArrayList list228 = new ArrayList();
+        list228.add(c228.get(f228.getTitle()));
+        Connection conn = c228;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list228.size()); conn.commit(); }
+        f228.setVisible(list228.isEmpty());
+    }
+
+    public void method229(Connection c229, JFrame f229) {
+        ArrayList list229 = new ArrayList();
+        list229.add(c229.get(f229.getTitle()));
+        Connection conn = c229;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list229.size()); conn.commit(); }
+        f229.setVisible(list229.isEmpty());
+    }
+
+    public void method230(Connection c230, JFrame f230) {
+        ArrayList list230 = new ArrayList();
+        list230.add(c230.get(f230.getTitle()));
+        Connection conn = c230;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list230.size()); conn.commit(); }
+        f230.setVisible(list230.isEmpty());
+    }
+
+    public void method231(Connection c231, JFrame f231) {
+        ArrayList list231 = new ArrayList();
+        list231.add(c231.get(f231.getTitle()));
+        Connection conn = c231;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list231.size()); conn.commit(); }
+        f231.setVisible(list231.isEmpty());
+    }
+
+    public void method232(Connection c232, JFrame f232) {
+        ArrayList list232 = new ArrayList();
+        list232.add(c232.get(f232.getTitle()));
+        Connection conn = c232;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list232.size()); conn.commit(); }
+        f232.setVisible(list232.isEmpty());
+    }
+
+    public void method233(Connection c233, JFrame f233) {
+        ArrayList list233 = new ArrayList();
+        list233.add(c233.get(f233.getTitle()));
+        Connection conn = c233;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list233.size()); conn.commit(); }
+        f233.setVisible(list233.isEmpty());
+    }
+
+    public void method234(Connection c234, JFrame f234) {
+        ArrayList list234 = new ArrayList();
+        list234.add(c234.get(f234.getTitle()));
+        Connection conn = c234;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list234.size()); conn.commit(); }
+        f234.setVisible(list234.isEmpty());
+    }
+
+    public void method235(Connection c235, JFrame f235) {
+        ArrayList list235 = new ArrayList();
+        list235.add(c235.get(f235.getTitle()));
+        Connection conn = c235;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list235.size()); conn.commit(); }
+        f235.setVisible(list235.isEmpty());
+    }
+
+    public void method236(Connection c236, JFrame f236) {
+        ArrayList list236 = new ArrayList();
+        list236.add(c236.get(f236.getTitle()));
+        Connection conn = c236;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list236.size()); conn.commit(); }
+        f236.setVisible(list236.isEmpty());
+    }
+
+    public void method237(Connection c237, JFrame f237) {
+        ArrayList list237 = new ArrayList();
+        list237.add(c237.get(f237.getTitle()));
+        Connection conn = c237;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list237.size()); conn.commit(); }
+        f237.setVisible(list237.isEmpty());
+    }
+
+    public void method238(Connection c238, JFrame f238) {
+        ArrayList list238 = new ArrayList();
+        list238.add(c238.get(f238.getTitle()));
+        Connection conn = c238;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list238.size()); conn.commit(); }
+        f238.setVisible(list238.isEmpty());
+    }
+
+    public void method239(Connection c239, JFrame f239) {
+        ArrayList list239 = new ArrayList();
+        list239.add(c239.get(f239.getTitle()));
+        Connection conn = c239;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list239.size()); conn.commit(); }
+        f239.setVisible(list239.isEmpty());
+    }
+
+    public void method240(Connection c240, JFrame f240) {
+        ArrayList list240 = new ArrayList();
+        list240.add(c240.get(f240.getTitle()));
+        Connection conn = c240;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list240.size()); conn.commit(); }
+        f240.setVisible(list240.isEmpty());
+    }
+
+    public void method241(Connection c241, JFrame f241) {
+        ArrayList list241 = new ArrayList();
+        list241.add(c241.get(f241.getTitle()));
+        Connection conn = c241;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list241.size()); conn.commit(); }
+        f241.setVisible(list241.isEmpty());
+    }
+
+    public void method242(Connection c242, JFrame f242) {
+        ArrayList list242 = new ArrayList();
+        list242.add(c242.get(f242.getTitle()));
+        Connection conn = c242;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list242.size()); conn.commit(); }
+        f242.setVisible(list242.isEmpty());
+    }
+
+    public void method243(Connection c243, JFrame f243) {
+        ArrayList list243 = new ArrayList();
+        list243.add(c243.get(f243.getTitle()));
+        Connection conn = c243;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list243.size()); conn.commit(); }
+        f243.setVisible(list243.isEmpty());
+    }
+
+    public void method244(Connection c244, JFrame f244) {
+        ArrayList list244 = new ArrayList();
+        list244.add(c244.get(f244.getTitle()));
+        Connection conn = c244;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list244.size()); conn.commit(); }
+        f244.setVisible(list244.isEmpty());
+    }
+
+    public void method245(Connection c245, JFrame f245) {
+        ArrayList list245 = new ArrayList();
+        list245.add(c245.get(f245.getTitle()));
+        Connection conn = c245;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list245.size()); conn.commit(); }
+        f245.setVisible(list245.isEmpty());
+    }
+
+    public void method246(Connection c246, JFrame f246) {
+        ArrayList list246 = new ArrayList();
+        list246.add(c246.get(f246.getTitle()));
+        Connection conn = c246;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list246.size()); conn.commit(); }
+        f246.setVisible(list246.isEmpty());
+    }
+
+    public void method247(Connection c247, JFrame f247) {
+        ArrayList list247 = new ArrayList();
+        list247.add(c247.get(f247.getTitle()));
+        Connection conn = c247;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list247.size()); conn.commit(); }
+        f247.setVisible(list247.isEmpty());
+    }
+
+    public void method248(Connection c248, JFrame f248) {
+        ArrayList list248 = new ArrayList();
+        list248.add(c248.get(f248.getTitle()));
+        Connection conn = c248;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list248.size()); conn.commit(); }
+        f248.setVisible(list248.isEmpty());
+    }
+
+    public void method249(Connection c249, JFrame f249) {
+        ArrayList list249 = new ArrayList();
+        list249.add(c249.get(f249.getTitle()));
+        Connection conn = c249;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list249.size()); conn.commit(); }
+        f249.setVisible(list249.isEmpty());
+    }
+
+    public void method250(Connection c250, JFrame f250) {
+        ArrayList list250 = new ArrayList();
+        list250.add(c250.get(f250.getTitle()));
+        Connection conn = c250;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list250.size()); conn.commit(); }
+        f250.setVisible(list250.isEmpty());
+    }
+
+    public void method251(Connection c251, JFrame f251) {
+        ArrayList list251 = new ArrayList();
+        list251.add(c251.get(f251.getTitle()));
+        Connection conn = c251;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list251.size()); conn.commit(); }
+        f251.setVisible(list251.isEmpty());
+    }
+
+    public void method252(Connection c252, JFrame f252) {
+        ArrayList list252 = new ArrayList();
+        list252.add(c252.get(f252.getTitle()));
+        Connection conn = c252;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list252.size()); conn.commit(); }
+        f252.setVisible(list252.isEmpty());
+    }
+
+    public void method253(Connection c253, JFrame f253) {
+        ArrayList list253 = new ArrayList();
+        list253.add(c253.get(f253.getTitle()));
+        Connection conn = c253;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list253.size()); conn.commit(); }
+        f253.setVisible(list253.isEmpty());
+    }
+
+    public void method254(Connection c254, JFrame f254) {
+        ArrayList list254 = new ArrayList();
+        list254.add(c254.get(f254.getTitle()));
+        Connection conn = c254;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list254.size()); conn.commit(); }
+        f254.setVisible(list254.isEmpty());
+    }
+
+    public void method255(Connection c255, JFrame f255) {
+        ArrayList list255 = new ArrayList();
+        list255.add(c255.get(f255.getTitle()));
+        Connection conn = c255;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list255.size()); conn.commit(); }
+        f255.setVisible(list255.isEmpty());
+    }
+
+    public void method256(Connection c256, JFrame f256) {
+        ArrayList list256 = new ArrayList();
+        list256.add(c256.get(f256.getTitle()));
+        Connection conn = c256;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list256.size()); conn.commit(); }
+        f256.setVisible(list256.isEmpty());
+    }
+
+    public void method257(Connection c257, JFrame f257) {
+        ArrayList list257 = new ArrayList();
+        list257.add(c257.get(f257.getTitle()));
+        Connection conn = c257;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list257.size()); conn.commit(); }
+        f257.setVisible(list257.isEmpty());
+    }
+
+    public void method258(Connection c258, JFrame f258) {
+        ArrayList list258 = new ArrayList();
+        list258.add(c258.get(f258.getTitle()));
+        Connection conn = c258;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list258.size()); conn.commit(); }
+        f258.setVisible(list258.isEmpty());
+    }
+
+    public void method259(Connection c259, JFrame f259) {
+        ArrayList list259 = new ArrayList();
+        list259.add(c259.get(f259.getTitle()));
+        Connection conn = c259;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list259.size()); conn.commit(); }
+        f259.setVisible(list259.isEmpty());
+    }
+
+    public void method260(Connection c260, JFrame f260) {
+        ArrayList list260 = new ArrayList();
+        list260.add(c260.get(f260.getTitle()));
+        Connection conn = c260;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list260.size()); conn.commit(); }
+        f260.setVisible(list260.isEmpty());
+    }
+
+    public void method261(Connection c261, JFrame f261) {
+        ArrayList list261 = new ArrayList();
+        list261.add(c261.get(f261.getTitle()));
+        Connection conn = c261;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list261.size()); conn.commit(); }
+        f261.setVisible(list261.isEmpty());
+    }
+
+    public void method262(Connection c262, JFrame f262) {
+        ArrayList list262 = new ArrayList();
+        list262.add(c262.get(f262.getTitle()));
+        Connection conn = c262;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list262.size()); conn.commit(); }
+        f262.setVisible(list262.isEmpty());
+    }
+
+    public void method263(Connection c263, JFrame f263) {
+        ArrayList list263 = new ArrayList();
+        list263.add(c263.get(f263.getTitle()));
+        Connection conn = c263;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list263.size()); conn.commit(); }
+        f263.setVisible(list263.isEmpty());
+    }
+
+    public void method264(Connection c264, JFrame f264) {
+        ArrayList list264 = new ArrayList();
+        list264.add(c264.get(f264.getTitle()));
+        Connection conn = c264;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list264.size()); conn.commit(); }
+        f264.setVisible(list264.isEmpty());
+    }
+
+    public void method265(Connection c265, JFrame f265) {
+        ArrayList list265 = new ArrayList();
+        list265.add(c265.get(f265.getTitle()));
+        Connection conn = c265;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list265.size()); conn.commit(); }
+        f265.setVisible(list265.isEmpty());
+    }
+
+    public void method266(Connection c266, JFrame f266) {
+        ArrayList list266 = new ArrayList();
+        list266.add(c266.get(f266.getTitle()));
+        Connection conn = c266;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list266.size()); conn.commit(); }
+        f266.setVisible(list266.isEmpty());
+    }
+
+    public void method267(Connection c267, JFrame f267) {
+        ArrayList list267 = new ArrayList();
+        list267.add(c267.get(f267.getTitle()));
+        Connection conn = c267;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list267.size()); conn.commit(); }
+        f267.setVisible(list267.isEmpty());
+    }
+
+    public void method268(Connection c268, JFrame f268) {
+        ArrayList list268 = new ArrayList();
+        list268.add(c268.get(f268.getTitle()));
+        Connection conn = c268;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list268.size()); conn.commit(); }
+        f268.setVisible(list268.isEmpty());
+    }
+
+    public void method269(Connection c269, JFrame f269) {
+        ArrayList list269 = new ArrayList();
+        list269.add(c269.get(f269.getTitle()));
+        Connection conn = c269;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list269.size()); conn.commit(); }
+        f269.setVisible(list269.isEmpty());
+    }
+
+    public void method270(Connection c270, JFrame f270) {
+        ArrayList list270 = new ArrayList();
+        list270.add(c270.get(f270.getTitle()));
+        Connection conn = c270;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list270.size()); conn.commit(); }
+        f270.setVisible(list270.isEmpty());
+    }
+
+    public void method271(Connection c271, JFrame f271) {
+        ArrayList list271 = new ArrayList();
+        list271.add(c271.get(f271.getTitle()));
+        Connection conn = c271;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list271.size()); conn.commit(); }
+        f271.setVisible(list271.isEmpty());
+    }
+
+    public void method272(Connection c272, JFrame f272) {
+        ArrayList list272 = new ArrayList();
+        list272.add(c272.get(f272.getTitle()));
+        Connection conn = c272;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list272.size()); conn.commit(); }
+        f272.setVisible(list272.isEmpty());
+    }
+
+    public void method273(Connection c273, JFrame f273) {
+        ArrayList list273 = new ArrayList();
+        list273.add(c273.get(f273.getTitle()));
+        Connection conn = c273;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list273.size()); conn.commit(); }
+        f273.setVisible(list273.isEmpty());
+    }
+
+    public void method274(Connection c274, JFrame f274) {
+        ArrayList list274 = new ArrayList();
+        list274.add(c274.get(f274.getTitle()));
+        Connection conn = c274;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list274.size()); conn.commit(); }
+        f274.setVisible(list274.isEmpty());
+    }
+
+    public void method275(Connection c275, JFrame f275) {
+        ArrayList list275 = new ArrayList();
+        list275.add(c275.get(f275.getTitle()));
+        Connection conn = c275;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list275.size()); conn.commit(); }
+        f275.setVisible(list275.isEmpty());
+    }
+
+    public void method276(Connection c276, JFrame f276) {
+        ArrayList list276 = new ArrayList();
+        list276.add(c276.get(f276.getTitle()));
+        Connection conn = c276;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list276.size()); conn.commit(); }
+        f276.setVisible(list276.isEmpty());
+    }
+
+    public void method277(Connection c277, JFrame f277) {
+        ArrayList list277 = new ArrayList();
+        list277.add(c277.get(f277.getTitle()));
+        Connection conn = c277;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list277.size()); conn.commit(); }
+        f277.setVisible(list277.isEmpty());
+    }
+
+    public void method278(Connection c278, JFrame f278) {
+        ArrayList list278 = new ArrayList();
+        list278.add(c278.get(f278.getTitle()));
+        Connection conn = c278;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list278.size()); conn.commit(); }
+        f278.setVisible(list278.isEmpty());
+    }
+
+    public void method279(Connection c279, JFrame f279) {
+        ArrayList list279 = new ArrayList();
+        list279.add(c279.get(f279.getTitle()));
+        Connection conn = c279;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list279.size()); conn.commit(); }
+        f279.setVisible(list279.isEmpty());
+    }
+
+    public void method280(Connection c280, JFrame f280) {
+        ArrayList list280 = new ArrayList();
+        list280.add(c280.get(f280.getTitle()));
+        Connection conn = c280;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list280.size()); conn.commit(); }
+        f280.setVisible(list280.isEmpty());
+    }
+
+    public void method281(Connection c281, JFrame f281) {
+        ArrayList list281 = new ArrayList();
+        list281.add(c281.get(f281.getTitle()));
+        Connection conn = c281;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list281.size()); conn.commit(); }
+        f281.setVisible(list281.isEmpty());
+    }
+
+    public void method282(Connection c282, JFrame f282) {
+        ArrayList list282 = new ArrayList();
+        list282.add(c282.get(f282.getTitle()));
+        Connection conn = c282;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list282.size()); conn.commit(); }
+        f282.setVisible(list282.isEmpty());
+    }
+
+    public void method283(Connection c283, JFrame f283) {
+        ArrayList list283 = new ArrayList();
+        list283.add(c283.get(f283.getTitle()));
+        Connection conn = c283;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list283.size()); conn.commit(); }
+        f283.setVisible(list283.isEmpty());
+    }
+
+    public void method284(Connection c284, JFrame f284) {
+        ArrayList list284 = new ArrayList();
+        list284.add(c284.get(f284.getTitle()));
+        Connection conn = c284;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list284.size()); conn.commit(); }
+        f284.setVisible(list284.isEmpty());
+    }
+
+    public void method285(Connection c285, JFrame f285) {
+        ArrayList list285 = new ArrayList();
+        list285.add(c285.get(f285.getTitle()));
+        Connection conn = c285;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list285.size()); conn.commit(); }
+        f285.setVisible(list285.isEmpty());
+    }
+
+    public void method286(Connection c286, JFrame f286) {
+        ArrayList list286 = new ArrayList();
+        list286.add(c286.get(f286.getTitle()));
+        Connection conn = c286;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list286.size()); conn.commit(); }
+        f286.setVisible(list286.isEmpty());
+    }
+
+    public void method287(Connection c287, JFrame f287) {
+        ArrayList list287 = new ArrayList();
+        list287.add(c287.get(f287.getTitle()));
+        Connection conn = c287;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list287.size()); conn.commit(); }
+        f287.setVisible(list287.isEmpty());
+    }
+
+    public void method288(Connection c288, JFrame f288) {
+        ArrayList list288 = new ArrayList();
+        list288.add(c288.get(f288.getTitle()));
+        Connection conn = c288;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list288.size()); conn.commit(); }
+        f288.setVisible(list288.isEmpty());
+    }
+
+    public void method289(Connection c289, JFrame f289) {
+        ArrayList list289 = new ArrayList();
+        list289.add(c289.get(f289.getTitle()));
+        Connection conn = c289;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list289.size()); conn.commit(); }
+        f289.setVisible(list289.isEmpty());
+    }
+
+    public void method290(Connection c290, JFrame f290) {
+        ArrayList list290 = new ArrayList();
+        list290.add(c290.get(f290.getTitle()));
+        Connection conn = c290;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list290.size()); conn.commit(); }
+        f290.setVisible(list290.isEmpty());
+    }
+
+    public void method291(Connection c291, JFrame f291) {
+        ArrayList list291 = new ArrayList();
+        list291.add(c291.get(f291.getTitle()));
+        Connection conn = c291;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list291.size()); conn.commit(); }
+        f291.setVisible(list291.isEmpty());
+    }
+
+    public void method292(Connection c292, JFrame f292) {
+        ArrayList list292 = new ArrayList();
+        list292.add(c292.get(f292.getTitle()));
+        Connection conn = c292;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list292.size()); conn.commit(); }
+        f292.setVisible(list292.isEmpty());
+    }
+
+    public void method293(Connection c293, JFrame f293) {
+        ArrayList list293 = new ArrayList();
+        list293.add(c293.get(f293.getTitle()));
+        Connection conn = c293;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list293.size()); conn.commit(); }
+        f293.setVisible(list293.isEmpty());
+    }
+
+    public void method294(Connection c294, JFrame f294) {
+        ArrayList list294 = new ArrayList();
+        list294.add(c294.get(f294.getTitle()));
+        Connection conn = c294;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list294.size()); conn.commit(); }
+        f294.setVisible(list294.isEmpty());
+    }
+
+    public void method295(Connection c295, JFrame f295) {
+        ArrayList list295 = new ArrayList();
+        list295.add(c295.get(f295.getTitle()));
+        Connection conn = c295;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list295.size()); conn.commit(); }
+        f295.setVisible(list295.isEmpty());
+    }
+
+    public void method296(Connection c296, JFrame f296) {
+        ArrayList list296 = new ArrayList();
+        list296.add(c296.get(f296.getTitle()));
+        Connection conn = c296;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list296.size()); conn.commit(); }
+        f296.setVisible(list296.isEmpty());
+    }
+
+    public void method297(Connection c297, JFrame f297) {
+        ArrayList list297 = new ArrayList();
+        list297.add(c297.get(f297.getTitle()));
+        Connection conn = c297;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list297.size()); conn.commit(); }
+        f297.setVisible(list297.isEmpty());
+    }
+
+    public void method298(Connection c298, JFrame f298) {
+        ArrayList list298 = new ArrayList();
+        list298.add(c298.get(f298.getTitle()));
+        Connection conn = c298;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list298.size()); conn.commit(); }
+        f298.setVisible(list298.isEmpty());
+    }
+
+    public void method299(Connection c299, JFrame f299) {
+        ArrayList list299 = new ArrayList();
+        list299.add(c299.get(f299.getTitle()));
+        Connection conn = c299;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list299.size()); conn.commit(); }
+        f299.setVisible(list299.isEmpty());
+    }
+
+    public void method300(Connection c300, JFrame f300) {
+        ArrayList list300 = new ArrayList();
+        list300.add(c300.get(f300.getTitle()));
+        Connection conn = c300;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list300.size()); conn.commit(); }
+        f300.setVisible(list300.isEmpty());
+    }
+
+    public void method301(Connection c301, JFrame f301) {
+        ArrayList list301 = new ArrayList();
+        list301.add(c301.get(f301.getTitle()));
+        Connection conn = c301;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list301.size()); conn.commit(); }
+        f301.setVisible(list301.isEmpty());
+    }
+
+    public void method302(Connection c302, JFrame f302) {
+        ArrayList list302 = new ArrayList();
+        list302.add(c302.get(f302.getTitle()));
+        Connection conn = c302;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list302.size()); conn.commit(); }
+        f302.setVisible(list302.isEmpty());
+    }
+
+    public void method303(Connection c303, JFrame f303) {
+        ArrayList list303 = new ArrayList();
+        list303.add(c303.get(f303.getTitle()));
+        Connection conn = c303;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list303.size()); conn.commit(); }
+        f303.setVisible(list303.isEmpty());
+    }
+
+    public void method304(Connection c304, JFrame f304) {
+        ArrayList list304 = new ArrayList();
+        list304.add(c304.get(f304.getTitle()));
+        Connection conn = c304;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list304.size()); conn.commit(); }
+        f304.setVisible(list304.isEmpty());
+    }
+
+    public void method305(Connection c305, JFrame f305) {
+        ArrayList list305 = new ArrayList();
+        list305.add(c305.get(f305.getTitle()));
+        Connection conn = c305;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list305.size()); conn.commit(); }
+        f305.setVisible(list305.isEmpty());
+    }
+
+    public void method306(Connection c306, JFrame f306) {
+        ArrayList list306 = new ArrayList();
+        list306.add(c306.get(f306.getTitle()));
+        Connection conn = c306;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list306.size()); conn.commit(); }
+        f306.setVisible(list306.isEmpty());
+    }
+
+    public void method307(Connection c307, JFrame f307) {
+        ArrayList list307 = new ArrayList();
+        list307.add(c307.get(f307.getTitle()));
+        Connection conn = c307;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list307.size()); conn.commit(); }
+        f307.setVisible(list307.isEmpty());
+    }
+
+    public void method308(Connection c308, JFrame f308) {
+        ArrayList list308 = new ArrayList();
+        list308.add(c308.get(f308.getTitle()));
+        Connection conn = c308;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list308.size()); conn.commit(); }
+        f308.setVisible(list308.isEmpty());
+    }
+
+    public void method309(Connection c309, JFrame f309) {
+        ArrayList list309 = new ArrayList();
+        list309.add(c309.get(f309.getTitle()));
+        Connection conn = c309;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list309.size()); conn.commit(); }
+        f309.setVisible(list309.isEmpty());
+    }
+
+    public void method310(Connection c310, JFrame f310) {
+        ArrayList list310 = new ArrayList();
+        list310.add(c310.get(f310.getTitle()));
+        Connection conn = c310;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list310.size()); conn.commit(); }
+        f310.setVisible(list310.isEmpty());
+    }
+
+    public void method311(Connection c311, JFrame f311) {
+        ArrayList list311 = new ArrayList();
+        list311.add(c311.get(f311.getTitle()));
+        Connection conn = c311;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list311.size()); conn.commit(); }
+        f311.setVisible(list311.isEmpty());
+    }
+
+    public void method312(Connection c312, JFrame f312) {
+        ArrayList list312 = new ArrayList();
+        list312.add(c312.get(f312.getTitle()));
+        Connection conn = c312;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list312.size()); conn.commit(); }
+        f312.setVisible(list312.isEmpty());
+    }
+
+    public void method313(Connection c313, JFrame f313) {
+        ArrayList list313 = new ArrayList();
+        list313.add(c313.get(f313.getTitle()));
+        Connection conn = c313;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list313.size()); conn.commit(); }
+        f313.setVisible(list313.isEmpty());
+    }
+
+    public void method314(Connection c314, JFrame f314) {
+        ArrayList list314 = new ArrayList();
+        list314.add(c314.get(f314.getTitle()));
+        Connection conn = c314;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list314.size()); conn.commit(); }
+        f314.setVisible(list314.isEmpty());
+    }
+
+    public void method315(Connection c315, JFrame f315) {
+        ArrayList list315 = new ArrayList();
+        list315.add(c315.get(f315.getTitle()));
+        Connection conn = c315;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list315.size()); conn.commit(); }
+        f315.setVisible(list315.isEmpty());
+    }
+
+    public void method316(Connection c316, JFrame f316) {
+        ArrayList list316 = new ArrayList();
+        list316.add(c316.get(f316.getTitle()));
+        Connection conn = c316;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list316.size()); conn.commit(); }
+        f316.setVisible(list316.isEmpty());
+    }
+
+    public void method317(Connection c317, JFrame f317) {
+        ArrayList list317 = new ArrayList();
+        list317.add(c317.get(f317.getTitle()));
+        Connection conn = c317;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list317.size()); conn.commit(); }
+        f317.setVisible(list317.isEmpty());
+    }
+
+    public void method318(Connection c318, JFrame f318) {
+        ArrayList list318 = new ArrayList();
+        list318.add(c318.get(f318.getTitle()));
+        Connection conn = c318;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list318.size()); conn.commit(); }
+        f318.setVisible(list318.isEmpty());
+    }
+
+    public void method319(Connection c319, JFrame f319) {
+        ArrayList list319 = new ArrayList();
+        list319.add(c319.get(f319.getTitle()));
+        Connection conn = c319;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list319.size()); conn.commit(); }
+        f319.setVisible(list319.isEmpty());
+    }
+
+    public void method320(Connection c320, JFrame f320) {
+        ArrayList list320 = new ArrayList();
+        list320.add(c320.get(f320.getTitle()));
+        Connection conn = c320;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list320.size()); conn.commit(); }
+        f320.setVisible(list320.isEmpty());
+    }
+
+    public void method321(Connection c321, JFrame f321) {
+        ArrayList list321 = new ArrayList();
+        list321.add(c321.get(f321.getTitle()));
+        Connection conn = c321;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list321.size()); conn.commit(); }
+        f321.setVisible(list321.isEmpty());
+    }
+
+    public void method322(Connection c322, JFrame f322) {
+        ArrayList list322 = new ArrayList();
+        list322.add(c322.get(f322.getTitle()));
+        Connection conn = c322;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list322.size()); conn.commit(); }
+        f322.setVisible(list322.isEmpty());
+    }
+
+    public void method323(Connection c323, JFrame f323) {
+        ArrayList list323 = new ArrayList();
+        list323.add(c323.get(f323.getTitle()));
+        Connection conn = c323;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list323.size()); conn.commit(); }
+        f323.setVisible(list323.isEmpty());
+    }
+
+    public void method324(Connection c324, JFrame f324) {
+        ArrayList list324 = new ArrayList();
+        list324.add(c324.get(f324.getTitle()));
+        Connection conn = c324;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list324.size()); conn.commit(); }
+        f324.setVisible(list324.isEmpty());
+    }
+
+    public void method325(Connection c325, JFrame f325) {
+        ArrayList list325 = new ArrayList();
+        list325.add(c325.get(f325.getTitle()));
+        Connection conn = c325;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list325.size()); conn.commit(); }
+        f325.setVisible(list325.isEmpty());
+    }
+
+    public void method326(Connection c326, JFrame f326) {
+        ArrayList list326 = new ArrayList();
+        list326.add(c326.get(f326.getTitle()));
+        Connection conn = c326;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list326.size()); conn.commit(); }
+        f326.setVisible(list326.isEmpty());
+    }
+
+    public void method327(Connection c327, JFrame f327) {
+        ArrayList list327 = new ArrayList();
+        list327.add(c327.get(f327.getTitle()));
+        Connection conn = c327;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list327.size()); conn.commit(); }
+        f327.setVisible(list327.isEmpty());
+    }
+
+    public void method328(Connection c328, JFrame f328) {
+        ArrayList list328 = new ArrayList();
+        list328.add(c328.get(f328.getTitle()));
+        Connection conn = c328;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list328.size()); conn.commit(); }
+        f328.setVisible(list328.isEmpty());
+    }
+
+    public void method329(Connection c329, JFrame f329) {
+        ArrayList list329 = new ArrayList();
+        list329.add(c329.get(f329.getTitle()));
+        Connection conn = c329;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list329.size()); conn.commit(); }
+        f329.setVisible(list329.isEmpty());
+    }
+
+    public void method330(Connection c330, JFrame f330) {
+        ArrayList list330 = new ArrayList();
+        list330.add(c330.get(f330.getTitle()));
+        Connection conn = c330;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list330.size()); conn.commit(); }
+        f330.setVisible(list330.isEmpty());
+    }
+
+    public void method331(Connection c331, JFrame f331) {
+        ArrayList list331 = new ArrayList();
+        list331.add(c331.get(f331.getTitle()));
+        Connection conn = c331;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list331.size()); conn.commit(); }
+        f331.setVisible(list331.isEmpty());
+    }
+
+    public void method332(Connection c332, JFrame f332) {
+        ArrayList list332 = new ArrayList();
+        list332.add(c332.get(f332.getTitle()));
+        Connection conn = c332;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list332.size()); conn.commit(); }
+        f332.setVisible(list332.isEmpty());
+    }
+
+    public void method333(Connection c333, JFrame f333) {
+        ArrayList list333 = new ArrayList();
+        list333.add(c333.get(f333.getTitle()));
+        Connection conn = c333;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list333.size()); conn.commit(); }
+        f333.setVisible(list333.isEmpty());
+    }
+
+    public void method334(Connection c334, JFrame f334) {
+        ArrayList list334 = new ArrayList();
+        list334.add(c334.get(f334.getTitle()));
+        Connection conn = c334;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list334.size()); conn.commit(); }
+        f334.setVisible(list334.isEmpty());
+    }
+
+    public void method335(Connection c335, JFrame f335) {
+        ArrayList list335 = new ArrayList();
+        list335.add(c335.get(f335.getTitle()));
+        Connection conn = c335;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list335.size()); conn.commit(); }
+        f335.setVisible(list335.isEmpty());
+    }
+
+    public void method336(Connection c336, JFrame f336) {
+        ArrayList list336 = new ArrayList();
+        list336.add(c336.get(f336.getTitle()));
+        Connection conn = c336;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list336.size()); conn.commit(); }
+        f336.setVisible(list336.isEmpty());
+    }
+
+    public void method337(Connection c337, JFrame f337) {
+        ArrayList list337 = new ArrayList();
+        list337.add(c337.get(f337.getTitle()));
+        Connection conn = c337;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list337.size()); conn.commit(); }
+        f337.setVisible(list337.isEmpty());
+    }
+
+    public void method338(Connection c338, JFrame f338) {
+        ArrayList list338 = new ArrayList();
+        list338.add(c338.get(f338.getTitle()));
+        Connection conn = c338;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list338.size()); conn.commit(); }
+        f338.setVisible(list338.isEmpty());
+    }
+
+    public void method339(Connection c339, JFrame f339) {
+        ArrayList list339 = new ArrayList();
+        list339.add(c339.get(f339.getTitle()));
+        Connection conn = c339;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list339.size()); conn.commit(); }
+        f339.setVisible(list339.isEmpty());
+    }
+
+    public void method340(Connection c340, JFrame f340) {
+        ArrayList list340 = new ArrayList();
+        list340.add(c340.get(f340.getTitle()));
+        Connection conn = c340;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list340.size()); conn.commit(); }
+        f340.setVisible(list340.isEmpty());
+    }
+
+    public void method341(Connection c341, JFrame f341) {
+        ArrayList list341 = new ArrayList();
+        list341.add(c341.get(f341.getTitle()));
+        Connection conn = c341;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list341.size()); conn.commit(); }
+        f341.setVisible(list341.isEmpty());
+    }
+
+    public void method342(Connection c342, JFrame f342) {
+        ArrayList list342 = new ArrayList();
+        list342.add(c342.get(f342.getTitle()));
+        Connection conn = c342;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list342.size()); conn.commit(); }
+        f342.setVisible(list342.isEmpty());
+    }
+
+    public void method343(Connection c343, JFrame f343) {
+        ArrayList list343 = new ArrayList();
+        list343.add(c343.get(f343.getTitle()));
+        Connection conn = c343;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list343.size()); conn.commit(); }
+        f343.setVisible(list343.isEmpty());
+    }
+
+    public void method344(Connection c344, JFrame f344) {
+        ArrayList list344 = new ArrayList();
+        list344.add(c344.get(f344.getTitle()));
+        Connection conn = c344;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list344.size()); conn.commit(); }
+        f344.setVisible(list344.isEmpty());
+    }
+
+    public void method345(Connection c345, JFrame f345) {
+        ArrayList list345 = new ArrayList();
+        list345.add(c345.get(f345.getTitle()));
+        Connection conn = c345;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list345.size()); conn.commit(); }
+        f345.setVisible(list345.isEmpty());
+    }
+
+    public void method346(Connection c346, JFrame f346) {
+        ArrayList list346 = new ArrayList();
+        list346.add(c346.get(f346.getTitle()));
+        Connection conn = c346;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list346.size()); conn.commit(); }
+        f346.setVisible(list346.isEmpty());
+    }
+
+    public void method347(Connection c347, JFrame f347) {
+        ArrayList list347 = new ArrayList();
+        list347.add(c347.get(f347.getTitle()));
+        Connection conn = c347;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list347.size()); conn.commit(); }
+        f347.setVisible(list347.isEmpty());
+    }
+
+    public void method348(Connection c348, JFrame f348) {
+        ArrayList list348 = new ArrayList();
+        list348.add(c348.get(f348.getTitle()));
+        Connection conn = c348;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list348.size()); conn.commit(); }
+        f348.setVisible(list348.isEmpty());
+    }
+
+    public void method349(Connection c349, JFrame f349) {
+        ArrayList list349 = new ArrayList();
+        list349.add(c349.get(f349.getTitle()));
+        Connection conn = c349;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list349.size()); conn.commit(); }
+        f349.setVisible(list349.isEmpty());
+    }
+
+    public void method350(Connection c350, JFrame f350) {
+        ArrayList list350 = new ArrayList();
+        list350.add(c350.get(f350.getTitle()));
+        Connection conn = c350;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list350.size()); conn.commit(); }
+        f350.setVisible(list350.isEmpty());
+    }
+
+    public void method351(Connection c351, JFrame f351) {
+        ArrayList list351 = new ArrayList();
+        list351.add(c351.get(f351.getTitle()));
+        Connection conn = c351;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list351.size()); conn.commit(); }
+        f351.setVisible(list351.isEmpty());
+    }
+
+    public void method352(Connection c352, JFrame f352) {
+        ArrayList list352 = new ArrayList();
+        list352.add(c352.get(f352.getTitle()));
+        Connection conn = c352;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list352.size()); conn.commit(); }
+        f352.setVisible(list352.isEmpty());
+    }
+
+    public void method353(Connection c353, JFrame f353) {
+        ArrayList list353 = new ArrayList();
+        list353.add(c353.get(f353.getTitle()));
+        Connection conn = c353;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list353.size()); conn.commit(); }
+        f353.setVisible(list353.isEmpty());
+    }
+
+    public void method354(Connection c354, JFrame f354) {
+        ArrayList list354 = new ArrayList();
+        list354.add(c354.get(f354.getTitle()));
+        Connection conn = c354;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list354.size()); conn.commit(); }
+        f354.setVisible(list354.isEmpty());
+    }
+
+    public void method355(Connection c355, JFrame f355) {
+        ArrayList list355 = new ArrayList();
+        list355.add(c355.get(f355.getTitle()));
+        Connection conn = c355;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list355.size()); conn.commit(); }
+        f355.setVisible(list355.isEmpty());
+    }
+
+    public void method356(Connection c356, JFrame f356) {
+        ArrayList list356 = new ArrayList();
+        list356.add(c356.get(f356.getTitle()));
+        Connection conn = c356;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list356.size()); conn.commit(); }
+        f356.setVisible(list356.isEmpty());
+    }
+
+    public void method357(Connection c357, JFrame f357) {
+        ArrayList list357 = new ArrayList();
+        list357.add(c357.get(f357.getTitle()));
+        Connection conn = c357;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list357.size()); conn.commit(); }
+        f357.setVisible(list357.isEmpty());
+    }
+
+    public void method358(Connection c358, JFrame f358) {
+        ArrayList list358 = new ArrayList();
+        list358.add(c358.get(f358.getTitle()));
+        Connection conn = c358;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list358.size()); conn.commit(); }
+        f358.setVisible(list358.isEmpty());
+    }
+
+    public void method359(Connection c359, JFrame f359) {
+        ArrayList list359 = new ArrayList();
+        list359.add(c359.get(f359.getTitle()));
+        Connection conn = c359;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list359.size()); conn.commit(); }
+        f359.setVisible(list359.isEmpty());
+    }
+
+    public void method360(Connection c360, JFrame f360) {
+        ArrayList list360 = new ArrayList();
+        list360.add(c360.get(f360.getTitle()));
+        Connection conn = c360;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list360.size()); conn.commit(); }
+        f360.setVisible(list360.isEmpty());
+    }
+
+    public void method361(Connection c361, JFrame f361) {
+        ArrayList list361 = new ArrayList();
+        list361.add(c361.get(f361.getTitle()));
+        Connection conn = c361;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list361.size()); conn.commit(); }
+        f361.setVisible(list361.isEmpty());
+    }
+
+    public void method362(Connection c362, JFrame f362) {
+        ArrayList list362 = new ArrayList();
+        list362.add(c362.get(f362.getTitle()));
+        Connection conn = c362;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list362.size()); conn.commit(); }
+        f362.setVisible(list362.isEmpty());
+    }
+
+    public void method363(Connection c363, JFrame f363) {
+        ArrayList list363 = new ArrayList();
+        list363.add(c363.get(f363.getTitle()));
+        Connection conn = c363;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list363.size()); conn.commit(); }
+        f363.setVisible(list363.isEmpty());
+    }
+
+    public void method364(Connection c364, JFrame f364) {
+        ArrayList list364 = new ArrayList();
+        list364.add(c364.get(f364.getTitle()));
+        Connection conn = c364;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list364.size()); conn.commit(); }
+        f364.setVisible(list364.isEmpty());
+    }
+
+    public void method365(Connection c365, JFrame f365) {
+        ArrayList list365 = new ArrayList();
+        list365.add(c365.get(f365.getTitle()));
+        Connection conn = c365;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list365.size()); conn.commit(); }
+        f365.setVisible(list365.isEmpty());
+    }
+
+    public void method366(Connection c366, JFrame f366) {
+        ArrayList list366 = new ArrayList();
+        list366.add(c366.get(f366.getTitle()));
+        Connection conn = c366;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list366.size()); conn.commit(); }
+        f366.setVisible(list366.isEmpty());
+    }
+
+    public void method367(Connection c367, JFrame f367) {
+        ArrayList list367 = new ArrayList();
+        list367.add(c367.get(f367.getTitle()));
+        Connection conn = c367;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list367.size()); conn.commit(); }
+        f367.setVisible(list367.isEmpty());
+    }
+
+    public void method368(Connection c368, JFrame f368) {
+        ArrayList list368 = new ArrayList();
+        list368.add(c368.get(f368.getTitle()));
+        Connection conn = c368;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list368.size()); conn.commit(); }
+        f368.setVisible(list368.isEmpty());
+    }
+
+    public void method369(Connection c369, JFrame f369) {
+        ArrayList list369 = new ArrayList();
+        list369.add(c369.get(f369.getTitle()));
+        Connection conn = c369;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list369.size()); conn.commit(); }
+        f369.setVisible(list369.isEmpty());
+    }
+
+    public void method370(Connection c370, JFrame f370) {
+        ArrayList list370 = new ArrayList();
+        list370.add(c370.get(f370.getTitle()));
+        Connection conn = c370;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list370.size()); conn.commit(); }
+        f370.setVisible(list370.isEmpty());
+    }
+
+    public void method371(Connection c371, JFrame f371) {
+        ArrayList list371 = new ArrayList();
+        list371.add(c371.get(f371.getTitle()));
+        Connection conn = c371;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list371.size()); conn.commit(); }
+        f371.setVisible(list371.isEmpty());
+    }
+
+    public void method372(Connection c372, JFrame f372) {
+        ArrayList list372 = new ArrayList();
+        list372.add(c372.get(f372.getTitle()));
+        Connection conn = c372;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list372.size()); conn.commit(); }
+        f372.setVisible(list372.isEmpty());
+    }
+
+    public void method373(Connection c373, JFrame f373) {
+        ArrayList list373 = new ArrayList();
+        list373.add(c373.get(f373.getTitle()));
+        Connection conn = c373;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list373.size()); conn.commit(); }
+        f373.setVisible(list373.isEmpty());
+    }
+
+    public void method374(Connection c374, JFrame f374) {
+        ArrayList list374 = new ArrayList();
+        list374.add(c374.get(f374.getTitle()));
+        Connection conn = c374;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list374.size()); conn.commit(); }
+        f374.setVisible(list374.isEmpty());
+    }
+
+    public void method375(Connection c375, JFrame f375) {
+        ArrayList list375 = new ArrayList();
+        list375.add(c375.get(f375.getTitle()));
+        Connection conn = c375;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list375.size()); conn.commit(); }
+        f375.setVisible(list375.isEmpty());
+    }
+
+    public void method376(Connection c376, JFrame f376) {
+        ArrayList list376 = new ArrayList();
+        list376.add(c376.get(f376.getTitle()));
+        Connection conn = c376;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list376.size()); conn.commit(); }
+        f376.setVisible(list376.isEmpty());
+    }
+
+    public void method377(Connection c377, JFrame f377) {
+        ArrayList list377 = new ArrayList();
+        list377.add(c377.get(f377.getTitle()));
+        Connection conn = c377;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list377.size()); conn.commit(); }
+        f377.setVisible(list377.isEmpty());
+    }
+
+    public void method378(Connection c378, JFrame f378) {
+        ArrayList list378 = new ArrayList();
+        list378.add(c378.get(f378.getTitle()));
+        Connection conn = c378;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list378.size()); conn.commit(); }
+        f378.setVisible(list378.isEmpty());
+    }
+
+    public void method379(Connection c379, JFrame f379) {
+        ArrayList list379 = new ArrayList();
+        list379.add(c379.get(f379.getTitle()));
+        Connection conn = c379;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list379.size()); conn.commit(); }
+        f379.setVisible(list379.isEmpty());
+    }
+
+    public void method380(Connection c380, JFrame f380) {
+        ArrayList list380 = new ArrayList();
+        list380.add(c380.get(f380.getTitle()));
+        Connection conn = c380;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list380.size()); conn.commit(); }
+        f380.setVisible(list380.isEmpty());
+    }
+
+    public void method381(Connection c381, JFrame f381) {
+        ArrayList list381 = new ArrayList();
+        list381.add(c381.get(f381.getTitle()));
+        Connection conn = c381;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list381.size()); conn.commit(); }
+        f381.setVisible(list381.isEmpty());
+    }
+
+    public void method382(Connection c382, JFrame f382) {
+        ArrayList list382 = new ArrayList();
+        list382.add(c382.get(f382.getTitle()));
+        Connection conn = c382;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list382.size()); conn.commit(); }
+        f382.setVisible(list382.isEmpty());
+    }
+
+    public void method383(Connection c383, JFrame f383) {
+        ArrayList list383 = new ArrayList();
+        list383.add(c383.get(f383.getTitle()));
+        Connection conn = c383;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list383.size()); conn.commit(); }
+        f383.setVisible(list383.isEmpty());
+    }
+
+    public void method384(Connection c384, JFrame f384) {
+        ArrayList list384 = new ArrayList();
+        list384.add(c384.get(f384.getTitle()));
+        Connection conn = c384;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list384.size()); conn.commit(); }
+        f384.setVisible(list384.isEmpty());
+    }
+
+    public void method385(Connection c385, JFrame f385) {
+        ArrayList list385 = new ArrayList();
+        list385.add(c385.get(f385.getTitle()));
+        Connection conn = c385;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list385.size()); conn.commit(); }
+        f385.setVisible(list385.isEmpty());
+    }
+
+    public void method386(Connection c386, JFrame f386) {
+        ArrayList list386 = new ArrayList();
+        list386.add(c386.get(f386.getTitle()));
+        Connection conn = c386;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list386.size()); conn.commit(); }
+        f386.setVisible(list386.isEmpty());
+    }
+
+    public void method387(Connection c387, JFrame f387) {
+        ArrayList list387 = new ArrayList();
+        list387.add(c387.get(f387.getTitle()));
+        Connection conn = c387;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list387.size()); conn.commit(); }
+        f387.setVisible(list387.isEmpty());
+    }
+
+    public void method388(Connection c388, JFrame f388) {
+        ArrayList list388 = new ArrayList();
+        list388.add(c388.get(f388.getTitle()));
+        Connection conn = c388;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list388.size()); conn.commit(); }
+        f388.setVisible(list388.isEmpty());
+    }
+
+    public void method389(Connection c389, JFrame f389) {
+        ArrayList list389 = new ArrayList();
+        list389.add(c389.get(f389.getTitle()));
+        Connection conn = c389;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list389.size()); conn.commit(); }
+        f389.setVisible(list389.isEmpty());
+    }
+
+    public void method390(Connection c390, JFrame f390) {
+        ArrayList list390 = new ArrayList();
+        list390.add(c390.get(f390.getTitle()));
+        Connection conn = c390;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list390.size()); conn.commit(); }
+        f390.setVisible(list390.isEmpty());
+    }
+
+    public void method391(Connection c391, JFrame f391) {
+        ArrayList list391 = new ArrayList();
+        list391.add(c391.get(f391.getTitle()));
+        Connection conn = c391;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list391.size()); conn.commit(); }
+        f391.setVisible(list391.isEmpty());
+    }
+
+    public void method392(Connection c392, JFrame f392) {
+        ArrayList list392 = new ArrayList();
+        list392.add(c392.get(f392.getTitle()));
+        Connection conn = c392;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list392.size()); conn.commit(); }
+        f392.setVisible(list392.isEmpty());
+    }
+
+    public void method393(Connection c393, JFrame f393) {
+        ArrayList list393 = new ArrayList();
+        list393.add(c393.get(f393.getTitle()));
+        Connection conn = c393;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list393.size()); conn.commit(); }
+        f393.setVisible(list393.isEmpty());
+    }
+
+    public void method394(Connection c394, JFrame f394) {
+        ArrayList list394 = new ArrayList();
+        list394.add(c394.get(f394.getTitle()));
+        Connection conn = c394;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list394.size()); conn.commit(); }
+        f394.setVisible(list394.isEmpty());
+    }
+
+    public void method395(Connection c395, JFrame f395) {
+        ArrayList list395 = new ArrayList();
+        list395.add(c395.get(f395.getTitle()));
+        Connection conn = c395;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list395.size()); conn.commit(); }
+        f395.setVisible(list395.isEmpty());
+    }
+
+    public void method396(Connection c396, JFrame f396) {
+        ArrayList list396 = new ArrayList();
+        list396.add(c396.get(f396.getTitle()));
+        Connection conn = c396;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list396.size()); conn.commit(); }
+        f396.setVisible(list396.isEmpty());
+    }
+
+    public void method397(Connection c397, JFrame f397) {
+        ArrayList list397 = new ArrayList();
+        list397.add(c397.get(f397.getTitle()));
+        Connection conn = c397;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list397.size()); conn.commit(); }
+        f397.setVisible(list397.isEmpty());
+    }
+
+    public void method398(Connection c398, JFrame f398) {
+        ArrayList list398 = new ArrayList();
+        list398.add(c398.get(f398.getTitle()));
+        Connection conn = c398;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list398.size()); conn.commit(); }
+        f398.setVisible(list398.isEmpty());
+    }
+
+    public void method399(Connection c399, JFrame f399) {
+        ArrayList list399 = new ArrayList();
+        list399.add(c399.get(f399.getTitle()));
+        Connection conn = c399;
+        conn.open();
+        for (int k = 0; k < 10; k++) { Map m = null; m.put(k, list399.size()); conn.commit(); }
+        f399.setVisible(list399.isEmpty());
+    }
+}
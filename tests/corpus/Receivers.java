@@ -0,0 +1,43 @@
+package org.example.app;
+
+import java.util.List;
+import java.util.ArrayList;
+import java.util.Map;
+import javax.swing.JFrame;
+import org.example.db.Connection;
+import org.example.db.Statement;
+
+public class Receivers extends JFrame {
+    private Connection conn;
+    private List<String> names = new ArrayList<>();
+    private boolean flag;
+    static final Map<String, Integer> COUNTS = null;
+
+    public Receivers(Connection connection, JFrame frame) {
+        connection.open();
+        frame.setVisible(flag);
+        conn.open();
+    }
+
+    public void run(Statement statement) {
+        ArrayList list = new ArrayList();
+        list.add("x");
+        list.add(list.size());
+        statement.execute(conn.nativeSQL("SELECT 1"));
+        names.forEach(n -> n.trim());
+        COUNTS.put("run", list.size());
+        for (Connection pooled : pool()) { pooled.close(); }
+        try (Reader reader = new Reader()) { reader.read(); } catch (IOException error) { error.printStackTrace(); }
+        Runnable task = new Runnable() {
+            public void run() { JFrame window = null; window.dispose(); }
+        };
+        task.run();
+        helper(conn.get(list.first()));
+        System.out.println(undeclared.value());
+    }
+
+    class Inner {
+        Builder builder;
+        void go(boolean ready) { builder.append(ready); conn.reset(); }
+    }
+}
@@ -0,0 +1,61 @@
+package org.example.app;
+
+import java.util.List;
+import java.util.ArrayList;
+import java.util.Map;
+import java.io.*;
+import static java.lang.Math.max;
+import javax.swing.JFrame;
+import org.example.db.Connection;
+import org.other.Connection;
+import org.example.db.Statement;
+
+@org.example.Annotated
+public class Sample extends JFrame implements Runnable {
+    private Connection conn;
+    private List<String> names = new ArrayList<>();
+    private ArrayList raw, raw2;
+    private boolean flag;
+    private JFrame window;
+    static final Map<String, Integer> MAP = null;
+
+    public Sample(Connection conn, JFrame frame) {
+        this.conn = conn;
+        frame.setVisible(true);
+        conn.open();
+    }
+
+    public void run() {
+        ArrayList list = new ArrayList();
+        list.add("x");
+        list.add(list.size());
+        conn.createStatement().execute("SELECT 1");
+        names.forEach(n -> { Builder b = new Builder(); b.append(n).append(n); });
+        int y = max(1, 2);
+        System.out.println(list.get(0));
+        for (Connection c : pool) { c.close(); }
+        try (Reader r = new Reader()) { r.read(); } catch (IOException e) { e.printStackTrace(); }
+        Runnable task = new Runnable() {
+            public void run() { JFrame inner = null; inner.dispose(); }
+        };
+        list.<String>get(1);
+        helper(conn.get(list.first()));
+        window.pack();
+    }
+
+    void query(Statement window) {
+        window.execute("SELECT 2");
+    }
+
+    class Inner {
+        Connection conn;
+        void go(boolean b) { conn.reset(); }
+    }
+
+    public static void main(String[] args) {
+        Sample s = new Sample(null, null);
+        s.run();
+        ArrayList list = new ArrayList();
+        list.clear();
+    }
+}
@@ -0,0 +1,199 @@
+"""
+test_ai_batch.py
+
+BatchClassifier with a fake OpenAI client, on databases made by database_init.
+"""
+
+import itertools
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.ai_batch import BatchClassifier
+from src.ai_taxonomy import AICachedClassifier, load_data
+
+# answer to the prompt of each custom_id
+ANSWERS = {
+    "org.example.Logger": "Logging - writes log records",
+    "org.example.Socket": "Network - talks to other hosts",
+    "org.example.Logger::info": "Event Logging - records an event",
+    "org.example.Socket::connect": "Connection Management - opens a connection",
+}
+
+
+class FakeBatchAPI:
+    """files and batches of the OpenAI client.
+
+    A batch is done the first time it is retrieved, with the status given by
+    `statuses` (completed by default). `answered` limits the requests of a batch
+    that have a result.
+    """
+
+    def __init__(self):
+        self.ids = itertools.count(1)
+        self.files = {}
+        self.batches = {}
+        self.statuses = []
+        self.answered = None
+        self.retrieved = []
+        self.files_api = SimpleNamespace(create=self.create_file, content=self.content)
+        self.batches_api = SimpleNamespace(
+            create=self.create_batch, retrieve=self.retrieve
+        )
+
+    @property
+    def client(self):
+        return SimpleNamespace(files=self.files_api, batches=self.batches_api)
+
+    def create_file(self, file, purpose):
+        file_id = f"file-{next(self.ids)}"
+        self.files[file_id] = file.read().decode()
+        return SimpleNamespace(id=file_id)
+
+    def content(self, file_id):
+        return SimpleNamespace(text=self.files[file_id])
+
+    def create_batch(self, input_file_id, endpoint, completion_window):
+        batch = SimpleNamespace(
+            id=f"batch-{next(self.ids)}",
+            input_file_id=input_file_id,
+            status="in_progress",
+            output_file_id=None,
+        )
+        self.batches[batch.id] = batch
+        return batch
+
+    def retrieve(self, batch_id):
+        self.retrieved.append(batch_id)
+        batch = self.batches[batch_id]
+        if batch.status == "in_progress":
+            batch.status = self.statuses.pop(0) if self.statuses else "completed"
+            if batch.status != "failed":
+                batch.output_file_id = self.output(batch)
+        return batch
+
+    def output(self, batch) -> str:
+        requests = [
+            json.loads(line) for line in self.files[batch.input_file_id].splitlines()
+        ]
+        lines = []
+        for request in requests[: self.answered]:
+            body = {
+                "choices": [{"message": {"content": ANSWERS[request["custom_id"]]}}]
+            }
+            result = {
+                "custom_id": request["custom_id"],
+                "response": {"status_code": 200, "body": body},
+                "error": None,
+            }
+            lines.append(json.dumps(result))
+        # results come in any order, they are matched by custom_id
+        lines.reverse()
+        file_id = f"file-{next(self.ids)}"
+        self.files[file_id] = "\n".join(lines) + "\n"
+        return file_id
+
+
+@pytest.fixture
+def api():
+    return FakeBatchAPI()
+
+
+@pytest.fixture
+def batches(database, api, tmp_path, word_tokens):
+    """BatchClassifier on the fake client, with two classes and a function of each to classify."""
+    database.conn.executemany(
+        "INSERT INTO api_file_register (filename, commit_hash, classname, function_name) VALUES (?,?,?,?)",
+        [
+            ("A.java", "c1", "org.example.Logger", "info"),
+            ("A.java", "c1", "org.example.Socket", "connect"),
+        ],
+    )
+    database.conn.commit()
+
+    ai = AICachedClassifier(
+        load_data("./data/domain_labels.json"),
+        load_data("./data/subdomain_labels.json"),
+        database,
+    )
+    ai.client = api.client
+    return BatchClassifier(ai, database, str(tmp_path / "batches"), poll_seconds=0)
+
+
+def statuses(db) -> list[tuple]:
+    return db.conn.execute(
+        "SELECT kind, status FROM ai_batches ORDER BY created"
+    ).fetchall()
+
+
+def test_submit_collect_store(batches, database, api):
+    batches.run()
+
+    assert database.get_unclassified_apis() == ([], [])
+    assert database.cache_classify_API("org.example.Logger") == "Logging"
+    assert database.cache_classify_API("org.example.Socket") == "Network"
+    assert database.cache_classify_function("org.example.Logger", "info") == (
+        "Event Logging"
+    )
+    assert database.cache_classify_function("org.example.Socket", "connect") == (
+        "Connection Management"
+    )
+    assert statuses(database) == [("API", "completed"), ("FUNC", "completed")]
+
+
+@pytest.mark.parametrize("status", ["failed", "expired"])
+def test_unfinished_batches_leave_items_pending(batches, database, api, status):
+    api.statuses = [status]
+    api.answered = 0
+
+    batches.run()
+
+    # no class domain, so no function was submitted either
+    assert database.get_unclassified_apis() == (
+        ["org.example.Logger", "org.example.Socket"],
+        [("org.example.Logger", "info"), ("org.example.Socket", "connect")],
+    )
+    assert statuses(database) == [("API", status)]
+
+    # the next run sends them again
+    api.answered = None
+    batches.run()
+    assert database.get_unclassified_apis() == ([], [])
+
+
+def test_expired_batches_keep_what_was_done(batches, database, api):
+    api.statuses = ["expired"]
+    api.answered = 1
+
+    batches.run()
+
+    classes, functions = database.get_unclassified_apis()
+    assert classes == ["org.example.Socket"]
+    assert functions == [("org.example.Socket", "connect")]
+    assert database.cache_classify_function("org.example.Logger", "info") == (
+        "Event Logging"
+    )
+
+
+def test_open_batches_are_collected_on_the_next_run(batches, database, api):
+    def stopped(batch_id):
+        raise KeyboardInterrupt
+
+    batches.client = SimpleNamespace(
+        files=api.files_api,
+        batches=SimpleNamespace(create=api.create_batch, retrieve=stopped),
+    )
+    with pytest.raises(KeyboardInterrupt):
+        batches.run()
+    assert database.get_open_batches("API") == ["batch-2"]
+    submitted = len(api.batches)
+
+    batches.client = api.client
+    batches.run()
+
+    # collected, not submitted again
+    assert api.retrieved[0] == "batch-2"
+    assert len(api.batches) == submitted + 1  # the FUNC batch
+    assert database.get_open_batches("API") == []
+    assert database.get_unclassified_apis() == ([], [])
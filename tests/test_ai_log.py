@@ -0,0 +1,128 @@
+"""
+test_ai_log.py
+
+AILogWriter rotation, formats and errors, and the rows the classifier logs.
+"""
+
+import csv
+import datetime
+import json
+import os
+import time
+
+import pytest
+
+from src.ai_log import AILogWriter
+from src.ai_taxonomy import AIClassifier, load_data
+
+
+def read_rows(path: str) -> list[list[str]]:
+    with open(path, newline="", encoding="utf-8") as file:
+        return list(csv.reader(file))
+
+
+def test_rotates_by_size(tmp_path):
+    path = str(tmp_path / "logs" / "ai_log.csv")
+    log = AILogWriter(path, max_bytes=200, backups=2)
+    for num in range(50):
+        log.write(num, "API", f"org.example.Class{num}", "Logging", 10, 3)
+    log.close()
+
+    assert os.path.exists(path + ".1")
+    assert os.path.exists(path + ".2")
+    assert not os.path.exists(path + ".3")
+
+    rows = []
+    for name in (path + ".2", path + ".1", path):
+        # a file is rotated once it reaches max_bytes, after a whole row
+        assert os.path.getsize(name) < 200 + 40
+        rows += read_rows(name)
+    assert all(len(row) == 6 for row in rows)
+    # the newest records, in order
+    numbers = [int(row[0]) for row in rows]
+    assert numbers == list(range(numbers[0], 50))
+
+
+def test_jsonl(tmp_path):
+    path = str(tmp_path / "ai_log.jsonl")
+    log = AILogWriter(path)
+    when = datetime.datetime(2024, 5, 1, 12, 30)
+    log.write(when, "API", "org.example.Logger", "Logging", 10, 3)
+    log.write(when, "FUNC", "org.example.Logger", "info", "Logging", "a, b", 12, 4)
+    log.close()
+
+    with open(path, encoding="utf-8") as file:
+        records = [json.loads(line) for line in file]
+    assert records == [
+        [str(when), "API", "org.example.Logger", "Logging", 10, 3],
+        [str(when), "FUNC", "org.example.Logger", "info", "Logging", "a, b", 12, 4],
+    ]
+
+
+def test_keeps_going_after_write_errors(tmp_path, capsys):
+    path = str(tmp_path / "ai_log.csv")
+    os.makedirs(path)  # can't be opened
+    log = AILogWriter(path)
+
+    log.write("lost")
+    errors = ""
+    deadline = time.monotonic() + 10
+    while "IsADirectoryError" not in errors and time.monotonic() < deadline:
+        time.sleep(0.01)
+        errors += capsys.readouterr().err
+    assert "IsADirectoryError" in errors
+    thread = log.thread
+
+    os.rmdir(path)
+    log.write("kept")
+    log.close()
+
+    assert read_rows(path) == [["kept"]]
+    assert not thread.is_alive()
+    assert "writing again, 1 records lost" in capsys.readouterr().err
+
+
+@pytest.fixture
+def classifier(workdir, word_tokens):
+    ai = AIClassifier(
+        load_data("./data/domain_labels.json"),
+        load_data("./data/subdomain_labels.json"),
+    )
+    yield ai
+    ai.log.close()
+
+
+def test_rows_have_the_old_columns(classifier):
+    """Same columns as the rows ai_log.csv had before the writer thread"""
+    started = datetime.datetime(2024, 5, 1, 12, 30)
+    classifier.api_result(
+        "org.example.Logger", "Logging - writes logs", [1, 2, 3], started=started
+    )
+    classifier.function_result(
+        "org.example.Logger",
+        "info",
+        "Logging",
+        "Event Logging - records, events",
+        [1, 2, 3, 4],
+        {"Event Logging": "records events"},
+        started,
+    )
+    # no sub-domains to choose from
+    classifier.classify_functions([("org.example.Thing", "run", "Not A Domain")])
+    classifier.log.close()
+
+    api, function, no_subdomain = read_rows("./output/ai_log.csv")
+    assert api == [str(started), "API", "org.example.Logger", "Logging", "3", "4"]
+    assert function == [
+        str(started),
+        "FUNC",
+        "org.example.Logger",
+        "info",
+        "Logging",
+        "Event Logging",
+        "4",
+        "5",
+    ]
+    assert len(no_subdomain) == 6
+    assert no_subdomain[1:5] == ["FUNC", "org.example.Thing", "run", "Not A Domain"]
+    assert no_subdomain[5] == "No sub-domain for function 'run'."
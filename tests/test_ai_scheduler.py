@@ -0,0 +1,161 @@
+"""
+test_ai_scheduler.py
+
+RequestScheduler against a chat completions stub server on localhost.
+
+The prompt tells the stub what to do: "sleep <seconds>", "fail <status> once"
+or "fail <status>" (every time). Anything else is answered right away.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+import openai
+import pytest
+
+from src.ai_scheduler import RequestScheduler
+
+RETRY_AFTER = 0.3
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def __send(self, status: int, body: dict, headers: Optional[dict] = None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = request["messages"][0]["content"]
+        with self.server.lock:
+            attempts = self.server.attempts.setdefault(prompt, [])
+            attempts.append(time.time())
+
+        words = prompt.split()
+        if words[0] == "sleep":
+            time.sleep(float(words[1]))
+        elif words[0] == "fail" and (len(words) == 2 or len(attempts) == 1):
+            status = int(words[1])
+            headers = {"retry-after": str(RETRY_AFTER)} if status == 429 else {}
+            error = {"message": prompt, "type": "error", "code": None, "param": None}
+            return self.__send(status, {"error": error}, headers)
+
+        self.__send(
+            200,
+            {
+                "id": "stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": request["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "re: " + prompt},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 3,
+                    "completion_tokens": 2,
+                    "total_tokens": 5,
+                },
+            },
+        )
+
+
+class WordTokenizer:
+    """Stands in for tiktoken: one token per word."""
+
+    def encode(self, text: str) -> list[str]:
+        return text.split()
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.lock = threading.Lock()
+    server.attempts = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def scheduler(server) -> RequestScheduler:
+    return RequestScheduler(
+        WordTokenizer(),
+        api_key="x",
+        base_url=f"http://127.0.0.1:{server.server_address[1]}/v1",
+        backoff=0.01,
+        max_backoff=1.0,
+    )
+
+
+def test_responses_in_prompt_order(stub):
+    prompts = ["sleep 0.4", "sleep 0.2", "sleep 0", "sleep 0.3", "hello"]
+    finished = []
+
+    responses = scheduler(stub).run(
+        prompts, lambda num, response, started: finished.append(num)
+    )
+
+    assert responses == ["re: " + prompt for prompt in prompts]
+    # they did finish out of order
+    assert finished != sorted(finished)
+    assert sorted(finished) == list(range(len(prompts)))
+
+
+def test_rate_limits_and_server_errors_are_retried(stub):
+    prompts = ["fail 429 once", "fail 500 once", "hello"]
+    started = {}
+
+    def callback(num, response, first_sent):
+        started[num] = first_sent
+
+    responses = scheduler(stub).run(prompts, callback)
+
+    assert responses == ["re: " + prompt for prompt in prompts]
+    assert [len(stub.attempts[prompt]) for prompt in prompts] == [2, 2, 1]
+
+    # retry-after is honored, and the callback gets the time of the first attempt
+    first, second = stub.attempts["fail 429 once"]
+    assert second - first >= RETRY_AFTER
+    assert started[0].timestamp() <= first + 0.1
+    assert started[0].timestamp() < second - RETRY_AFTER / 2
+
+
+def test_bad_requests_fail_right_away(stub):
+    prompts = ["hello", "fail 400", "sleep 0.2"]
+    answered = []
+
+    with pytest.raises(openai.BadRequestError):
+        scheduler(stub).run(
+            prompts, lambda num, response, started: answered.append(num)
+        )
+
+    assert len(stub.attempts["fail 400"]) == 1
+    # the others still finish
+    assert sorted(answered) == [0, 2]
+
+
+def test_gives_up_after_the_retries(stub):
+    server_scheduler = scheduler(stub)
+    server_scheduler.retries = 2
+
+    with pytest.raises(openai.InternalServerError):
+        server_scheduler.run(["fail 500"])
+    assert len(stub.attempts["fail 500"]) == 3
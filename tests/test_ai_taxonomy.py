@@ -0,0 +1,127 @@
+"""
+test_ai_taxonomy.py
+
+AIClassifier.classify_APIs() with packed prompts, on a scheduler that answers
+without the network.
+"""
+
+import datetime
+import json
+
+import pytest
+
+from src.ai_taxonomy import AIClassifier, load_data
+
+APIS = [
+    "org.example.Logger",
+    "org.example.Socket",
+    "org.example.Parser",
+    "org.example.Window",
+    "org.example.Thread",
+    "org.example.Cipher",
+]
+DOMAINS = {
+    "org.example.Logger": "Logging",
+    "org.example.Socket": "Network",
+    "org.example.Parser": "Parser",
+    "org.example.Window": "User Interface",
+    "org.example.Thread": "Multi-Thread",
+    "org.example.Cipher": "Security",
+}
+
+
+class FakeScheduler:
+    """RequestScheduler answering from DOMAINS.
+
+    Packed prompts with Socket get a JSON object without it, and packed prompts
+    with Window get an answer that is not JSON.
+    """
+
+    model = "gpt-4o-mini"
+
+    def __init__(self):
+        self.runs = []
+
+    def answer(self, prompt: str) -> str:
+        if "APIs (one per line):\n" in prompt:
+            apis = prompt.split("APIs (one per line):\n")[1].split("\nContext: ")[0]
+            apis = apis.split("\n")
+            if "org.example.Window" in apis:
+                return "Sorry, here are the domains: Window is User Interface"
+            answer = {
+                api: {"domain": DOMAINS[api], "description": "what it does"}
+                for api in apis
+                if api != "org.example.Socket"
+            }
+            return "```json\n" + json.dumps(answer, indent=2) + "\n```"
+        api = prompt.split("API details: ")[1].split(". Context: ")[0]
+        return DOMAINS[api] + " - what it does"
+
+    def run(self, prompts, callback=None, prompt_tokens=None):
+        self.runs.append(prompts)
+        responses = [self.answer(prompt) for prompt in prompts]
+        if callback is not None:
+            for num, response in enumerate(responses):
+                callback(num, response, datetime.datetime.now())
+        return responses
+
+
+@pytest.fixture
+def classifier(workdir, word_tokens):
+    return AIClassifier(
+        load_data("./data/domain_labels.json"),
+        load_data("./data/subdomain_labels.json"),
+        scheduler=FakeScheduler(),
+    )
+
+
+def test_only_missing_apis_are_asked_again(classifier):
+    done = {}
+
+    results = classifier.classify_APIs(
+        APIS, lambda num, result: done.setdefault(num, result), pack_size=3
+    )
+
+    assert [result[0] for result in results] == [DOMAINS[api] for api in APIS]
+    assert done == dict(enumerate(results))
+
+    packed, single = classifier.scheduler.runs
+    assert packed == [
+        classifier.packed_api_prompt(APIS[:3]),
+        classifier.packed_api_prompt(APIS[3:]),
+    ]
+    # Socket was left out of the first answer, the second was not JSON
+    assert single == [
+        classifier.api_prompt(api)
+        for api in [
+            "org.example.Socket",
+            "org.example.Window",
+            "org.example.Thread",
+            "org.example.Cipher",
+        ]
+    ]
+
+
+def test_complete_packs_are_not_asked_again(classifier):
+    apis = ["org.example.Logger", "org.example.Parser", "org.example.Cipher"]
+
+    results = classifier.classify_APIs(apis, pack_size=3)
+
+    assert [result[0] for result in results] == [DOMAINS[api] for api in apis]
+    assert len(classifier.scheduler.runs) == 1
+
+
+def test_parse_packed_response(classifier):
+    apis = ["org.example.Logger", "org.example.Socket"]
+
+    assert classifier.parse_packed_response(
+        '{"org.example.Logger": {"domain": " Logging ", "description": "logs"}}', apis
+    ) == ["Logging - logs", None]
+    assert classifier.parse_packed_response(
+        '[{"domain": "Logging"}, {"domain": "Network", "description": "talks"}]', apis
+    ) == ["Logging - No description found", "Network - talks"]
+    assert classifier.parse_packed_response('{"org.example.Logger": ', apis) == [
+        None,
+        None,
+    ]
+    assert classifier.parse_packed_response('["Logging"]', apis) == [None, None]
@@ -0,0 +1,54 @@
+"""
+test_array_ast.py
+
+ArrayAST saved and loaded back against the tree-sitter tree it was built from.
+"""
+
+import os
+
+import pytest
+
+from src.array_ast import ArrayAST
+from src.ast_visitor import JavaASTVisitor
+from src.generate_ast import generate_ast, materialize_text, visit_ast
+from src.java_ast import JavaProgram
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+FILES = ["Sample.java", "Receivers.java", "Big.java"]
+
+
+@pytest.fixture(params=FILES)
+def saved(request, tmp_path):
+    """(path of the Java file, ArrayAST loaded back from its .npz)"""
+    path = os.path.join(CORPUS, request.param)
+    npz = str(tmp_path / (request.param + ".npz"))
+    ArrayAST.from_file(path).save(npz)
+    return path, ArrayAST.load(npz)
+
+
+def test_to_dict_matches_tree_to_dict(saved):
+    path, ast = saved
+    assert materialize_text(ast.to_dict()) == materialize_text(generate_ast(path))
+
+
+def test_visitor_matches_tree(saved):
+    path, ast = saved
+    loaded = JavaASTVisitor(ast, ast.source).visit()
+    parsed = visit_ast(path)
+
+    assert loaded.tokens == parsed.tokens
+    assert loaded.imports == parsed.imports
+    assert loaded.symbols == parsed.symbols
+    assert loaded.methods == parsed.methods
+    assert JavaProgram(loaded).getFunctions() == JavaProgram(parsed).getFunctions()
+
+
+def test_source_is_kept(saved, tmp_path):
+    path, ast = saved
+    with open(path, "rb") as file:
+        source = file.read()
+    assert ast.source == source
+
+    npz = str(tmp_path / "again.npz")
+    ast.save(npz)
+    assert ArrayAST.load_source(npz) == source
@@ -0,0 +1,162 @@
+"""
+test_git_source.py
+
+LocalGitSource and process_files(git_repo=...) against a two-commit fixture
+repository, without network.
+"""
+
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from src.database_manager import Repository
+from src.git_source import GitProcessError, LocalGitSource
+from src.processing import process_files
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+
+
+def git(repo_path: str, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", repo_path, *args], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def fixture_repo(tmp_path):
+    """Repository with two commits. Returns (path, first commit, second commit)."""
+    path = str(tmp_path / "repo")
+    os.makedirs(os.path.join(path, "src"))
+    git(path, "init", "-q")
+    git(path, "config", "user.email", "test@example.com")
+    git(path, "config", "user.name", "test")
+
+    shutil.copy(os.path.join(CORPUS, "Sample.java"), os.path.join(path, "src"))
+    git(path, "add", ".")
+    git(path, "commit", "-q", "-m", "first")
+    first = git(path, "rev-parse", "HEAD")
+
+    shutil.copy(
+        os.path.join(CORPUS, "Receivers.java"),
+        os.path.join(path, "src", "My File.java"),
+    )
+    with open(os.path.join(path, "src", "Sample.java"), "ab") as file:
+        file.write(b"// changed\n")
+    git(path, "add", ".")
+    git(path, "commit", "-q", "-m", "second")
+    second = git(path, "rev-parse", "HEAD")
+
+    return path, first, second
+
+
+def corpus_file(name: str) -> bytes:
+    with open(os.path.join(CORPUS, name), "rb") as file:
+        return file.read()
+
+
+def test_reads_files_as_of_each_commit(fixture_repo):
+    path, first, second = fixture_repo
+    with LocalGitSource(path) as source:
+        assert source.read(first, "src/Sample.java") == corpus_file("Sample.java")
+        assert source.read(second, "src/Sample.java") == (
+            corpus_file("Sample.java") + b"// changed\n"
+        )
+        assert source.get(None, None, second, "src/My File.java") == corpus_file(
+            "Receivers.java"
+        )
+
+
+def test_missing_files_are_value_errors(fixture_repo):
+    path, first, second = fixture_repo
+    with LocalGitSource(path) as source:
+        with pytest.raises(ValueError):
+            source.read(first, "src/My File.java")
+        with pytest.raises(ValueError):
+            source.read("0" * 40, "src/Sample.java")
+        with pytest.raises(ValueError):
+            source.read(first, "src")  # a tree
+        # still usable afterwards
+        assert source.read(first, "src/Sample.java") == corpus_file("Sample.java")
+
+
+def test_works_on_a_bare_mirror(fixture_repo, tmp_path):
+    path, first, second = fixture_repo
+    mirror = str(tmp_path / "mirror.git")
+    subprocess.run(
+        ["git", "clone", "-q", "--mirror", path, mirror],
+        check=True,
+        capture_output=True,
+    )
+    with LocalGitSource(mirror) as source:
+        assert source.read(first, "src/Sample.java") == corpus_file("Sample.java")
+
+
+def test_rejects_plain_directories(tmp_path):
+    with pytest.raises(ValueError, match="Not a git repository"):
+        LocalGitSource(str(tmp_path))
+    with pytest.raises(ValueError):
+        LocalGitSource(str(tmp_path / "nowhere"))
+
+
+def test_dead_process_is_not_a_missing_file(fixture_repo):
+    path, first, second = fixture_repo
+    source = LocalGitSource(path)
+    source.process.kill()
+    source.process.wait()
+    with pytest.raises(GitProcessError):
+        source.read(first, "src/Sample.java")
+    source.close()
+
+
+class FakeDB:
+    """The parts of DatabaseManager process_files uses before classifying."""
+
+    def __init__(self, files):
+        self.files = files
+        self.processed = []
+
+    def get_unprocessed_files(self, pr, repo):
+        return self.files
+
+    def mark_files_as_processed(self, files, status):
+        self.processed.extend((file, status) for file in files)
+
+    def queue_file_processed(self, file, commit_hash, repo=None, status=None):
+        self.processed.append(((file, commit_hash, repo), status))
+
+    def manageDownload(self, file, commit_hash, repo):
+        return None
+
+    def save(self):
+        pass
+
+    def flush(self):
+        pass
+
+    def preload_classifications(self):
+        pass
+
+
+def test_process_files_stops_when_git_stops(fixture_repo, monkeypatch):
+    path, first, second = fixture_repo
+    repo = Repository("owner", "repo", 1)
+    db = FakeDB([("src/Sample.java", first, repo), ("src/Sample.java", second, repo)])
+
+    def stopped(self, commit, file_path):
+        raise GitProcessError("git cat-file exited with code -9")
+
+    monkeypatch.setattr(LocalGitSource, "read", stopped)
+    with pytest.raises(GitProcessError):
+        process_files(None, db, repo=repo, git_repo=path, classify=False)
+    # files are left unprocessed for the next run
+    assert db.processed == []
+
+
+def test_process_files_needs_the_repository(fixture_repo):
+    path, first, second = fixture_repo
+    with pytest.raises(ValueError):
+        process_files(None, FakeDB([]), git_repo=path)
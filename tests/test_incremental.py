@@ -0,0 +1,121 @@
+"""
+test_incremental.py
+
+IncrementalAnalyzer.visit() on edited versions of a file against a full
+re-parse of each version.
+"""
+
+import os
+
+import pytest
+
+from src.generate_ast import visit_source
+from src.incremental import IncrementalAnalyzer, source_edits
+from src.java_ast import JavaProgram
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+
+
+def read(name: str) -> bytes:
+    with open(os.path.join(CORPUS, name), "rb") as file:
+        return file.read()
+
+
+def assert_same(incremental, full):
+    assert incremental.tokens == full.tokens
+    assert incremental.imports == full.imports
+    assert incremental.symbols == full.symbols
+    assert incremental.methods == full.methods
+    assert JavaProgram(incremental).getFunctions() == JavaProgram(full).getFunctions()
+
+
+def insert_after(source: bytes, marker: bytes, text: bytes, count: int = 1) -> bytes:
+    """Insert text after the first `count` lines containing marker"""
+    lines = source.splitlines(keepends=True)
+    out = []
+    for line in lines:
+        out.append(line)
+        if count and marker in line:
+            out.append(text)
+            count -= 1
+    return b"".join(out)
+
+
+EDITS = {
+    "new invocation": lambda source: insert_after(
+        source, b"conn.open();", b"        conn.rollback();\n", 3
+    ),
+    "new field": lambda source: insert_after(
+        source, b"private Connection conn;", b"    private JFrame window;\n"
+    ),
+    "new method": lambda source: insert_after(
+        source,
+        b"private Connection conn;",
+        b"    void extra(Connection other) { other.close(); }\n",
+    ),
+    "renamed variable": lambda source: source.replace(
+        b"Connection conn = c5;\n        conn.open();",
+        b"Connection link = c5;\n        link.open();",
+    ),
+    "removed method": lambda source: source.replace(
+        source[
+            source.index(b"    public void method7(") : source.index(
+                b"    public void method8("
+            )
+        ],
+        b"",
+    ),
+}
+
+
+@pytest.mark.parametrize("edit", EDITS)
+def test_edit_matches_full_parse(edit):
+    base = read("Big.java")
+    new = EDITS[edit](base)
+    assert new != base
+
+    analyzer = IncrementalAnalyzer()
+    analyzer.visit("Big.java", base, "java")
+    incremental = analyzer.visit("Big.java", new, "java")
+
+    assert_same(incremental, visit_source(new, "java"))
+    # most members did not change
+    assert incremental.reused > incremental.revisited
+
+
+def test_versions_in_a_row():
+    source = read("Big.java")
+    analyzer = IncrementalAnalyzer()
+    analyzer.visit("Big.java", source, "java")
+    for edit in EDITS.values():
+        source = edit(source)
+        assert_same(
+            analyzer.visit("Big.java", source, "java"), visit_source(source, "java")
+        )
+
+
+def test_broken_version_is_parsed_in_full():
+    base = read("Sample.java")
+    broken = base.replace(b"public void run() {", b"public void run( {")
+
+    analyzer = IncrementalAnalyzer()
+    analyzer.visit("Sample.java", base, "java")
+    assert_same(
+        analyzer.visit("Sample.java", broken, "java"), visit_source(broken, "java")
+    )
+    # and back from the broken tree
+    assert_same(analyzer.visit("Sample.java", base, "java"), visit_source(base, "java"))
+
+
+def test_source_edits_cover_the_change():
+    base = read("Sample.java")
+    new = base.replace(b'list.add("x");', b'list.add("xyz");\n        list.clear();')
+    edits = source_edits(base, new)
+
+    assert edits
+    for edit in edits:
+        assert edit["start_byte"] <= edit["old_end_byte"]
+        assert edit["start_byte"] <= edit["new_end_byte"]
+    # bytes before the first edit and after the last one are the same
+    assert base[: edits[0]["start_byte"]] == new[: edits[0]["start_byte"]]
+    assert base[edits[-1]["old_end_byte"] :] == new[edits[-1]["new_end_byte"] :]
@@ -0,0 +1,137 @@
+"""
+test_java_ast.py
+
+JavaProgram.getCompleteSymbolTable() against the nested-loop resolution it
+replaced, on the Java files of tests/corpus.
+"""
+
+import os
+
+import pytest
+
+from src.generate_ast import generate_ast, visit_ast
+from src.java_ast import JavaProgram
+
+CORPUS = os.path.join(os.path.dirname(__file__), "corpus")
+
+# every receiver is declared once, so scope resolution changes nothing
+UNSHADOWED = ["Receivers.java"]
+# names declared again in nested scopes (fields, locals, inner classes)
+SHADOWED = ["Sample.java", "Big.java"]
+
+AST_BUILDERS = {"dict": generate_ast, "visitor": visit_ast}
+
+
+def reference_complete_table(program: JavaProgram) -> dict:
+    """getCompleteSymbolTable() before the class and receiver indexes.
+
+    Loops classes x symbols x methods and attaches every invocation on a
+    variable's name to the variable.
+    """
+    program.getClassOptions()
+    program.populateSymbolTable()
+
+    out = {}
+    for className in program.classes:
+        out[className] = {"full": program.classes[className], "varlist": []}
+
+        for variable in program.symbols:
+            if variable["class"] != className:
+                continue
+
+            methodOut = []
+            for method in program.methods:
+                if method["name"] != variable["name"]:
+                    continue
+                methodOut.append(method)
+
+            out[className]["varlist"].append(
+                {"variable": variable, "methods": methodOut}
+            )
+    return out
+
+
+def programs(filename: str, ast: str) -> tuple[JavaProgram, JavaProgram]:
+    """Current program, and one that uses the reference table."""
+    path = os.path.join(CORPUS, filename)
+    program = JavaProgram(AST_BUILDERS[ast](path))
+    reference = JavaProgram(AST_BUILDERS[ast](path))
+    reference.completeTable = reference_complete_table(reference)
+    return program, reference
+
+
+def attached(table: dict) -> set[tuple]:
+    """(class, variable, invocation) triples of a complete table."""
+    out = set()
+    for className, data in table.items():
+        for varl in data["varlist"]:
+            variable = varl["variable"]
+            for method in varl["methods"]:
+                out.add(
+                    (
+                        className,
+                        variable["name"],
+                        variable["line"],
+                        method["method"],
+                        method["line"],
+                        method["byte"],
+                    )
+                )
+    return out
+
+
+@pytest.mark.parametrize("ast", AST_BUILDERS)
+@pytest.mark.parametrize("filename", UNSHADOWED)
+def test_same_as_reference(filename, ast):
+    program, reference = programs(filename, ast)
+
+    assert program.getCompleteSymbolTable() == reference.completeTable
+    assert program.getFunctions() == reference.getFunctions()
+    assert program.getFunctions()
+
+
+@pytest.mark.parametrize("ast", AST_BUILDERS)
+@pytest.mark.parametrize("filename", SHADOWED)
+def test_scopes_only_drop_invocations(filename, ast):
+    program, reference = programs(filename, ast)
+    table = program.getCompleteSymbolTable()
+
+    # same classes and variables, in the same order
+    assert table.keys() == reference.completeTable.keys()
+    for className, data in table.items():
+        expected = reference.completeTable[className]
+        assert data["full"] == expected["full"]
+        assert [varl["variable"] for varl in data["varlist"]] == [
+            varl["variable"] for varl in expected["varlist"]
+        ]
+
+    # an invocation goes to the declaration in scope, not to every one of that name
+    assert attached(table) < attached(reference.completeTable)
+
+
+@pytest.mark.parametrize("filename", UNSHADOWED + SHADOWED)
+def test_dict_and_visitor_agree(filename):
+    dict_program, _ = programs(filename, "dict")
+    visitor_program, _ = programs(filename, "visitor")
+
+    assert (
+        dict_program.getCompleteSymbolTable()
+        == visitor_program.getCompleteSymbolTable()
+    )
+    assert dict_program.getFunctions() == visitor_program.getFunctions()
+
+
+@pytest.mark.parametrize("ast", AST_BUILDERS)
+def test_parameter_shadows_field(ast):
+    # Sample.java: field `JFrame window`, and `Statement window` in query()
+    program, reference = programs("Sample.java", ast)
+    functions = program.getFunctions()
+
+    # 0-based lines of window.pack() in run() and window.execute() in query()
+    assert functions["javax.swing.JFrame::pack"] == [42]
+    assert functions["org.example.db.Statement::execute"] == [46]
+    # the nested loop gave each invocation to both declarations
+    assert "javax.swing.JFrame::execute" in reference.getFunctions()
+    assert "org.example.db.Statement::pack" in reference.getFunctions()
+    assert "javax.swing.JFrame::execute" not in functions
+    assert "org.example.db.Statement::pack" not in functions
@@ -0,0 +1,203 @@
+"""
+test_label_index.py
+
+Name tiers of the label domain_labels (LabelIndex.find_key() / find_close()), where
+None means the answer is left to the similarity of label_vectors, and the
+LabelFixCache of fixed answers.
+"""
+
+from collections import Counter
+import os
+
+import numpy as np
+import pytest
+
+from src import ai_taxonomy
+from src.ai_taxonomy import load_data
+from src.label_index import LabelFixCache, LabelIndex, LabelVectors
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+
+
+def make_index(labels: list[str]) -> LabelIndex:
+    return LabelIndex(labels, [f"{label}: " for label in labels], vectors=None)
+
+
+def fix(index: LabelIndex, answer: str) -> str | None:
+    found = index.find_key(answer)
+    if found is None:
+        found = index.find_close(answer)
+    return found
+
+
+@pytest.fixture(scope="module")
+def domains() -> LabelIndex:
+    items = load_data(os.path.join(DATA, "domain_labels.json"))["Items"]
+    return make_index([label for item in items for label in item])
+
+
+@pytest.mark.parametrize(
+    "answer, label",
+    [
+        ("Databases", "Databases"),
+        ("databases (db)", "Databases"),
+        ("Domain-Cloud", "Cloud"),
+        ("Input/Output", "Input-Output"),
+        ("Logging: writes log records", "Logging"),
+        ("Network - talks to other hosts", "Network"),
+        ("Multithread", "Multi-Thread"),
+        ("Networks", "Network"),
+        ("Natural Language", "Natural Language Processing"),
+        ("Application Performance Monitoring", "Application Performance Manager"),
+        ("Application Performance", "Application Performance Manager"),
+        # one word in common says too little
+        ("Language Processing", None),
+        ("Test Framework", None),
+        ("Security Management", None),
+        ("Logic Programming", None),
+        ("Data", None),
+        ("Application Tools", None),
+        # more than one word dropped
+        ("Natural Language Processing Library", "Natural Language Processing"),
+        ("Natural Language Toolkit Library", None),
+        ("Performance Monitoring", None),
+    ],
+)
+def test_domain_answers(domains, answer, label):
+    assert fix(domains, answer) == label
+
+
+@pytest.mark.parametrize(
+    "answer",
+    [
+        # the start of two labels
+        "Data Processing Tools",
+        "Data Processing",
+        # as close to one label as to the other
+        "Lok",
+    ],
+)
+def test_ambiguous_answers(answer):
+    index = make_index(
+        [
+            "Data Processing Pipeline",
+            "Data Processing Engine",
+            "Memory Management",
+            "Lock",
+            "Look",
+        ]
+    )
+    assert fix(index, answer) is None
+
+
+def test_label_that_starts_another():
+    index = make_index(["Data Processing", "Data Processing Pipeline"])
+
+    assert fix(index, "Data Processing") == "Data Processing"
+    assert fix(index, "Data Processing Pipelines") == "Data Processing Pipeline"
+    assert fix(index, "Data Processing Tools") is None
+
+
+def test_fix_cache_round_trip(tmp_path):
+    path = str(tmp_path / "fixes.db")
+    cache = LabelFixCache(path)
+    assert cache.get("Databse", "fp") is None
+    cache.put("Databse", "fp", "Databases")
+    assert cache.get("Databse", "fp") == "Databases"
+    assert cache.get("Databse", "other label set") is None
+    cache.flush()
+
+    again = LabelFixCache(path)
+    assert again.get("Databse", "fp") == "Databases"
+    assert again.get("Missing", "fp") is None
+    assert again.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_fix_cache_evicts_least_recently_used(tmp_path):
+    path = str(tmp_path / "fixes.db")
+    cache = LabelFixCache(path, max_entries=2)
+    cache.put("a", "fp", "A")
+    cache.put("b", "fp", "B")
+    assert cache.get("a", "fp") == "A"
+    cache.put("c", "fp", "C")
+
+    assert cache.get("b", "fp") is None
+    assert cache.get("a", "fp") == "A"
+    assert cache.get("c", "fp") == "C"
+
+    # gone from the database too, and the uses are kept: "c" was used last
+    cache.flush()
+    assert LabelFixCache(path).get("b", "fp") is None
+    assert LabelFixCache(path, max_entries=1).get("c", "fp") == "C"
+    assert LabelFixCache(path, max_entries=1).get("a", "fp") is None
+
+
+def test_fix_cache_fallback(tmp_path):
+    cache = LabelFixCache(str(tmp_path / "fixes.db"))
+    cache.put("storage: keeps tables", "fp", "Databases")
+
+    assert cache.get("storage", "fp", "storage: keeps tables") == "Databases"
+    assert cache.get("storage", "fp", "storage: other") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def letters(texts: list[str]) -> np.ndarray:
+    """Letter counts, as text vectors"""
+    vectors = np.zeros((len(texts), 26), dtype=np.float32)
+    for num, text in enumerate(texts):
+        for char in text.lower():
+            if "a" <= char <= "z":
+                vectors[num, ord(char) - ord("a")] += 1
+    return vectors
+
+
+@pytest.fixture
+def domain_labels(tmp_path, monkeypatch):
+    """clean_domains() with letter count vectors and a label fix cache in tmp_path."""
+    monkeypatch.setattr(
+        ai_taxonomy,
+        "label_vectors",
+        LabelVectors(str(tmp_path / "vectors.npz"), letters, "letters"),
+    )
+    monkeypatch.setattr(
+        ai_taxonomy, "label_fixes", LabelFixCache(str(tmp_path / "fixes.db"))
+    )
+    monkeypatch.setattr(ai_taxonomy, "label_matches", Counter())
+    return load_data(os.path.join(DATA, "domain_labels.json"))
+
+
+def no_similarity(text):
+    raise AssertionError("similarity asked for " + text)
+
+
+def test_name_tier_fixes_are_keyed_by_the_answer(domain_labels, monkeypatch):
+    assert ai_taxonomy.clean_domains("databases (db)", "tables", domain_labels) == (
+        "Databases"
+    )
+    assert ai_taxonomy.label_matches == {"normalized": 1}
+
+    # whatever the description, the answer alone finds the fix
+    monkeypatch.setattr(ai_taxonomy.label_vectors, "query", no_similarity)
+    monkeypatch.setattr(LabelIndex, "find_key", no_similarity)
+    assert ai_taxonomy.clean_domains("databases (db)", "other", domain_labels) == (
+        "Databases"
+    )
+    assert ai_taxonomy.label_matches == {"normalized": 1}
+    assert ai_taxonomy.label_fixes.stats()["hits"] == 1
+
+
+def test_semantic_fixes_are_keyed_by_the_description(domain_labels, monkeypatch):
+    label = ai_taxonomy.clean_domains("Storage Engine", "keeps tables", domain_labels)
+    assert label is not None
+    assert ai_taxonomy.label_matches == {"semantic": 1}
+
+    monkeypatch.setattr(ai_taxonomy.label_vectors, "query", no_similarity)
+    assert ai_taxonomy.clean_domains(
+        "Storage Engine", "keeps tables", domain_labels
+    ) == (label)
+    assert ai_taxonomy.label_matches == {"semantic": 1}
+
+    # another description is another question
+    with pytest.raises(AssertionError, match="similarity asked"):
+        ai_taxonomy.clean_domains("Storage Engine", "draws windows", domain_labels)